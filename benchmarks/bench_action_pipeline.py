@@ -0,0 +1,80 @@
+"""Benchmark: action data creation, materialized passes vs the streaming pipeline.
+
+    python benchmarks/bench_action_pipeline.py [scenes]
+"""
+
+# Official Libraries
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from argparse import Namespace
+
+# My Modules
+from common import generate_project, timeit
+
+
+# Define Constants
+SCENES = 2000
+
+REPEAT = 3
+
+
+# Main
+def main() -> None:
+    scenes = int(sys.argv[1]) if len(sys.argv) > 1 else SCENES
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as root:
+        # NOTE: the project path is fixed when stobu is imported
+        os.chdir(root)
+        generate_project(root, scenes)
+
+        import stobu.core.actiondatacreator as creator
+        from stobu.core.actiondatacreator import actions_data_from
+        from stobu.core.instructioner import iter_records_applied_instructions
+        from stobu.core.nametagcreator import get_nametags
+        from stobu.core.storydatacreator import story_data_from
+        from stobu.tools.buildcache import BuildCache
+        from stobu.types.action import ActionsData
+
+        tags = get_nametags()
+        story_data = story_data_from(Namespace(part=None, jobs=1))
+        cache = BuildCache()
+
+        def _passes():
+            # NOTE: the same stages, each made into a list before the next one
+            actions = list(creator._iter_base_action_records(story_data, cache))
+            updated = list(creator._iter_records_if_same(actions))
+            return ActionsData.trusted(list(iter_records_applied_instructions(updated, tags)))
+
+        def _streamed():
+            return actions_data_from(story_data, tags, cache)
+
+        assert _passes().get_data() == _streamed().get_data()
+
+        results = {}
+        for label, func in (('passes', _passes), ('streamed', _streamed)):
+            results[label] = (timeit(func, REPEAT), _peak_of(func))
+
+        os.chdir(cwd)
+
+    print(f"scenes      : {scenes}")
+    for label, (elapsed, peak) in results.items():
+        print(f"{label:<12}: {elapsed:.3f}s, peak {peak / 1e6:.1f} MB")
+
+
+# Private Functions
+def _peak_of(func) -> int:
+    gc.collect()
+    tracemalloc.start()
+    data = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+    return peak
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark: alias translation of the action records in scenes with many aliases.
+
+    python benchmarks/bench_alias_translation.py [scenes] [aliases]
+"""
+
+# Official Libraries
+import sys
+
+# My Modules
+from common import timeit
+
+from stobu.core.instructioner import INST_ALIAS, iter_records_applied_instructions
+from stobu.tools.translater import translate_tags_str
+from stobu.types.action import ActionRecord, ActDataType, ActType, NORMAL_ACTIONS
+
+
+# Define Constants
+SCENES = 200
+
+ALIASES = 30
+
+ACTIONS = 100
+
+REPEAT = 3
+
+
+# Main
+def main() -> None:
+    scenes = int(sys.argv[1]) if len(sys.argv) > 1 else SCENES
+    aliases = int(sys.argv[2]) if len(sys.argv) > 2 else ALIASES
+    records = _records_of(scenes, aliases)
+
+    legacy = timeit(lambda: list(_legacy_applied(records)), REPEAT)
+    compiled = timeit(lambda: list(iter_records_applied_instructions(records, {})), REPEAT)
+
+    assert list(_legacy_applied(records)) == list(iter_records_applied_instructions(records, {}))
+
+    print(f"scenes      : {scenes} ({aliases} aliases, {ACTIONS} actions each)")
+    print(f"legacy      : {legacy:.3f}s")
+    print(f"compiled    : {compiled:.3f}s")
+    print(f"speedup     : {legacy / compiled:.2f}x")
+
+
+# Private Functions
+def _legacy_applied(records: list):
+    """The alias part of the instructions as it was, translating with the scene dict."""
+    alias = {}
+
+    for record in records:
+        if ActDataType.INSTRUCTION is record.subtype:
+            if record.subject in INST_ALIAS:
+                short, origin = record.outline.split('=')
+                alias[short] = origin
+        elif ActDataType.SCENE_START is record.subtype:
+            alias = {}
+            yield record
+        elif record.type in NORMAL_ACTIONS:
+            yield ActionRecord(
+                    record.type,
+                    record.subtype,
+                    alias.get(record.subject, record.subject),
+                    translate_tags_str(record.outline, alias),
+                    translate_tags_str(record.desc, alias),
+                    record.flags,
+                    translate_tags_str(record.note, alias))
+        else:
+            yield record
+
+
+def _records_of(scenes: int, aliases: int) -> list:
+    tmp = []
+
+    for sc in range(scenes):
+        tmp.append(ActionRecord(ActType.DATA, ActDataType.SCENE_START, ''))
+        for num in range(aliases):
+            tmp.append(ActionRecord(ActType.DATA, ActDataType.INSTRUCTION, 'A', f"a{num}=人物{num}"))
+        for num in range(ACTIONS):
+            short = f"a{(sc + num) % aliases}" if aliases else "taro"
+            tmp.append(ActionRecord(ActType.TALK, ActDataType.NONE, short, f"${short}の概要",
+                f"${short}は$a0に話しかけた。", note="メモ"))
+        tmp.append(ActionRecord(ActType.DATA, ActDataType.SCENE_END, ''))
+
+    return tmp
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Benchmark: character counts of a formatted novel, string joining vs the marked spans.
+
+    python benchmarks/bench_char_counts.py [scenes]
+"""
+
+# Official Libraries
+import sys
+
+# My Modules
+from common import timeit
+
+from stobu.counts.common import COUNT_ELMS, TextCounter, counts_data_from, count_line_by_columns
+from stobu.counts.common import _record_count_from
+from stobu.formats.common import get_format_record_as_mark, outputs_data_from_formatted
+from stobu.types.build import BuildType
+from stobu.types.element import ElmType
+
+
+# Define Constants
+SCENES = (250, 500, 1000, 2000)
+
+LINES = 40
+
+REPEAT = 1
+
+
+# Main
+def main() -> None:
+    sizes = [int(sys.argv[1])] if len(sys.argv) > 1 else SCENES
+
+    print(f"{'scenes':>8}  {'legacy':>9}  {'prefixes':>9}  {'marks':>9}")
+    for scenes in sizes:
+        outputs = outputs_data_from_formatted(_outputs_of(scenes), {})
+        legacy = timeit(lambda: _legacy_counts(outputs.get_data()), REPEAT)
+        prefixes = timeit(lambda: _prefix_counts(outputs.get_data()), REPEAT)
+        marks = timeit(lambda: counts_data_from(BuildType.NOVEL, outputs, 20, 20), REPEAT)
+        assert _prefix_counts(outputs.get_data()) == counts_data_from(
+                BuildType.NOVEL, outputs, 20, 20).get_data()
+        print(f"{scenes:>8}  {legacy:8.3f}s  {prefixes:8.3f}s  {marks:8.3f}s")
+
+
+# Private Functions
+def _legacy_counts(records: list) -> list:
+    """The joining of each element text as it was, and its counting char by char."""
+    heads = ('# ', '## ', '### ', '** ')
+    descs = [[""] for _ in heads]
+    indexes = [0] * len(heads)
+
+    for record in records:
+        for level, head in enumerate(heads):
+            if record.startswith(head):
+                indexes[level] += 1
+                descs[level].append('')
+                break
+        else:
+            for level in range(len(heads)):
+                descs[level][indexes[level]] += record
+
+    return [(len(text), sum(1 for c in text if c.isspace()), count_line_by_columns(text, 20))
+            for level in descs for text in level[1:]]
+
+
+def _prefix_counts(records: list) -> list:
+    """The text counter over the heads found by the prefixes of each line, as it was."""
+    heads = list(zip(COUNT_ELMS, ('# ', '## ', '### ', '** ')))
+    starts = {elm: [] for elm in COUNT_ELMS}
+    texts = []
+
+    for record in records:
+        for elm, head in heads:
+            if record.startswith(head):
+                title = record.replace(head, '')
+                if ElmType.SCENE is elm:
+                    title = title.replace(' **', '')
+                starts[elm].append((title.replace('\n', ''), len(texts)))
+                break
+        else:
+            if '<!--' not in record:
+                texts.append(record)
+
+    counter = TextCounter(texts, 20)
+    tmp = []
+    for elm in COUNT_ELMS:
+        ends = [start for _, start in starts[elm][1:]] + [len(texts)]
+        for (title, start), end in zip(starts[elm], ends):
+            tmp.append(_record_count_from(elm, title, counter, start, end, 20))
+    return tmp
+
+
+def _outputs_of(scenes: int) -> list:
+    tmp = [get_format_record_as_mark(ElmType.BOOK, "本"), "# 本\n"]
+
+    for idx in range(scenes):
+        if idx % 100 == 0:
+            tmp.append(get_format_record_as_mark(ElmType.CHAPTER, f"章{idx // 100}"))
+            tmp.append(f"## 章{idx // 100}\n")
+        if idx % 10 == 0:
+            tmp.append(get_format_record_as_mark(ElmType.EPISODE, f"話{idx // 10}"))
+            tmp.append(f"### 話{idx // 10}\n")
+        tmp.append(get_format_record_as_mark(ElmType.SCENE, f"場面{idx}"))
+        tmp.append(f"** 場面{idx} **\n")
+        tmp.extend(f"　太郎は花子に{num}回目の話をした。 そして歩き出した。\n" for num in range(LINES))
+
+    return tmp
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: full build time with and without the record type validation.
+
+    python benchmarks/bench_data_validation.py [scenes]
+"""
+
+# Official Libraries
+import cProfile
+import os
+import pstats
+import sys
+import tempfile
+from argparse import Namespace
+
+# My Modules
+from common import generate_project, timeit
+
+
+# Define Constants
+SCENES = 500
+
+REPEAT = 5
+
+
+# Main
+def main() -> None:
+    scenes = int(sys.argv[1]) if len(sys.argv) > 1 else SCENES
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as root:
+        # NOTE: the project path is fixed when stobu is imported
+        os.chdir(root)
+        generate_project(root, scenes)
+
+        from stobu.commands.builder import build_project_with_cache
+        from stobu.tools.buildcache import BuildCache
+        from stobu.tools.projectdatacache import ProjectDataCache
+        from stobu.types.basedata import set_data_validation
+
+        args = Namespace(cmd='build', part=None, jobs=1, comment=False, rebuild=False,
+                outline=True, plot=True, info=True, status=True, struct=False,
+                script=True, novel=True, rubi=False)
+        cache = BuildCache()
+
+        def _build():
+            build_project_with_cache(args, cache, ProjectDataCache(cache))
+
+        _build()
+
+        # NOTE: alternate the modes so that the heap growth does not favor one
+        best = {True: None, False: None}
+        for _ in range(REPEAT):
+            for is_enabled in (True, False):
+                set_data_validation(is_enabled)
+                elapsed = timeit(_build, 1)
+                if best[is_enabled] is None or elapsed < best[is_enabled]:
+                    best[is_enabled] = elapsed
+
+        results = {}
+        for is_enabled in (True, False):
+            set_data_validation(is_enabled)
+            results[is_enabled] = (best[is_enabled], _validation_time_of(_build))
+
+        os.chdir(cwd)
+
+    print(f"scenes      : {scenes}")
+    for is_enabled, label in ((True, 'validated'), (False, 'trusted')):
+        total, checks = results[is_enabled]
+        print(f"{label:<12}: {total:.3f}s (in data init: {checks:.3f}s)")
+
+
+# Private Functions
+def _validation_time_of(func) -> float:
+    profile = cProfile.Profile()
+    profile.runcall(func)
+    stats = pstats.Stats(profile).stats
+
+    return sum(cumtime for (fname, _, name), (_, _, _, cumtime, _) in stats.items()
+            if fname.endswith('basedata.py') and name in ('__init__', 'trusted'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark: scene info sections, seven passes vs one pass of the collectors.
+
+    python benchmarks/bench_info_collectors.py [scenes]
+"""
+
+# Official Libraries
+import sys
+
+# My Modules
+from common import timeit
+
+from stobu.infos.fashioninfos import fashion_infos_from
+from stobu.infos.flaginfos import flag_infos_from
+from stobu.infos.informationer import _get_info_data_set
+from stobu.infos.iteminfos import item_infos_from
+from stobu.infos.knowledgeinfos import knowledge_infos_from
+from stobu.infos.personinfos import person_infos_from
+from stobu.infos.stageinfos import stage_infos_from
+from stobu.infos.transitions import scene_transition_data_from
+from stobu.types.action import ActType
+from stobu.types.info import InfosData, InfoRecord, InfoType, SceneInfo
+
+
+# Define Constants
+SCENES = 2000
+
+ACTIONS = 50
+
+EPISODE_SCENES = 10
+
+REPEAT = 3
+
+ACTS = (ActType.BE, ActType.COME, ActType.GO, ActType.TALK, ActType.DO, ActType.HAVE,
+        ActType.DISCARD, ActType.PUT, ActType.RID, ActType.DRAW, ActType.KNOW, ActType.KNOWN,
+        ActType.WEAR, ActType.FEEL, ActType.EXPLAIN, ActType.REMEMBER)
+
+
+# Main
+def main() -> None:
+    scenes = int(sys.argv[1]) if len(sys.argv) > 1 else SCENES
+    infos = InfosData(_records_of(scenes))
+
+    passes = timeit(lambda: _legacy_data_set(infos), REPEAT)
+    collected = timeit(lambda: _get_info_data_set(infos), REPEAT)
+
+    assert _legacy_data_set(infos).get_data() == _get_info_data_set(infos).get_data()
+
+    print(f"scenes      : {scenes} ({ACTIONS} actions each, {len(infos.get_data())} records)")
+    print(f"seven passes: {passes:.3f}s")
+    print(f"one pass    : {collected:.3f}s")
+    print(f"speedup     : {passes / collected:.2f}x")
+
+
+# Private Functions
+def _legacy_data_set(infos: InfosData) -> InfosData:
+    """The info sections as they were, each walking all the records."""
+    return (scene_transition_data_from(infos) + flag_infos_from(infos)
+            + person_infos_from(infos) + fashion_infos_from(infos)
+            + knowledge_infos_from(infos) + stage_infos_from(infos) + item_infos_from(infos))
+
+
+def _records_of(scenes: int) -> list:
+    tmp = []
+
+    for sc in range(scenes):
+        if sc % EPISODE_SCENES == 0:
+            tmp.append(InfoRecord(InfoType.TITLE_EPISODE, ActType.DATA, '', f"話{sc}", ''))
+        tmp.append(InfoRecord(InfoType.TITLE_SCENE, ActType.DATA, '', f"場面{sc}", ''))
+        tmp.append(InfoRecord(InfoType.SCENE_HEAD, ActType.DATA, '', '',
+            SceneInfo(f"人物{sc % 7}", f"舞台{sc % 5}", '2020', f"{sc % 12 + 1}/1", '朝', '')))
+        for num in range(ACTIONS):
+            act = ACTS[(sc + num) % len(ACTS)]
+            tmp.append(InfoRecord(InfoType.ACTION, act, f"人物{num % 7}", f"概要{num}", "メモ"))
+        tmp.append(InfoRecord(InfoType.FLAG_FORESHADOW, ActType.DATA, f"flag{sc}", '伏線', ''))
+        tmp.append(InfoRecord(InfoType.SCENE_END, ActType.DATA, '', '', ''))
+
+    return tmp
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark: contents header joined to each build target, copying vs linking segments.
+
+    python benchmarks/bench_output_segments.py [contents lines] [target lines]
+"""
+
+# Official Libraries
+import os
+import sys
+import tempfile
+
+# My Modules
+from common import timeit
+
+from stobu.types.output import OutputsData
+from stobu.utils.fileio import write_lines_to_file
+
+
+# Define Constants
+CONTENTS = 20000
+
+LINES = 200000
+
+TARGETS = 7
+
+REPEAT = 3
+
+
+# Main
+def main() -> None:
+    contents_lines = int(sys.argv[1]) if len(sys.argv) > 1 else CONTENTS
+    target_lines = int(sys.argv[2]) if len(sys.argv) > 2 else LINES
+    contents = [f"- 場面{num}\n" for num in range(contents_lines)]
+    targets = [[f"{idx}: 本文{num}\n" for num in range(target_lines)] for idx in range(TARGETS)]
+
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "out.md")
+
+        def _copied():
+            header = _LegacyOutputs(contents)
+            for lines in targets:
+                write_lines_to_file(path, (header.cloned() + _LegacyOutputs(lines)).data)
+
+        def _linked():
+            header = OutputsData(contents)
+            for lines in targets:
+                write_lines_to_file(path, (header + OutputsData(lines)).iter_data())
+
+        copied = timeit(_copied, REPEAT)
+        linked = timeit(_linked, REPEAT)
+
+    legacy_header = _LegacyOutputs(contents)
+    legacy_targets = [_LegacyOutputs(lines) for lines in targets]
+    header = OutputsData(contents)
+    outputs = [OutputsData(lines) for lines in targets]
+    copied_join = timeit(lambda: [legacy_header.cloned() + t for t in legacy_targets], REPEAT)
+    linked_join = timeit(lambda: [header + t for t in outputs], REPEAT)
+
+    print(f"outputs     : {contents_lines} contents + {target_lines} lines x {TARGETS} targets")
+    print(f"copied      : join {copied_join * 1000:.2f}ms, join and write {copied:.3f}s")
+    print(f"linked      : join {linked_join * 1000:.2f}ms, join and write {linked:.3f}s")
+
+
+# Private Functions
+class _LegacyOutputs(object):
+    """The outputs data as it was, copying the list on clone and extending it on join."""
+
+    def __init__(self, data: list):
+        self.data = list(data)
+
+    def cloned(self):
+        return _LegacyOutputs(self.data)
+
+    def __add__(self, another):
+        self.data.extend(another.data)
+        return self
+
+
+if __name__ == '__main__':
+    main()
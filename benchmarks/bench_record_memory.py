@@ -0,0 +1,114 @@
+"""Benchmark: memory of the action records, dict based vs slotted records.
+
+    python benchmarks/bench_record_memory.py [scenes]
+"""
+
+# Official Libraries
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+from argparse import Namespace
+from dataclasses import astuple, dataclass, field
+
+# My Modules
+from common import generate_project
+
+
+# Define Constants
+SCENES = 10000
+
+
+# Main
+@dataclass
+class LegacyActionRecord(object):
+    """The action record as it was, with __dict__ and its own flags list."""
+    type: object
+    subtype: object
+    subject: str = ""
+    outline: str = ""
+    desc: str = ""
+    flags: list = field(default_factory=list)
+    note: str = ""
+
+
+def main() -> None:
+    scenes = int(sys.argv[1]) if len(sys.argv) > 1 else SCENES
+
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as root:
+        # NOTE: the project path is fixed when stobu is imported
+        os.chdir(root)
+        generate_project(root, scenes)
+
+        from stobu.core.actiondatacreator import actions_data_from
+        from stobu.core.nametagcreator import get_nametags
+        from stobu.core.storydatacreator import story_data_from
+        from stobu.types.action import ActionRecord
+
+        args = Namespace(part=None, jobs=1)
+        tags = get_nametags()
+        actions = actions_data_from(story_data_from(args), tags).get_data()
+        rows = [astuple(record) for record in actions]
+        os.chdir(cwd)
+
+    legacy_size, legacy_rss = _measure(
+            lambda: [LegacyActionRecord(*row[:5], list(row[5]), row[6]) for row in rows])
+    slotted_size, slotted_rss = _measure(
+            lambda: [ActionRecord(*row) for row in rows])
+
+    count = len(rows)
+    print(f"scenes       : {scenes}")
+    print(f"records      : {count}")
+    print(f"legacy       : {legacy_size / count:.1f} B/record, "
+          f"{legacy_size / 1e6:.1f} MB, rss +{legacy_rss / 1e6:.1f} MB")
+    print(f"slotted      : {slotted_size / count:.1f} B/record, "
+          f"{slotted_size / 1e6:.1f} MB, rss +{slotted_rss / 1e6:.1f} MB")
+    print(f"reduction    : {(1 - slotted_size / legacy_size) * 100:.0f}%")
+
+
+# Private Functions
+def _measure(func) -> tuple:
+    """Return the traced bytes and the rss growth of func, run in a forked child."""
+    if not hasattr(os, 'fork'):
+        return _measure_here(func)
+
+    reader, writer = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(reader)
+        size, grown = _measure_here(func)
+        os.write(writer, f"{size} {grown}".encode())
+        os._exit(0)
+
+    os.close(writer)
+    with os.fdopen(reader) as file:
+        size, grown = (int(v) for v in file.read().split())
+    os.waitpid(pid, 0)
+    return size, grown
+
+
+def _measure_here(func) -> tuple:
+    gc.collect()
+    rss = _rss()
+    tracemalloc.start()
+    records = func()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    grown = _rss() - rss
+    del records
+    return size, grown
+
+
+def _rss() -> int:
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return 0
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark: same/next tag resolution of long scenes, deep copy vs header copy.
+
+    python benchmarks/bench_scene_header_copy.py [scenes] [lines]
+"""
+
+# Official Libraries
+import copy
+import os
+import sys
+import tempfile
+from argparse import Namespace
+
+# My Modules
+from common import generate_project, timeit
+
+
+# Define Constants
+SCENES = 100
+
+LINES = 2000
+
+REPEAT = 5
+
+
+# Main
+def main() -> None:
+    scenes = int(sys.argv[1]) if len(sys.argv) > 1 else SCENES
+    lines = int(sys.argv[2]) if len(sys.argv) > 2 else LINES
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as root:
+        # NOTE: the project path is fixed when stobu is imported
+        os.chdir(root)
+        generate_project(root, scenes, lines)
+
+        import stobu.core.storydatacreator as creator
+        from stobu.tools.storydatareader import copy_scene_data_of_story_record
+
+        base = _story_data_base_of(creator)
+        os.chdir(cwd)
+
+    def _deep_copied(record, *args):
+        copied = creator.StoryRecord(record.type, record.filename, copy.deepcopy(record.data))
+        return copy_scene_data_of_story_record(copied, *args)
+
+    shared = timeit(lambda: creator.update_story_data_if_same_or_next_tag(base), REPEAT)
+
+    creator.copy_scene_data_of_story_record = _deep_copied
+    deep = timeit(lambda: creator.update_story_data_if_same_or_next_tag(base), REPEAT)
+    creator.copy_scene_data_of_story_record = copy_scene_data_of_story_record
+
+    print(f"scenes      : {scenes} ({lines} lines each)")
+    print(f"deep copy   : {deep * 1000:.1f}ms ({deep / scenes * 1e6:.0f} us/scene)")
+    print(f"header copy : {shared * 1000:.1f}ms ({shared / scenes * 1e6:.0f} us/scene)")
+
+
+# Private Functions
+def _story_data_base_of(creator):
+    """Return the story data before the tag resolution."""
+    captured = []
+    update = creator.update_story_data_if_same_or_next_tag
+
+    creator.update_story_data_if_same_or_next_tag = lambda data: captured.append(data) or data
+    try:
+        creator.story_data_from(Namespace(part=None, jobs=1))
+    finally:
+        creator.update_story_data_if_same_or_next_tag = update
+
+    return captured[0]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark: scene body tokenizer against the former per-line classification.
+
+    python benchmarks/bench_scene_tokenizer.py [lines]
+"""
+
+# Official Libraries
+import sys
+
+# My Modules
+from common import ACTS, timeit
+
+from stobu.core.scenetokenizer import ACT_TYPE_TABLE, tokenize_scene_lines
+from stobu.types.action import ActionRecord, ActDataType, ActType
+
+
+# Define Constants
+LINES = 1000000
+
+
+# Main
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else LINES
+    lines = [_line_of(idx) for idx in range(count)]
+
+    legacy = timeit(lambda: [_legacy_record_from(line) for line in lines], 3)
+    tokenized = timeit(lambda: tokenize_scene_lines(lines), 3)
+
+    legacy_records = [r for r in (_legacy_record_from(line) for line in lines) if r]
+    records, errors = tokenize_scene_lines(lines)
+    assert records == legacy_records and not errors
+
+    print(f"lines       : {count}")
+    print(f"legacy      : {legacy:.3f}s ({legacy / count * 1e9:.0f} ns/line)")
+    print(f"tokenizer   : {tokenized:.3f}s ({tokenized / count * 1e9:.0f} ns/line)")
+    print(f"speedup     : {legacy / tokenized:.2f}x")
+
+
+# Private Functions
+def _line_of(idx: int) -> str:
+    kind = idx % 10
+    if kind == 0:
+        return "## 見出し"
+    elif kind == 1:
+        return "# コメント"
+    elif kind == 2:
+        return "#! P"
+    elif kind == 3:
+        return "地の文がここに入る。"
+    elif kind == 4:
+        return ""
+    act = ACTS[idx % len(ACTS)]
+    return f"[p{idx % 10}:{act}:概要{idx}] $p{idx % 10}は$st{idx % 5}で話した。# メモ"
+
+
+def _legacy_act_type_from(action: str) -> ActType:
+    for act, check in ACT_TYPE_TABLE.items():
+        if action in check:
+            return act
+    return ActType.NONE
+
+
+def _legacy_record_from(line: str) -> ActionRecord:
+    """The classification and the field split as it was, in actiondatacreator."""
+    record = line.rstrip('\r\n')
+
+    if record in ('', '\n', '\n\r', '\r\n'):
+        return None
+    elif record.startswith('# '):
+        return ActionRecord(ActType.DATA, ActDataType.COMMENT, record.replace('# ', ''))
+    elif record.startswith('## '):
+        return ActionRecord(ActType.DATA, ActDataType.SCENE_HEAD, record.replace('## ', ''))
+    elif record.startswith('#! '):
+        tmp = record.replace('#! ', '')
+        instruction, outline = tmp, ''
+        if ' ' in tmp:
+            instruction, outline = tmp.split(' ')
+        return ActionRecord(ActType.DATA, ActDataType.INSTRUCTION, instruction, outline)
+    elif record.startswith('['):
+        tmp, comment = record, ''
+        if '# ' in record:
+            tmp, comment = record.split('# ')
+        cmd, desc = tmp[1:].split(']')
+        subject, act, outline = cmd.split(':')
+        return ActionRecord(_legacy_act_type_from(act), ActDataType.NONE, subject, outline,
+                desc.lstrip(), note=comment)
+    else:
+        return ActionRecord(ActType.DO, ActDataType.TEXT, '', record.lstrip(), record.lstrip())
+
+
+if __name__ == '__main__':
+    main()
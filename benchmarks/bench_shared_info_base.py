@@ -0,0 +1,70 @@
+"""Benchmark: scene and status infos, each own base pass vs one shared tagged base.
+
+    python benchmarks/bench_shared_info_base.py [scenes]
+"""
+
+# Official Libraries
+import os
+import sys
+import tempfile
+from argparse import Namespace
+
+# My Modules
+from common import generate_project, timeit
+
+
+# Define Constants
+SCENES = 1000
+
+REPEAT = 3
+
+
+# Main
+def main() -> None:
+    scenes = int(sys.argv[1]) if len(sys.argv) > 1 else SCENES
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as root:
+        # NOTE: the project path is fixed when stobu is imported
+        os.chdir(root)
+        generate_project(root, scenes)
+
+        from stobu.core.actiondatacreator import actions_data_from
+        from stobu.core.nametagcreator import get_nametags
+        from stobu.core.storydatacreator import story_data_from
+        from stobu.infos.informationer import infos_data_from, infos_data_from_base
+        from stobu.infos.informationer import status_infos_data_from, status_infos_data_from_base
+        from stobu.infos.informationer import tagged_base_infos_data_from
+        from stobu.tools.buildcache import BuildCache
+
+        tags = get_nametags()
+        actions_data = actions_data_from(story_data_from(Namespace(part=None, jobs=1)),
+                tags, BuildCache())
+
+        def _separated():
+            return (infos_data_from(actions_data, tags),
+                    status_infos_data_from(actions_data, tags))
+
+        def _shared():
+            base_data = tagged_base_infos_data_from(actions_data, tags)
+            return (infos_data_from_base(base_data), status_infos_data_from_base(base_data))
+
+        def _base():
+            return tagged_base_infos_data_from(actions_data, tags)
+
+        assert [d.get_data() for d in _separated()] == [d.get_data() for d in _shared()]
+
+        base = timeit(_base, REPEAT)
+        separated = timeit(_separated, REPEAT)
+        shared = timeit(_shared, REPEAT)
+
+        os.chdir(cwd)
+
+    print(f"scenes      : {scenes} ({len(actions_data.get_data())} actions)")
+    print(f"base pass   : {base:.3f}s")
+    print(f"separated   : {separated:.3f}s")
+    print(f"shared      : {shared:.3f}s")
+
+
+if __name__ == '__main__':
+    main()
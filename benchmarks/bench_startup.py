@@ -0,0 +1,77 @@
+"""Benchmark: cold start time per command, using python -X importtime.
+
+    python benchmarks/bench_startup.py
+"""
+
+# Official Libraries
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# My Modules
+from common import generate_project
+
+
+# Define Constants
+SCENES = 20
+
+REPEAT = 5
+
+COMMANDS = (
+        'none',
+        'list scene',
+        'list order',
+        'build -o',
+        )
+
+STOBU = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'bin', 'stobu')
+
+
+# Main
+def main() -> None:
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as root:
+        os.chdir(root)
+        generate_project(root, SCENES)
+
+        print(f"{'command':<12}  {'imports':>9}  {'wall':>9}")
+        for cmd in COMMANDS:
+            imports, wall = _best_of(cmd.split())
+            print(f"{cmd:<12}  {imports * 1000:7.1f}ms  {wall * 1000:7.1f}ms")
+
+        os.chdir(cwd)
+
+
+# Private Functions
+def _best_of(argv: list) -> tuple:
+    best_imports, best_wall = None, None
+
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        proc = subprocess.run([sys.executable, '-X', 'importtime', STOBU] + argv,
+                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        wall = time.perf_counter() - start
+        imports = _import_time_of(proc.stderr)
+        best_imports = imports if best_imports is None else min(best_imports, imports)
+        best_wall = wall if best_wall is None else min(best_wall, wall)
+
+    return best_imports, best_wall
+
+
+def _import_time_of(log: str) -> float:
+    """Sum the cumulative time of the top level imports, in seconds."""
+    total = 0
+    for line in log.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            total += int(cumulative)
+    return total / 1e6
+
+
+if __name__ == '__main__':
+    main()
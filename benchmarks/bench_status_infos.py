@@ -0,0 +1,126 @@
+"""Benchmark: person/stage status transitions of a large cast, nested scans vs grouping.
+
+    python benchmarks/bench_status_infos.py [persons] [actions]
+"""
+
+# Official Libraries
+import os
+import sys
+import tempfile
+
+# My Modules
+from common import generate_project, timeit
+
+
+# Define Constants
+PERSONS = 500
+
+STAGES = 50
+
+ACTIONS = 20000
+
+SCENE_ACTIONS = 20
+
+REPEAT = 3
+
+STATUS_ACTS = ('WEAR', 'FACE', 'KNOW', 'FEEL', 'PUT', 'DRAW', 'TALK')
+
+
+# Main
+def main() -> None:
+    persons = int(sys.argv[1]) if len(sys.argv) > 1 else PERSONS
+    actions = int(sys.argv[2]) if len(sys.argv) > 2 else ACTIONS
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory() as root:
+        # NOTE: the project path is fixed when stobu is imported
+        os.chdir(root)
+        generate_project(root, 0, persons=persons, stages=STAGES)
+
+        import stobu.infos.statusinfomations as status
+        from stobu.tools.projectdatacache import end_project_data_cache, start_project_data_cache
+        from stobu.types.info import InfosData
+
+        infos = InfosData(_records_of(persons, actions))
+
+        # NOTE: 人物と舞台の一覧は、ビルドと同じくプロジェクトのファイルから作られる
+        start_project_data_cache()
+        grouped = timeit(lambda: _status_of(infos), REPEAT)
+
+        reorder_persons, reorder_stages = status._reorder_each_persons, status._reorder_each_stages
+        expected = _status_of(infos)
+        status._reorder_each_persons = _legacy_reorder_with(status._get_persons_list, 'subject')
+        status._reorder_each_stages = _legacy_reorder_with(status._get_stages_list, 'stage')
+        try:
+            nested = timeit(lambda: _status_of(infos), REPEAT)
+            assert _status_of(infos) == expected
+        finally:
+            status._reorder_each_persons, status._reorder_each_stages = reorder_persons, reorder_stages
+            end_project_data_cache()
+            os.chdir(cwd)
+
+    print(f"persons     : {persons} ({STAGES} stages, {actions} actions)")
+    print(f"nested scan : {nested:.3f}s")
+    print(f"grouping    : {grouped:.3f}s")
+    print(f"speedup     : {nested / grouped:.2f}x")
+
+
+# Private Functions
+def _legacy_reorder_with(names_of, attr: str):
+    """The reordering as it was, rescanning all the records for each name."""
+    import stobu.infos.statusinfomations as status
+    from stobu.infos.common import get_record_as_data_title, get_record_as_splitter
+    from stobu.types.element import ElmType
+
+    elm = ElmType.PERSON if attr == 'subject' else ElmType.STAGE
+    title = "PERSON STATUS TRANSITIONS" if attr == 'subject' else "STAGE STATUS TRANSITIONS"
+
+    def _reorder(base_data: list) -> list:
+        tmp = [get_record_as_splitter(), get_record_as_data_title(title)]
+        for item in names_of():
+            tmp.append(status._get_record_as_data_splitter(elm))
+            for record in base_data:
+                if getattr(record.note, attr) == item:
+                    tmp.append(record)
+        return tmp
+
+    return _reorder
+
+
+def _person_of(num: int) -> str:
+    return f"人物{num}"
+
+
+def _records_of(persons: int, actions: int) -> list:
+    from stobu.types.action import ActType
+    from stobu.types.info import InfoRecord, InfoType, SceneInfo
+
+    acts = [ActType[name] for name in STATUS_ACTS]
+    tmp = []
+
+    for num in range(actions):
+        if num % SCENE_ACTIONS == 0:
+            scene = num // SCENE_ACTIONS
+            tmp.append(InfoRecord(InfoType.TITLE_SCENE, ActType.DATA, '', f"場面{scene}", ''))
+            tmp.append(InfoRecord(InfoType.SCENE_HEAD, ActType.DATA, '', '',
+                SceneInfo('', _stage_of(scene % STAGES), '', '', '', '')))
+        act = acts[num % len(acts)]
+        tmp.append(InfoRecord(InfoType.ACTION, act, _person_of(num * 7 % persons),
+            f"概要{num}", "メモ"))
+
+    return tmp
+
+
+def _stage_of(num: int) -> str:
+    return f"舞台{num}"
+
+
+def _status_of(infos) -> list:
+    from stobu.infos.statusinfomations import person_status_info_from, stage_status_info_from
+
+    return [record for data in (person_status_info_from(infos), stage_status_info_from(infos))
+            for record in data.get_data()]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark: yaml front matter parse time, pure python vs libyaml loader."""
+
+# Official Libraries
+import yaml
+
+# My Modules
+from common import scene_text_of, timeit
+from stobu.tools import filedatareader
+from stobu.tools.filedatareader import read_markdown_data_as_yaml
+
+
+# Define Constants
+SCENES = 5000
+
+
+# Main
+def main() -> None:
+    texts = [scene_text_of(idx) for idx in range(SCENES)]
+
+    def _parse_all():
+        for text in texts:
+            read_markdown_data_as_yaml(text)
+
+    origin = filedatareader.YAML_LOADER
+
+    filedatareader.YAML_LOADER = yaml.SafeLoader
+    pure = timeit(_parse_all)
+
+    filedatareader.YAML_LOADER = origin
+    current = timeit(_parse_all)
+
+    print(f"scenes      : {SCENES}")
+    print(f"SafeLoader  : {pure:.3f}s")
+    print(f"{origin.__name__:<12}: {current:.3f}s ({pure / current:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
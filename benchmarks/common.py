@@ -0,0 +1,107 @@
+"""Common helpers for benchmarks.
+
+Run each benchmark from the repository root, e.g.
+
+    python benchmarks/bench_yaml_loader.py
+"""
+
+# Official Libraries
+import os
+import sys
+import time
+from typing import Callable
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+
+__all__ = (
+        'generate_project',
+        'scene_text_of',
+        'timeit',
+        )
+
+
+# Define Constants
+PERSONS = 10
+
+STAGES = 5
+
+ACTS = ('be', 'come', 'go', 't', 'do', 'd', 'have', 'discard', 'put', 'rid',
+        'know', 'known', 'wear', 'face', 'feel', 'ex', 'occur', 'think', '-')
+
+
+# Main
+def generate_project(root: str, scenes: int, lines: int = 20,
+        persons: int = PERSONS, stages: int = STAGES) -> str:
+    """Write a stobu project with 1 chapter / 10 scenes per episode to root."""
+    assert isinstance(root, str)
+
+    for dirname in ('build', 'chapters', 'episodes', 'events', 'items', 'persons',
+            'scenes', 'stages', 'words'):
+        os.makedirs(os.path.join(root, dirname), exist_ok=True)
+
+    from stobu.tools.templater import get_template_data
+    from stobu.types.element import ElmType
+
+    for elm, fname in ((ElmType.BOOK, 'book.yml'), (ElmType.FIXTURE, 'fixture.yml'),
+            (ElmType.MOB, 'mob.yml'), (ElmType.TERM, 'term.yml'), (ElmType.TIME, 'time.yml'),
+            (ElmType.RUBI, 'rubi.yml')):
+        _write(os.path.join(root, fname), get_template_data(elm))
+
+    for i in range(persons):
+        _write(os.path.join(root, 'persons', f"p{i}.md"),
+                f"---\nname    : 人物{i}\nfullname: 苗字,人物{i}\ncalling :\n  me: 私\n---\n")
+    for i in range(stages):
+        _write(os.path.join(root, 'stages', f"st{i}.md"), f"---\nname    : 舞台{i}\n---\n")
+
+    chapter = get_template_data(ElmType.CHAPTER)
+    episode = get_template_data(ElmType.EPISODE)
+    order = ['book:', '  - chapter/c0:']
+    _write(os.path.join(root, 'chapters', 'c0.md'), chapter)
+
+    for idx in range(scenes):
+        if idx % 10 == 0:
+            ep = f"e{idx // 10}"
+            _write(os.path.join(root, 'episodes', f"{ep}.md"), episode)
+            order.append(f"    - episode/{ep}:")
+        _write(os.path.join(root, 'scenes', f"s{idx}.md"), scene_text_of(idx, lines, persons, stages))
+        order.append(f"      - scene/s{idx}")
+
+    _write(os.path.join(root, 'order.yml'), '\n'.join(order) + '\n')
+
+    return root
+
+
+def scene_text_of(idx: int, lines: int = 20, persons: int = PERSONS,
+        stages: int = STAGES) -> str:
+    date = "'4/1'" if idx == 0 else '_nextday_'
+    body = ['#! P']
+    for num in range(lines):
+        person = f"p{(idx + num) % persons}"
+        act = ACTS[(idx + num) % len(ACTS)]
+        body.append(f"[{person}:{act}:概要{num}] ${person}は$st{idx % stages}で話した。 # メモ")
+    body.append('#! PE')
+
+    return (f"---\ntitle   : 場面{idx}\noutline : 概要\n"
+            f"plot    :\n  setup  : 設定\n  tp1st  : 転機\n  develop: 展開\n"
+            f"  tp2nd  : 転機\n  climax : 山場\n  resolve: 結末\n"
+            f"camera  : p{idx % persons}\nstage   : st{idx % stages}\n"
+            f"year    : '2021'\ndate    : {date}\ntime    : morning\n"
+            f"keywords: []\nnote    : 備考\n---\n\n" + '\n'.join(body) + '\n')
+
+
+def timeit(func: Callable, repeat: int = 3) -> float:
+    """Return the best wall time of the function in seconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None or elapsed < best else best
+    return best
+
+
+# Private Functions
+def _write(path: str, text: str) -> None:
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(text)
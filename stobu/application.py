@@ -6,17 +6,6 @@ from argparse import Namespace
 
 
 # My Modules
-from stobu.commands.adder import add_story_source
-from stobu.commands.builder import build_project
-from stobu.commands.copier import copy_story_source
-from stobu.commands.deleter import delete_story_source
-from stobu.commands.editor import edit_story_source
-from stobu.commands.initializer import init_project
-from stobu.commands.lister import show_list_of_story_sources
-from stobu.commands.pusher import push_story_source
-from stobu.commands.rejector import reject_story_source
-from stobu.commands.renamer import rename_story_source
-from stobu.commands.setter import set_project_data
 from stobu.syss import messages as msg
 from stobu.tools.cmdchecker import has_cmd_of
 from stobu.tools.commandlineparser import get_commandline_arguments
@@ -37,27 +26,33 @@ PROC = 'APPLICATION'
 class Application(object):
 
     def __init__(self):
-        logger.debug(msg.PROC_INITIALIZED.format(proc=PROC))
+        logger.debug(msg.PROC_INITIALIZED, proc=PROC)
 
     def run(self) -> int:
-        logger.debug(msg.PROC_START.format(proc=PROC))
+        logger.debug(msg.PROC_START, proc=PROC)
 
         args = get_commandline_arguments()
 
         if not args:
-            logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"commandline args in {PROC}"))
+            logger.error(msg.ERR_FAIL_MISSING_DATA, data=f"commandline args in {PROC}")
             return os.EX_NOINPUT
 
+        # NOTE: 各コマンドは使う時に読み込む（起動を速くするため）
         if has_cmd_of(args, CmdType.INIT):
+            from stobu.commands.initializer import init_project
             if not init_project(args):
-                logger.error(msg.ERR_FAIL_CANNOT_INITIALIZE.format(data='project'))
+                logger.error(msg.ERR_FAIL_CANNOT_INITIALIZE, data='project')
                 return os.EX_SOFTWARE
             return os.EX_OK
 
         is_succeeded = False
 
         if has_cmd_of(args, CmdType.BUILD):
+            from stobu.commands.builder import build_project
             is_succeeded = build_project(args)
+        elif has_cmd_of(args, CmdType.WATCH):
+            from stobu.commands.watcher import watch_project
+            is_succeeded = watch_project(args)
         elif has_cmd_of(args, CmdType.NONE) or has_cmd_of(args, CmdType.INIT):
             is_succeeded = True
         else:
@@ -65,31 +60,40 @@ class Application(object):
                 return os.EX_NOINPUT
 
             if has_cmd_of(args, CmdType.ADD):
+                from stobu.commands.adder import add_story_source
                 is_succeeded = add_story_source(args)
             elif has_cmd_of(args, CmdType.COPY):
+                from stobu.commands.copier import copy_story_source
                 is_succeeded = copy_story_source(args)
             elif has_cmd_of(args, CmdType.DELETE):
+                from stobu.commands.deleter import delete_story_source
                 is_succeeded = delete_story_source(args)
             elif has_cmd_of(args, CmdType.EDIT):
+                from stobu.commands.editor import edit_story_source
                 is_succeeded = edit_story_source(args)
             elif has_cmd_of(args, CmdType.LIST):
+                from stobu.commands.lister import show_list_of_story_sources
                 is_succeeded = show_list_of_story_sources(args)
             elif has_cmd_of(args, CmdType.PUSH):
+                from stobu.commands.pusher import push_story_source
                 is_succeeded = push_story_source(args)
             elif has_cmd_of(args, CmdType.REJECT):
+                from stobu.commands.rejector import reject_story_source
                 is_succeeded = reject_story_source(args)
             elif has_cmd_of(args, CmdType.RENAME):
+                from stobu.commands.renamer import rename_story_source
                 is_succeeded = rename_story_source(args)
             elif has_cmd_of(args, CmdType.SET):
+                from stobu.commands.setter import set_project_data
                 is_succeeded = set_project_data(args)
             else:
-                logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"command type in {PROC}"))
+                logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"command type in {PROC}")
 
         if not is_succeeded:
-            logger.error(msg.ERR_FAILED_PROC.format(proc=PROC))
+            logger.error(msg.ERR_FAILED_PROC, proc=PROC)
             return os.EX_SOFTWARE
 
-        logger.debug(msg.PROC_DONE.format(proc=PROC))
+        logger.debug(msg.PROC_DONE, proc=PROC)
         return os.EX_OK
 
 
@@ -98,11 +102,11 @@ def _is_valid_args(args: Namespace) -> bool:
     assert isinstance(args, Namespace)
 
     if not args.cmd:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"command in {PROC}"))
+        logger.error(msg.ERR_FAIL_MISSING_DATA, data=f"command in {PROC}")
         return False
 
     if not args.elm:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"command args in {PROC}"))
+        logger.error(msg.ERR_FAIL_MISSING_DATA, data=f"command args in {PROC}")
         return False
 
     return True
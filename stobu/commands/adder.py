@@ -48,10 +48,10 @@ def add_story_source(args: Namespace) -> bool:
     assert isinstance(args, Namespace)
     assert has_cmd_of(args, CmdType.ADD)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     if not is_enable_elm_in(args, ENABLE_ELMS):
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
         return False
 
     elm = elm_from(args)
@@ -64,9 +64,9 @@ def add_story_source(args: Namespace) -> bool:
     data = get_template_data(elm)
 
     if not write_file(path, data):
-        logger.error(msg.ERR_FAIL_CANNOT_CREATE_DATA.format(data=f"new {elm} file in {PROC}"))
+        logger.error(msg.ERR_FAIL_CANNOT_CREATE_DATA, data=f"new {elm} file in {PROC}")
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return True
 
 
@@ -78,7 +78,7 @@ def _get_new_filename(elm: ElmType, fname: str) -> str:
 
     if is_duplicated_path_in_dir(elm, _fname):
         logger.warning(
-                msg.ERR_FAIL_DUPLICATED_DATA_WITH_DATA.format(data=f"new filename in {PROC}"),
-                _fname)
+                msg.ERR_FAIL_DUPLICATED_DATA_WITH_DATA, _fname,
+                data=f"new filename in {PROC}")
         return ""
     return _fname
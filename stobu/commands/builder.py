@@ -1,40 +1,51 @@
 """Build project module."""
 
 # Official Libraries
+import time
 from argparse import Namespace
+from typing import Iterator
 
 
 # My Modules
 from stobu.core.actiondatacreator import actions_data_from
-from stobu.core.baseinfocreator import base_info_outputs_data_from
+from stobu.core.baseinfocreator import base_info_outputs_data_from, get_columns_rows
 from stobu.core.contentsdatacreator import contents_data_from, outputs_data_from_contents_data
 from stobu.core.nametagcreator import get_nametags
-from stobu.core.noveler import novels_data_from, outputs_data_from_novels_data
+from stobu.core.noveler import iter_outputs_from_novels_data, novels_data_from
 from stobu.core.outliner import outlines_data_from, outputs_data_from_outlines_data
 from stobu.core.plotter import plots_data_from, outputs_data_from_plots_data
-from stobu.core.scripter import outputs_data_from_scripts_data, scripts_data_from
+from stobu.core.scripter import iter_outputs_from_scripts_data, scripts_data_from
 from stobu.core.storydatacreator import story_data_from
 from stobu.core.structer import structs_data_from, outputs_data_from_structs_data
-from stobu.infos.informationer import infos_data_from, outputs_data_from_infos_data
-from stobu.infos.informationer import status_infos_data_from, outputs_data_from_status_infos_data
+from stobu.counts.common import StreamCounter
+from stobu.infos.informationer import infos_data_from_base, outputs_data_from_infos_data
+from stobu.infos.informationer import outputs_data_from_status_infos_data
+from stobu.infos.informationer import status_infos_data_from_base, tagged_base_infos_data_from
 from stobu.syss import messages as msg
+from stobu.tools.buildcache import BuildCache, load_build_cache, save_build_cache
 from stobu.tools.buildchecker import has_build_of
 from stobu.tools.cmdchecker import has_cmd_of
 from stobu.tools.pathgetter import filepath_of
+from stobu.tools.projectdatacache import ProjectDataCache
+from stobu.tools.projectdatacache import end_project_data_cache, start_project_data_cache
 from stobu.types.action import ActionsData
-from stobu.types.build import BuildType
+from stobu.types.build import BuildContext, BuildType
 from stobu.types.content import ContentsData
 from stobu.types.command import CmdType
+from stobu.types.count import CountsData
 from stobu.types.element import ElmType
-from stobu.types.output import OutputsData
+from stobu.types.info import InfosData
+from stobu.types.output import OutputMark, OutputsData
 from stobu.types.story import StoryData
 from stobu.utils import assertion
-from stobu.utils.fileio import write_file
+from stobu.utils.fileio import OutputSink, write_lines_to_file
 from stobu.utils.log import logger
+from stobu.utils.parallel import imap_unordered_in_parallel
 
 
 __all__ = (
         'build_project',
+        'build_project_with_cache',
         )
 
 
@@ -55,87 +66,108 @@ BUILD_FILENAMES = {
         }
 
 
+BUILD_TARGETS = [
+        BuildType.OUTLINE,
+        BuildType.PLOT,
+        BuildType.STRUCT,
+        BuildType.SCENE_INFO,
+        BuildType.STATUS_INFO,
+        BuildType.SCRIPT,
+        BuildType.NOVEL,
+        ]
+
+
+STORY_BUILD_TARGETS = [
+        BuildType.OUTLINE,
+        BuildType.PLOT,
+        ]
+
+
+INFO_BUILD_TARGETS = [
+        BuildType.SCENE_INFO,
+        BuildType.STATUS_INFO,
+        ]
+
+
+STREAM_BUILD_TARGETS = [
+        BuildType.SCRIPT,
+        BuildType.NOVEL,
+        ]
+"""list: targets written by the worker line by line, returning only their counts."""
+
+
 # Main
 def build_project(args: Namespace) -> bool:
     assert isinstance(args, Namespace)
     assert has_cmd_of(args, CmdType.BUILD)
 
+    cache = BuildCache() if args.rebuild else load_build_cache()
+
+    is_succeeded = build_project_with_cache(args, cache, ProjectDataCache(cache))
+
+    if is_succeeded and not save_build_cache(cache):
+        logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA, data=f"build cache in {PROC}")
+
+    return is_succeeded
+
+
+def build_project_with_cache(args: Namespace, cache: BuildCache,
+        project_data: ProjectDataCache) -> bool:
+    """Build the project, reusing the parsed data kept in the given caches."""
+    assert isinstance(args, Namespace)
+    assert isinstance(cache, BuildCache)
+    assert isinstance(project_data, ProjectDataCache)
+
+    start_project_data_cache(data=project_data)
+
+    try:
+        return _build_project_with(args, cache)
+    finally:
+        end_project_data_cache()
+
+
+# Private Functions
+def _build_project_with(args: Namespace, cache: BuildCache) -> bool:
+    assert isinstance(args, Namespace)
+    assert isinstance(cache, BuildCache)
+
+    context = BuildContext()
+
     tags = assertion.is_dict(get_nametags())
     if not tags:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"name tags in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"name tags in {PROC}")
         return False
 
-    story_data = story_data_from(args)
+    story_data = story_data_from(args, cache)
     if not story_data or not isinstance(story_data, StoryData) or not story_data.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"story data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"story data in {PROC}")
         return False
 
     output_contents_data = _output_contents_data_from(story_data, tags)
     if not output_contents_data or not output_contents_data.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"output contents data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"output contents data in {PROC}")
         return False
 
-    is_comment = args.comment
-
-    if has_build_of(args, BuildType.OUTLINE):
-        outputs = _conv_build_outline_outputs(output_contents_data.cloned(), story_data, tags)
-        if not outputs or not _output_data(BuildType.OUTLINE, outputs):
-            logger.error(msg.PROC_FAILED.format(proc=f"outline in {PROC}"))
-            return False
-
-    if has_build_of(args, BuildType.PLOT):
-        outputs = _conv_build_plot_outputs(output_contents_data.cloned(), story_data, tags)
-        if not outputs or not _output_data(BuildType.PLOT, outputs):
-            logger.error(msg.PROC_FAILED.format(proc=f"plot in {PROC}"))
-            return False
-
-    actions_data = actions_data_from(story_data, tags)
+    actions_data = actions_data_from(story_data, tags, cache)
     if not actions_data or not actions_data.has_data():
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"actions data in {PROC}"))
-
-    if has_build_of(args, BuildType.STRUCT):
-        outputs = _conv_build_struct_outputs(
-                output_contents_data.cloned(), actions_data, tags, is_comment)
-        if not outputs or not _output_data(BuildType.STRUCT, outputs):
-            logger.error(msg.PROC_FAILED.format(proc=f"struct in {PROC}"))
-            return False
+        logger.error(msg.ERR_FAIL_MISSING_DATA, data=f"actions data in {PROC}")
+        actions_data = None
 
-    if has_build_of(args, BuildType.SCENE_INFO):
-        outputs = _conv_build_sceneinfo_outputs(
-                output_contents_data.cloned(), actions_data, tags, is_comment)
-        if not outputs or not _output_data(BuildType.SCENE_INFO, outputs):
-            logger.error(msg.PROC_FAILED.format(proc=f"scene info in {PROC}"))
-            return False
-
-    if has_build_of(args, BuildType.STATUS_INFO):
-        outputs = _conv_build_statusinfo_outputs(
-                output_contents_data.cloned(), actions_data, tags, is_comment)
-        if not outputs or not _output_data(BuildType.STATUS_INFO, outputs):
-            logger.error(msg.PROC_FAILED.format(proc=f"status info in {PROC}"))
-            return False
-
-    if has_build_of(args, BuildType.SCRIPT):
-        outputs = _conv_build_script_outputs(
-                output_contents_data.cloned(), actions_data, tags, is_comment)
-        if not outputs or not _output_data(BuildType.SCRIPT, outputs):
-            logger.error(msg.PROC_FAILED.format(proc=f"script in {PROC}"))
-            return False
+    if not _build_targets(args, story_data, actions_data, tags, output_contents_data, context):
+        return False
 
-    if has_build_of(args, BuildType.NOVEL):
-        outputs = _conv_build_novel_outputs(
-                output_contents_data.cloned(), actions_data, tags, is_comment)
-        if not outputs or not _output_data(BuildType.NOVEL, outputs):
-            logger.error(msg.PROC_FAILED.format(proc=f"novel in {PROC}"))
-            return False
+    if not actions_data:
+        # NOTE: アウトラインとプロットだけ書き出して、基本情報は作らずに止める
+        return False
 
     # base data
-    base_data = base_info_outputs_data_from(args, story_data, actions_data, tags)
+    base_data = base_info_outputs_data_from(args, story_data, actions_data, tags, context)
     if not base_data or not base_data.has_data():
-        logger.error(msg.PROC_FAILED.format(proc=f"base data in {PROC}"))
+        logger.error(msg.PROC_FAILED, proc=f"base data in {PROC}")
         return False
 
     if not _output_data(BuildType.BASE, base_data):
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"base data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"base data in {PROC}")
         return False
 
     # detail data
@@ -143,165 +175,273 @@ def build_project(args: Namespace) -> bool:
     return True
 
 
-# Private Functions
-def _conv_build_novel_outputs(contents: OutputsData, actions_data: ActionsData,
-        tags: dict, is_comment: bool) -> OutputsData:
-    assert isinstance(contents, OutputsData)
-    assert isinstance(actions_data, ActionsData)
+def _build_targets(args: Namespace, story_data: StoryData, actions_data: ActionsData,
+        tags: dict, contents: OutputsData, context: BuildContext) -> bool:
+    assert isinstance(args, Namespace)
+    assert isinstance(story_data, StoryData)
+    assert actions_data is None or isinstance(actions_data, ActionsData)
     assert isinstance(tags, dict)
-    assert isinstance(is_comment, bool)
+    assert isinstance(contents, OutputsData)
+    assert isinstance(context, BuildContext)
 
-    logger.debug(msg.PROC_START.format(proc=f"build novel in {PROC}"))
-    novels = novels_data_from(actions_data, tags)
-    if not novels or not novels.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"novels data in {PROC}"))
-        return None
+    is_comment = args.comment
+    targets = []
+
+    # NOTE: シーン情報と状態情報は同じタグ変換済みの基本情報から作る
+    if actions_data and any(has_build_of(args, build_type) for build_type in INFO_BUILD_TARGETS):
+        context.set_infos(_tagged_base_infos_data_from(actions_data, tags))
+
+    for build_type in BUILD_TARGETS:
+        if has_build_of(args, build_type):
+            if not actions_data and build_type not in STORY_BUILD_TARGETS:
+                continue
+            if build_type in STORY_BUILD_TARGETS:
+                src = story_data
+            elif build_type in INFO_BUILD_TARGETS:
+                src = context.get_infos()
+            else:
+                src = actions_data
+            targets.append((build_type, src, tags, is_comment,
+                contents if build_type in STREAM_BUILD_TARGETS else None))
+
+    # NOTE: 各ターゲットは互いに依存しないので、終わったものから順に書き出す
+    for build_type, outputs in imap_unordered_in_parallel(
+            _conv_build_target_outputs, targets, args.jobs):
+        if not outputs or not outputs.has_data():
+            logger.error(msg.PROC_FAILED, proc=f"{build_type} in {PROC}")
+            return False
 
-    return contents + outputs_data_from_novels_data(novels, tags, is_comment)
+        if build_type in STREAM_BUILD_TARGETS:
+            # NOTE: 書き出しはワーカーで済んでいるので、数えた文字数だけを受け取る
+            context.set_counts(build_type, outputs, is_comment)
+            continue
 
+        context.set_outputs(build_type, outputs,
+                False if build_type in STORY_BUILD_TARGETS else is_comment)
 
-def _conv_build_outline_outputs(contents: OutputsData, story_data: StoryData,
-        tags: dict) -> OutputsData:
-    assert isinstance(contents, OutputsData)
+        if not _output_data(build_type, contents + outputs):
+            logger.error(msg.PROC_FAILED, proc=f"{build_type} in {PROC}")
+            return False
+
+    return True
+
+
+def _conv_build_outline_outputs(story_data: StoryData, tags: dict) -> OutputsData:
     assert isinstance(story_data, StoryData)
     assert isinstance(tags, dict)
 
-    logger.debug(msg.PROC_START.format(proc=f"build outline in {PROC}"))
+    logger.debug(msg.PROC_START, proc=f"build outline in {PROC}")
 
     outlines = outlines_data_from(story_data, tags)
     if not outlines or not outlines.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"outlines data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"outlines data in {PROC}")
         return None
 
-    return contents + outputs_data_from_outlines_data(outlines, tags)
-
+    return outputs_data_from_outlines_data(outlines, tags)
 
 
-def _conv_build_plot_outputs(contents: OutputsData, story_data: StoryData,
-        tags: dict) -> OutputsData:
-    assert isinstance(contents, OutputsData)
+def _conv_build_plot_outputs(story_data: StoryData, tags: dict) -> OutputsData:
     assert isinstance(story_data, StoryData)
     assert isinstance(tags, dict)
 
-    logger.debug(msg.PROC_START.format(proc=f"build plot in {PROC}"))
+    logger.debug(msg.PROC_START, proc=f"build plot in {PROC}")
 
     plots = plots_data_from(story_data)
     if not plots or not plots.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"plots data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"plots data in {PROC}")
         return None
 
-    return contents + outputs_data_from_plots_data(plots, tags)
+    return outputs_data_from_plots_data(plots, tags)
 
 
-def _conv_build_sceneinfo_outputs(contents: OutputsData, actions_data: ActionsData,
-        tags: dict, is_comment: bool) -> OutputsData:
-    assert isinstance(contents, OutputsData)
-    assert isinstance(actions_data, ActionsData)
+def _conv_build_sceneinfo_outputs(base_data: InfosData, tags: dict,
+        is_comment: bool) -> OutputsData:
+    assert isinstance(base_data, InfosData)
     assert isinstance(tags, dict)
     assert isinstance(is_comment, bool)
 
     _PROC = f"{PROC}: build scene info"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
-    infos = infos_data_from(actions_data, tags)
+    infos = infos_data_from_base(base_data)
     if not infos or not infos.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"info data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"info data in {PROC}")
         return None
 
-    outputs = contents + outputs_data_from_infos_data(infos, tags, is_comment)
+    outputs = outputs_data_from_infos_data(infos, tags, is_comment)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return outputs
 
 
-def _conv_build_script_outputs(contents: OutputsData, actions_data: ActionsData,
-        tags: dict, is_comment: bool) -> OutputsData:
-    assert isinstance(contents, OutputsData)
-    assert isinstance(actions_data, ActionsData)
-    assert isinstance(tags, dict)
-    assert isinstance(is_comment, bool)
-
-    logger.debug(msg.PROC_START.format(proc=f"build script in {PROC}"))
-
-    scripts = scripts_data_from(actions_data, tags)
-    if not scripts or not scripts.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"scripts data in {PROC}"))
-        return None
-
-    return contents + outputs_data_from_scripts_data(scripts, tags, is_comment)
-
-
-def _conv_build_statusinfo_outputs(contents: OutputsData, actions_data: ActionsData,
-        tags: dict, is_comment: bool) -> OutputsData:
-    assert isinstance(contents, OutputsData)
-    assert isinstance(actions_data, ActionsData)
+def _conv_build_statusinfo_outputs(base_data: InfosData, tags: dict,
+        is_comment: bool) -> OutputsData:
+    assert isinstance(base_data, InfosData)
     assert isinstance(tags, dict)
     assert isinstance(is_comment, bool)
 
     _PROC = f"{PROC}: build status info"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
-    infos = status_infos_data_from(actions_data, tags)
+    infos = status_infos_data_from_base(base_data)
     if not infos or not infos.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"status info data in {_PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"status info data in {_PROC}")
         return None
 
-    outputs = contents + outputs_data_from_status_infos_data(infos, tags, is_comment)
+    outputs = outputs_data_from_status_infos_data(infos, tags, is_comment)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return outputs
 
 
-def _conv_build_struct_outputs(contents: OutputsData, actions_data: ActionsData,
-        tags: dict, is_comment: bool) -> OutputsData:
-    assert isinstance(contents, OutputsData)
+def _conv_build_struct_outputs(actions_data: ActionsData, tags: dict,
+        is_comment: bool) -> OutputsData:
     assert isinstance(actions_data, ActionsData)
     assert isinstance(tags, dict)
     assert isinstance(is_comment, bool)
 
     _PROC = f"{PROC}: build struct"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     structs = structs_data_from(actions_data, tags)
     if not structs or not structs.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"structs data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"structs data in {PROC}")
         return None
 
-    outputs = contents + outputs_data_from_structs_data(structs, tags, is_comment)
+    outputs = outputs_data_from_structs_data(structs, tags, is_comment)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return outputs
 
 
+def _conv_build_target_outputs(target: tuple) -> tuple:
+    build_type, src, tags, is_comment, contents = target
+    start = time.perf_counter()
+
+    if BuildType.OUTLINE is build_type:
+        outputs = _conv_build_outline_outputs(src, tags)
+    elif BuildType.PLOT is build_type:
+        outputs = _conv_build_plot_outputs(src, tags)
+    elif BuildType.STRUCT is build_type:
+        outputs = _conv_build_struct_outputs(src, tags, is_comment)
+    elif BuildType.SCENE_INFO is build_type:
+        outputs = _conv_build_sceneinfo_outputs(src, tags, is_comment)
+    elif BuildType.STATUS_INFO is build_type:
+        outputs = _conv_build_statusinfo_outputs(src, tags, is_comment)
+    elif BuildType.SCRIPT is build_type:
+        outputs = _stream_build_script_outputs(src, tags, is_comment, contents)
+    elif BuildType.NOVEL is build_type:
+        outputs = _stream_build_novel_outputs(src, tags, is_comment, contents)
+    else:
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"build type {build_type} in {PROC}")
+        outputs = None
+
+    logger.debug(msg.PROC_DONE_IN, proc=f"{build_type} in {PROC}",
+            elapsed=(time.perf_counter() - start) * 1000)
+
+    return build_type, outputs
+
+
 def _output_contents_data_from(story_data: StoryData, tags: dict) -> OutputsData:
     assert isinstance(story_data, StoryData)
     assert isinstance(tags, dict)
 
     _PROC = f"{PROC}: contents data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
     contents_data = contents_data_from(story_data, tags)
     if not contents_data or not isinstance(contents_data, ContentsData) or not contents_data.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"contents datain {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"contents datain {PROC}")
         return None
 
     output_contents_data = outputs_data_from_contents_data(contents_data)
     if not output_contents_data or not isinstance(output_contents_data, OutputsData) or not output_contents_data.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"output contents data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"output contents data in {PROC}")
         return None
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return output_contents_data
 
 
 def _output_data(build_type: BuildType, outputs_data: OutputsData) -> bool:
     assert isinstance(build_type, BuildType)
     assert isinstance(outputs_data, OutputsData)
-    logger.debug(msg.PROC_START.format(proc=f"output {build_type} in {PROC}"))
+    logger.debug(msg.PROC_START, proc=f"output {build_type} in {PROC}")
 
     path = filepath_of(ElmType.BUILD, BUILD_FILENAMES[build_type])
-    if not write_file(path, outputs_data.get_serialized_data()):
-        logger.error(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"outputs data {str(build_type)} in {PROC}"))
+    if not write_lines_to_file(path, outputs_data.iter_data()):
+        logger.error(msg.ERR_FAIL_CANNOT_WRITE_DATA, data=f"outputs data {str(build_type)} in {PROC}")
         return False
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=f"output {build_type} in {PROC}"))
+    logger.debug(msg.PROC_SUCCESS, proc=f"output {build_type} in {PROC}")
     return True
+
+
+def _stream_build_novel_outputs(actions_data: ActionsData, tags: dict,
+        is_comment: bool, contents: OutputsData) -> CountsData:
+    assert isinstance(actions_data, ActionsData)
+    assert isinstance(tags, dict)
+    assert isinstance(is_comment, bool)
+    assert isinstance(contents, OutputsData)
+
+    logger.debug(msg.PROC_START, proc=f"build novel in {PROC}")
+    novels = novels_data_from(actions_data, tags)
+    if not novels or not novels.has_data():
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"novels data in {PROC}")
+        return None
+
+    return _stream_outputs(BuildType.NOVEL, contents,
+            iter_outputs_from_novels_data(novels, tags, is_comment))
+
+
+def _stream_build_script_outputs(actions_data: ActionsData, tags: dict,
+        is_comment: bool, contents: OutputsData) -> CountsData:
+    assert isinstance(actions_data, ActionsData)
+    assert isinstance(tags, dict)
+    assert isinstance(is_comment, bool)
+    assert isinstance(contents, OutputsData)
+
+    logger.debug(msg.PROC_START, proc=f"build script in {PROC}")
+
+    scripts = scripts_data_from(actions_data, tags)
+    if not scripts or not scripts.has_data():
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"scripts data in {PROC}")
+        return None
+
+    return _stream_outputs(BuildType.SCRIPT, contents,
+            iter_outputs_from_scripts_data(scripts, tags, is_comment))
+
+
+def _stream_outputs(build_type: BuildType, contents: OutputsData,
+        records: Iterator) -> CountsData:
+    assert isinstance(build_type, BuildType)
+    assert isinstance(contents, OutputsData)
+    logger.debug(msg.PROC_START, proc=f"output {build_type} in {PROC}")
+
+    columns, rows = get_columns_rows()
+    counter = StreamCounter(columns)
+    path = filepath_of(ElmType.BUILD, BUILD_FILENAMES[build_type])
+
+    # NOTE: 目次の後に整形した行を一行ずつ書きながら数え、全文は溜めない
+    with OutputSink(path) as sink:
+        sink.write_lines(contents.iter_data())
+        for record in records:
+            counter.count(record)
+            if not isinstance(record, OutputMark):
+                sink.write(record)
+
+    logger.debug(msg.PROC_SUCCESS, proc=f"output {build_type} in {PROC}")
+    return counter.counts_data(rows)
+
+
+def _tagged_base_infos_data_from(actions_data: ActionsData, tags: dict) -> InfosData:
+    assert isinstance(actions_data, ActionsData)
+    assert isinstance(tags, dict)
+
+    start = time.perf_counter()
+
+    infos = tagged_base_infos_data_from(actions_data, tags)
+
+    logger.debug(msg.PROC_DONE_IN, proc=f"tagged base infos in {PROC}",
+            elapsed=(time.perf_counter() - start) * 1000)
+
+    return infos
@@ -46,27 +46,27 @@ def copy_story_source(args: Namespace) -> bool:
     assert isinstance(args, Namespace)
     assert has_cmd_of(args, CmdType.COPY)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     if not is_enable_elm_in(args, ENABLE_ELMS):
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
         return False
 
     elm = elm_from(args)
     fname = _get_copy_filename(elm, args.option)
     if not fname:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"copy filename in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"copy filename in {PROC}")
         return False
 
     newname = _get_copied_name(elm, fname)
     if not newname:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"copy name in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"copy name in {PROC}")
         return False
 
     if not _copy_file(elm, fname, newname):
-        logger.error(msg.ERR_FAIL_CANNOT_CREATE_DATA.format(data=f"copy {elm} file in {PROC}"))
+        logger.error(msg.ERR_FAIL_CANNOT_CREATE_DATA, data=f"copy {elm} file in {PROC}")
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return True
 
 
@@ -89,8 +89,8 @@ def _get_copy_filename(elm: ElmType, fname: str) -> str:
 
     if not is_duplicated_path_in_dir(elm, _fname):
         logger.warning(
-                msg.ERR_FAIL_MISSING_DATA_WITH_DATA.format(data=f"copy filename in {PROC}"),
-                _fname)
+                msg.ERR_FAIL_MISSING_DATA_WITH_DATA, _fname,
+                data=f"copy filename in {PROC}")
         return ""
     return _fname
 
@@ -46,23 +46,23 @@ def delete_story_source(args: Namespace) -> bool:
     assert isinstance(args, Namespace)
     assert has_cmd_of(args, CmdType.DELETE)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     if not is_enable_elm_in(args, ENABLE_ELMS):
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
         return False
 
     elm = elm_from(args)
     fname = _get_remove_filename(elm, args.option)
     if not fname:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"delete filename in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"delete filename in {PROC}")
         return False
 
     if not _remove_file(elm, fname):
-        logger.error(msg.ERR_FAIL_CANNOT_REMOVE_DATA.format(data=f"remove file in {PROC}"))
+        logger.error(msg.ERR_FAIL_CANNOT_REMOVE_DATA, data=f"remove file in {PROC}")
         return False
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return True
 
 
@@ -76,8 +76,8 @@ def _get_remove_filename(elm: ElmType, fname: str) -> str:
 
     if not is_duplicated_path_in_dir(elm, _fname):
         logger.warning(
-                msg.ERR_FAIL_MISSING_DATA_WITH_DATA.format(data=f"remove filename in {PROC}"),
-                _fname)
+                msg.ERR_FAIL_MISSING_DATA_WITH_DATA, _fname,
+                data=f"remove filename in {PROC}")
         return ""
     return _fname
 
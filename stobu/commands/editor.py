@@ -53,21 +53,21 @@ def edit_story_source(args: Namespace) -> bool:
     assert isinstance(args, Namespace)
     assert has_cmd_of(args, CmdType.EDIT)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
     if not is_enable_elm_in(args, ENABLE_ELMS):
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
         return False
 
     elm = elm_from(args)
     fname = _get_edit_filename(elm, args.option)
     if not fname:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"copy filename in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"copy filename in {PROC}")
         return False
 
     if not _edit_file(elm, fname):
-        logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"edit {elm} file in {PROC}"))
+        logger.error(msg.ERR_FAIL_SUBPROCESS, proc=f"edit {elm} file in {PROC}")
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return True
 
 
@@ -80,7 +80,7 @@ def _edit_file(elm: ElmType, fname: str) -> bool:
     path = filepath_of(elm, fname)
     proc = subprocess.run([editor, path])
     if proc.returncode != 0:
-        logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"edit file in {PROC}"))
+        logger.error(msg.ERR_FAIL_SUBPROCESS, proc=f"edit file in {PROC}")
 
     return True
 
@@ -94,8 +94,8 @@ def _get_edit_filename(elm: ElmType, fname: str) -> str:
 
     if not is_duplicated_path_in_dir(elm, _fname):
         logger.warning(
-                msg.ERR_FAIL_MISSING_DATA_WITH_DATA.format(data=f"edit filename in {PROC}"),
-                _fname)
+                msg.ERR_FAIL_MISSING_DATA_WITH_DATA, _fname,
+                data=f"edit filename in {PROC}")
         return ""
     return _fname
 
@@ -50,47 +50,47 @@ def init_project(args: Namespace) -> bool:
     assert isinstance(args, Namespace)
     assert has_cmd_of(args, CmdType.INIT)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     if not check_and_create_directories():
-        logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"check and create dirs in {PROC}"))
+        logger.error(msg.ERR_FAIL_SUBPROCESS, proc=f"check and create dirs in {PROC}")
         return False
 
     if not check_and_create_default_files():
-        logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"check and create files in {PROC}"))
+        logger.error(msg.ERR_FAIL_SUBPROCESS, proc=f"check and create files in {PROC}")
         return False
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return True
 
 
 def check_and_create_directories() -> bool:
     _PROC = f"{PROC}: check and create dirs"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     for elm, dirpath in DIRS_TABLE.items():
         if dirpath:
             if not _safe_create_directory(dirpath_of(elm)):
-                logger.error(msg.ERR_FAIL_CANNOT_CREATE_DATA.format(data=f"{dirpath} in {_PROC}"))
+                logger.error(msg.ERR_FAIL_CANNOT_CREATE_DATA, data=f"{dirpath} in {_PROC}")
                 return False
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return True
 
 
 def check_and_create_default_files() -> bool:
     _PROC = f"{PROC}: check and create files"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     for elm in BASE_FILES:
         path = filepath_of(elm, BASE_FILE_TABLE[elm])
         if not is_exists_path(path):
             data = get_template_data(elm)
             if not write_file(path, data):
-                logger.warning(msg.ERR_FAIL_CANNOT_CREATE_DATA.format(data=f"{str(elm)} in {_PROC}"))
+                logger.warning(msg.ERR_FAIL_CANNOT_CREATE_DATA, data=f"{str(elm)} in {_PROC}")
                 return False
         else:
-            logger.debug(msg.PROC_MESSAGE.format(proc=f"Already exists {str(elm)} file in {PROC}"))
+            logger.debug(msg.PROC_MESSAGE, proc=f"Already exists {str(elm)} file in {PROC}")
             continue
 
     for elm in DEFAULT_FILES:
@@ -98,13 +98,13 @@ def check_and_create_default_files() -> bool:
         if not is_exists_path(path):
             data = get_template_data(elm)
             if not write_file(path, data):
-                logger.warning(msg.ERR_FAIL_CANNOT_CREATE_DATA.format(data=f"{str(elm)} in {_PROC}"))
+                logger.warning(msg.ERR_FAIL_CANNOT_CREATE_DATA, data=f"{str(elm)} in {_PROC}")
                 return False
         else:
-            logger.debug(msg.PROC_MESSAGE.format(proc=f"Already exists {str(elm)} file in {PROC}"))
+            logger.debug(msg.PROC_MESSAGE, proc=f"Already exists {str(elm)} file in {PROC}")
             continue
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return True
 
 
@@ -115,6 +115,6 @@ def _safe_create_directory(dirpath: str) -> bool:
     if not is_exists_path(dirpath):
         os.makedirs(dirpath)
     else:
-        logger.debug(msg.PROC_MESSAGE.format(proc=f"Already exists {dirpath} in {PROC}"))
+        logger.debug(msg.PROC_MESSAGE, proc=f"Already exists {dirpath} in {PROC}")
 
     return True
@@ -2,7 +2,6 @@
 
 # Officiali Libraries
 from argparse import Namespace
-import yaml
 
 
 # My Modules
@@ -10,6 +9,7 @@ from stobu.syss import messages as msg
 from stobu.tools.cmdchecker import has_cmd_of
 from stobu.tools.datareader import get_order_data
 from stobu.tools.elmchecker import is_enable_elm_in, elm_from
+from stobu.tools.filedatareader import dump_yaml_data
 from stobu.tools.pathgetter import filepaths_by_elm
 from stobu.types.command import CmdType
 from stobu.types.element import ElmType
@@ -47,19 +47,19 @@ def show_list_of_story_sources(args: Namespace) -> bool:
     assert isinstance(args, Namespace)
     assert has_cmd_of(args, CmdType.LIST)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     if not is_enable_elm_in(args, ENABLE_ELMS):
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
         return False
 
     elm = elm_from(args)
 
     if not _show_list(elm):
-        logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"show list in {PROC}"))
+        logger.error(msg.ERR_FAIL_SUBPROCESS, proc=f"show list in {PROC}")
         return False
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return True
 
 
@@ -85,7 +85,7 @@ def _show_list_of_files(elm: ElmType) -> bool:
 
 
 def _show_list_of_order() -> bool:
-    data = yaml.safe_dump(get_order_data())
+    data = dump_yaml_data(get_order_data())
 
     print("#### Orders ####")
     print(data)
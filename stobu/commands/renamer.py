@@ -45,28 +45,28 @@ ENABLE_ELMS = [
 def rename_story_source(args: Namespace) -> bool:
     assert isinstance(args, Namespace)
     assert has_cmd_of(args, CmdType.RENAME)
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     if not is_enable_elm_in(args, ENABLE_ELMS):
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
         return False
 
     elm = elm_from(args)
     fname = _get_rename_filename(elm, args.option)
     if not fname:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"delete filename in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"delete filename in {PROC}")
         return False
 
     newname = _get_renamed_name(elm)
     if not newname:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"rename name in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"rename name in {PROC}")
         return False
 
     if not _rename_file(elm, fname, newname):
-        logger.error(msg.ERR_FAIL_CANNOT_REMOVE_DATA.format(data=f"rename file in {PROC}"))
+        logger.error(msg.ERR_FAIL_CANNOT_REMOVE_DATA, data=f"rename file in {PROC}")
         return False
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return True
 
 
@@ -84,8 +84,8 @@ def _rename_file(elm: ElmType, fname: str, newname: str) -> bool:
         return True
     else:
         logger.error(
-                msg.ERR_FAIL_INVALID_DATA_WITH_DATA.format(data=f"rename file in {PROC}"),
-                newpath)
+                msg.ERR_FAIL_INVALID_DATA_WITH_DATA, newpath,
+                data=f"rename file in {PROC}")
         return False
 
 
@@ -98,8 +98,8 @@ def _get_rename_filename(elm: ElmType, fname: str) -> str:
 
     if not is_duplicated_path_in_dir(elm, _fname):
         logger.warning(
-                msg.ERR_FAIL_MISSING_DATA_WITH_DATA.format(data=f"rename filename in {PROC}"),
-                _fname)
+                msg.ERR_FAIL_MISSING_DATA_WITH_DATA, _fname,
+                data=f"rename filename in {PROC}")
         return ""
     return _fname
 
@@ -111,6 +111,6 @@ def _get_renamed_name(elm: ElmType) -> str:
 
     if is_duplicated_path_in_dir(elm, _fname):
         logger.warning(
-                msg.ERR_FAIL_DUPLICATED_DATA.format(data=f"new name for renaming in {PROC}"))
+                msg.ERR_FAIL_DUPLICATED_DATA, data=f"new name for renaming in {PROC}")
         return ""
     return _fname
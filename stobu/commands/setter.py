@@ -38,10 +38,10 @@ def set_project_data(args: Namespace) -> bool:
     assert isinstance(args, Namespace)
     assert has_cmd_of(args, CmdType.SET)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     if not _is_enable_setelm(args):
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"set element type in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"set element type in {PROC}")
         return False
 
     elm = _setelm_from(args)
@@ -50,13 +50,13 @@ def set_project_data(args: Namespace) -> bool:
     if SetElmType.EDITOR is elm:
         is_succeeded = set_editor()
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"set element type in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"set element type in {PROC}")
 
     if not is_succeeded:
-        logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"in {PROC}"))
+        logger.error(msg.ERR_FAIL_SUBPROCESS, proc=f"in {PROC}")
         return False
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return True
 
 
@@ -66,11 +66,11 @@ def set_editor() -> bool:
 
     newname = _get_new_editorname(name)
     if not newname:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"in {PROC}")
         return False
 
     if not write_project_data(ProjectItem.EDITOR, newname):
-        logger.error(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"new editor name in {PROC}"))
+        logger.error(msg.ERR_FAIL_CANNOT_WRITE_DATA, data=f"new editor name in {PROC}")
         return False
 
     return True
@@ -82,7 +82,7 @@ def _get_new_editorname(name: str) -> str:
 
     _name = input(f"> Please Enter changing new editor name from '{name}': ")
     if not _name:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"new editor name in {PROC}"))
+        logger.error(msg.ERR_FAIL_MISSING_DATA, data=f"new editor name in {PROC}")
         return ""
     return _name
 
@@ -0,0 +1,163 @@
+"""Watch project module."""
+
+# Official Libraries
+import os
+import time
+from argparse import Namespace
+
+
+# My Modules
+from stobu.commands.builder import build_project_with_cache
+from stobu.syss import messages as msg
+from stobu.tools.buildcache import BuildCache, load_build_cache, save_build_cache
+from stobu.tools.cmdchecker import has_cmd_of
+from stobu.tools.pathgetter import filepath_of, filepaths_by_elm, get_project_path
+from stobu.tools.projectdatacache import ProjectDataCache
+from stobu.types.command import CmdType
+from stobu.types.element import ElmType
+from stobu.utils.filepath import basename_of
+from stobu.utils.log import logger
+
+
+__all__ = (
+        'watch_project',
+        )
+
+
+# Define Constants
+PROC = 'COMMAND WATCH'
+
+
+WATCH_DIR_ELMS = [
+        ElmType.CHAPTER,
+        ElmType.EPISODE,
+        ElmType.SCENE,
+        ElmType.EVENT,
+        ElmType.ITEM,
+        ElmType.PERSON,
+        ElmType.STAGE,
+        ElmType.WORD,
+        ]
+"""list: elements whose directories are watched."""
+
+
+WATCH_FILE_ELMS = [
+        ElmType.BOOK,
+        ElmType.FIXTURE,
+        ElmType.MOB,
+        ElmType.ORDER,
+        ElmType.RUBI,
+        ElmType.TERM,
+        ElmType.TIME,
+        ]
+"""list: elements of the base files watched in the project root."""
+
+
+STORY_ELMS = [
+        ElmType.CHAPTER,
+        ElmType.EPISODE,
+        ElmType.ORDER,
+        ElmType.SCENE,
+        ]
+"""list: elements which do not change the name tags and the other project data."""
+
+
+# Main
+def watch_project(args: Namespace) -> bool:
+    assert isinstance(args, Namespace)
+    assert has_cmd_of(args, CmdType.WATCH)
+
+    logger.debug(msg.PROC_START, proc=PROC)
+
+    cache = BuildCache() if args.rebuild else load_build_cache()
+    project_data = ProjectDataCache(cache)
+    snapshot = _snapshot_of_project()
+
+    _rebuild(args, cache, project_data, 'start')
+
+    print(f"#### Watching {get_project_path()} (Ctrl-C to stop) ####")
+
+    try:
+        while True:
+            time.sleep(args.interval)
+
+            current = _snapshot_of_project()
+            changed = _changed_elms_of(snapshot, current)
+            snapshot = current
+            if not changed:
+                continue
+
+            # NOTE: 物語以外（人物等）が変わった時だけタグ等を作り直す
+            if not all(elm in STORY_ELMS for elm in changed.values()):
+                project_data = ProjectDataCache(cache)
+
+            names = ", ".join(sorted(basename_of(path) for path in changed.keys()))
+            if not _rebuild(args, cache, project_data, names):
+                # NOTE: 途中で失敗したデータは使い回さない
+                project_data = ProjectDataCache(cache)
+    except KeyboardInterrupt:
+        print("")
+    finally:
+        if not save_build_cache(cache):
+            logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA, data=f"build cache in {PROC}")
+
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
+    return True
+
+
+# Private Functions
+def _changed_elms_of(snapshot: dict, current: dict) -> dict:
+    assert isinstance(snapshot, dict)
+    assert isinstance(current, dict)
+
+    tmp = {}
+
+    for path, state in current.items():
+        if snapshot.get(path) != state:
+            tmp[path] = state[0]
+
+    for path, state in snapshot.items():
+        if path not in current:
+            tmp[path] = state[0]
+
+    return tmp
+
+
+def _rebuild(args: Namespace, cache: BuildCache, project_data: ProjectDataCache,
+        changed: str) -> bool:
+    assert isinstance(args, Namespace)
+    assert isinstance(cache, BuildCache)
+    assert isinstance(project_data, ProjectDataCache)
+    assert isinstance(changed, str)
+
+    start = time.perf_counter()
+    try:
+        is_succeeded = build_project_with_cache(args, cache, project_data)
+    except Exception as err:
+        # NOTE: 編集途中のファイル等で失敗しても監視は続ける
+        logger.error(msg.ERR_FAILED_PROC, proc=f"rebuild of {changed} in {PROC}: {err}")
+        return False
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if is_succeeded:
+        print(f"> rebuilt in {elapsed:.1f}ms: {changed}")
+    else:
+        logger.error(msg.PROC_FAILED, proc=f"rebuild of {changed} in {PROC}")
+
+    return is_succeeded
+
+
+def _snapshot_of_project() -> dict:
+    tmp = {}
+
+    paths = [(elm, path) for elm in WATCH_DIR_ELMS for path in filepaths_by_elm(elm)]
+    paths.extend((elm, filepath_of(elm, '')) for elm in WATCH_FILE_ELMS)
+
+    for elm, path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        tmp[path] = (elm, stat.st_mtime_ns, stat.st_size)
+
+    return tmp
@@ -1,12 +1,16 @@
 """Action data create module."""
 
 # Official Libraries
+from typing import Iterable, Iterator
 
 
 # My Modules
-from stobu.core.instructioner import actions_data_apply_instructions
+from stobu.core.instructioner import iter_records_applied_instructions
+from stobu.core.scenetokenizer import SceneLineError, tokenize_scene_lines
 from stobu.elms.scenes import SceneItem
 from stobu.syss import messages as msg
+from stobu.tools.buildcache import BuildCache
+from stobu.tools.pathgetter import filepath_of
 from stobu.tools.storydatareader import elm_title_of, scene_item_of, elm_data_of
 from stobu.types.action import ActionsData, ActionRecord, ActType, ActDataType
 from stobu.types.action import NORMAL_ACTIONS
@@ -14,7 +18,6 @@ from stobu.types.element import ElmType
 from stobu.types.story import StoryData, StoryRecord
 from stobu.utils import assertion
 from stobu.utils.log import logger
-from stobu.utils.strings import rid_rn, rid_head_space
 
 
 __all__ = (
@@ -26,31 +29,6 @@ __all__ = (
 PROC = 'ACTION DATA CREATOR'
 
 
-ACT_TYPE_TABLE = {
-        ActType.BE: ('be',),
-        ActType.COME: ('come',),
-        ActType.DISCARD: ('discard',),
-        ActType.DO: ('do',),
-        ActType.DRAW: ('d', 'draw',),
-        ActType.EXPLAIN: ('ex', 'explain',),
-        ActType.FACE: ('face',),
-        ActType.FEEL: ('feel',),
-        ActType.GO: ('go',),
-        ActType.HAVE: ('have',),
-        ActType.KNOW: ('know',),
-        ActType.KNOWN: ('known',),
-        ActType.OCCUR: ('occur',),
-        ActType.PUT: ('put',),
-        ActType.REMEMBER: ('rem', 'remember',),
-        ActType.RID: ('rid',),
-        ActType.TALK: ('t', 'talk',),
-        ActType.THINK: ('think',),
-        ActType.VOICE: ('voice',),
-        ActType.SAME: ('-', 'same'),
-        ActType.WEAR: ('wear',),
-        }
-
-
 TOP_LEVEL_ELMS = [
         ElmType.BOOK,
         ElmType.CHAPTER,
@@ -66,116 +44,56 @@ DATA_TITLE_TABLE = {
         }
 
 
-LINE_EMPTY = ('', '\n', '\n\r', '\r\n')
-
-LINE_COMMENT = '# '
-
-LINE_HEAD = '## '
-
-LINE_INSTRUCTION = '#! '
-
-LINE_ACTION = '['
+SCENE_HEAD_ITEMS = [
+        SceneItem.CAMERA,
+        SceneItem.STAGE,
+        SceneItem.YEAR,
+        SceneItem.DATE,
+        SceneItem.TIME,
+        ]
 
 
 # Main
-def actions_data_from(story_data: StoryData, tags: dict) -> ActionsData:
+def actions_data_from(story_data: StoryData, tags: dict, cache: BuildCache = None) -> ActionsData:
     assert isinstance(story_data, StoryData)
     assert isinstance(tags, dict)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
-    actions = conv_base_action_data_from(story_data)
-    if not actions:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"base action data in {PROC}"))
-        return None
+    # NOTE: 各段をジェネレータで繋ぎ、レコードは最後に一度だけリストにする
+    records = iter_records_applied_instructions(
+            _iter_records_if_same(_iter_base_action_records(story_data, cache)),
+            tags)
+    applied = ActionsData.trusted(list(records))
 
-    updated = update_actions_data_if_same(actions)
-    if not updated or not updated.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"update action data in {PROC}"))
+    if not applied.has_data():
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"apply action data in {PROC}")
         return None
 
-    applied = actions_data_apply_instructions(updated, tags)
-    if not applied or not isinstance(applied, ActionsData) or not applied.has_data():
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"apply action data in {PROC}"))
-        return None
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return applied
 
 
-def conv_base_action_data_from(story_data: StoryData) -> ActionsData:
-    assert isinstance(story_data, StoryData)
-
-    tmp = []
-
-    for record in story_data.get_data():
-        assert isinstance(record, StoryRecord)
-        if record.type in TOP_LEVEL_ELMS:
-            tmp.append(_record_as_title_from(record))
-        elif record.type is ElmType.SCENE:
-            tmp.extend(_conv_action_records_on_scene_from(record))
-        else:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
-            continue
-
-    return ActionsData(tmp)
-
-
-def update_actions_data_if_same(actions_data: ActionsData) -> ActionsData:
-    assert isinstance(actions_data, ActionsData)
-
-    tmp = []
-    cache = None
-
-    for record in actions_data.get_data():
-        assert isinstance(record, ActionRecord)
-        if record.type in [ActType.DATA, ActType.NONE]:
-            tmp.append(record)
-        elif record.type in NORMAL_ACTIONS + [ActType.SAME,]:
-            ret = _copy_action_record_if_same(record, cache)
-            if ret:
-                tmp.append(ret)
-                cache = ret
-        else:
-            logger.warning(msg.ERR_FAIL_UNKNOWN_DATA.format(data=f"act type in {PROC}"))
-            continue
-
-    return ActionsData(tmp)
-
-
 # Private Functions
-def _act_type_from(action: str) -> ActType:
-    assert isinstance(action, str)
-
-    for act, check in ACT_TYPE_TABLE.items():
-        if action in check:
-            return act
-    return ActType.NONE
-
+def _action_records_on_scene_from(record: StoryRecord, cache: BuildCache = None) -> list:
+    assert isinstance(record, StoryRecord)
 
-def _conv_action_record_from(line: str) -> ActionRecord:
-    assert isinstance(line, str)
+    if cache:
+        records, errors = _cached_action_records_on_scene_from(record, cache)
+    else:
+        records, errors = _conv_action_records_on_scene_from(record)
 
-    record = rid_rn(line)
+    # NOTE: キャッシュから読んだ場面でも、不正な行の警告は毎回出す
+    for error in errors:
+        assert isinstance(error, SceneLineError)
+        logger.warning(msg.ERR_FAIL_INVALID_DATA_WITH_DATA,
+                f"{record.filename}: body line {error.lineno}: {error.line}",
+                data=f"{error.reason} in {PROC}")
 
-    if record in LINE_EMPTY:
-        return None
-    elif record.startswith(LINE_COMMENT):
-        return _record_as_comment_from(record)
-    elif record.startswith(LINE_HEAD):
-        return _record_as_head_from(record)
-    elif record.startswith(LINE_INSTRUCTION):
-        return _record_as_instruction_from(record)
-    elif record.startswith(LINE_ACTION):
-        return _record_as_action_from(record)
-    elif record:
-        return _record_as_text_from(record)
-    else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"action line in {PROC}"))
-        return None
+    return records
 
 
-def _conv_action_records_on_scene_from(record: StoryRecord) -> list:
+def _conv_action_records_on_scene_from(record: StoryRecord) -> tuple:
     assert isinstance(record, StoryRecord)
     assert record.type is ElmType.SCENE
 
@@ -184,16 +102,25 @@ def _conv_action_records_on_scene_from(record: StoryRecord) -> list:
     tmp.extend(_get_scene_head_info(record))
     tmp.append(_get_record_scene_start())
 
-    for line in elm_data_of(record):
-        assert isinstance(line, str)
-        ret = _conv_action_record_from(line)
-        if ret:
-            assert isinstance(ret, ActionRecord)
-            tmp.append(ret)
+    records, errors = tokenize_scene_lines(elm_data_of(record))
+    tmp.extend(records)
 
     tmp.append(_get_record_scene_end())
 
-    return tmp
+    return tmp, errors
+
+
+def _cached_action_records_on_scene_from(record: StoryRecord, cache: BuildCache) -> tuple:
+    assert isinstance(record, StoryRecord)
+    assert isinstance(cache, BuildCache)
+
+    # NOTE: 同・翌日などの解決後の値でキャッシュを区別する
+    headers = tuple(str(scene_item_of(record, item)) for item in SCENE_HEAD_ITEMS)
+
+    return cache.action_records_of(
+            filepath_of(ElmType.SCENE, record.filename),
+            headers,
+            lambda: _conv_action_records_on_scene_from(record))
 
 
 def _copy_action_record_if_same(record: ActionRecord, cache: ActionRecord) -> ActionRecord:
@@ -245,58 +172,36 @@ def _is_same_mark(text: str) -> bool:
     return text in ('-', 'same')
 
 
-def _record_as_action_from(line: str) -> ActionRecord:
-    assert isinstance(line, str)
-
-    tmp = line
-    comment = ''
-    if '# ' in line:
-        tmp, comment = line.split('# ')
-    cmd, desc = tmp[1:].split(']')
-    subject, act, outline = cmd.split(':')
-    return ActionRecord(
-            _act_type_from(act),
-            ActDataType.NONE,
-            subject,
-            outline,
-            rid_head_space(desc),
-            note=comment)
-
-
-def _record_as_comment_from(line: str) -> ActionRecord:
-    assert isinstance(line, str)
-
-    comment = line.replace('# ', '')
-    return ActionRecord(
-            ActType.DATA,
-            ActDataType.COMMENT,
-            comment)
-
-
-def _record_as_head_from(line: str) -> ActionRecord:
-    assert isinstance(line, str)
-
-    title = line.replace('## ', '')
-    return ActionRecord(
-            ActType.DATA,
-            ActDataType.SCENE_HEAD,
-            title)
+def _iter_base_action_records(story_data: StoryData, cache: BuildCache = None) -> Iterator:
+    assert isinstance(story_data, StoryData)
 
+    for record in story_data.get_data():
+        assert isinstance(record, StoryRecord)
+        if record.type in TOP_LEVEL_ELMS:
+            yield _record_as_title_from(record)
+        elif record.type is ElmType.SCENE:
+            yield from _action_records_on_scene_from(record, cache)
+        else:
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
+            continue
 
-def _record_as_instruction_from(line: str) -> ActionRecord:
-    assert isinstance(line, str)
 
-    tmp = line.replace('#! ', '')
-    instruction = tmp
-    outline = ''
-    if ' ' in tmp:
-        instruction, outline = tmp.split(' ')
+def _iter_records_if_same(records: Iterable) -> Iterator:
+    same_actions = set(NORMAL_ACTIONS + [ActType.SAME])
+    last = None
 
-    return ActionRecord(
-            ActType.DATA,
-            ActDataType.INSTRUCTION,
-            instruction,
-            outline)
+    for record in records:
+        assert isinstance(record, ActionRecord)
+        if record.type in (ActType.DATA, ActType.NONE):
+            yield record
+        elif record.type in same_actions:
+            ret = _copy_action_record_if_same(record, last)
+            if ret:
+                yield ret
+                last = ret
+        else:
+            logger.warning(msg.ERR_FAIL_UNKNOWN_DATA, data=f"act type in {PROC}")
+            continue
 
 
 def _record_as_scene_camera_from(record: StoryRecord) -> ActionRecord:
@@ -339,17 +244,6 @@ def _record_as_scene_year_from(record: StoryRecord) -> ActionRecord:
             scene_item_of(record, SceneItem.YEAR))
 
 
-def _record_as_text_from(line: str) -> ActionRecord:
-    assert isinstance(line, str)
-
-    return ActionRecord(
-            ActType.DO,
-            ActDataType.TEXT,
-            '',
-            rid_head_space(line),
-            rid_head_space(line))
-
-
 def _record_as_title_from(record: StoryRecord) -> ActionRecord:
     assert isinstance(record, StoryRecord)
 
@@ -12,7 +12,7 @@ from stobu.formats.common import get_breakline_list
 from stobu.formats.content import format_contents_data
 from stobu.syss import messages as msg
 from stobu.tools.elmchecker import is_enable_the_elm
-from stobu.tools.translater import translate_tags_str
+from stobu.tools.translater import TagTranslator, translate_tags_str
 from stobu.types.content import ContentsData, ContentRecord
 from stobu.types.element import ElmType
 from stobu.types.output import OutputsData
@@ -52,19 +52,19 @@ def contents_data_from(story_data: StoryData, tags: dict) -> ContentsData:
     assert isinstance(story_data, StoryData)
     assert isinstance(tags, dict)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     contents = _contents_data_from(story_data)
     if not contents or not contents.has_data():
-        logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"contents data in {PROC}"))
+        logger.error(msg.ERR_FAIL_SUBPROCESS, proc=f"contents data in {PROC}")
         return None
 
     translated = _translate_contents_data(contents, tags)
     if not translated or not translated.has_data():
-        logger.error(msg.ERR_FAIL_SUBPROCESS.format(proc=f"translate data in {PROC}"))
+        logger.error(msg.ERR_FAIL_SUBPROCESS, proc=f"translate data in {PROC}")
         return None
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return translated
 
 
@@ -73,7 +73,7 @@ def outputs_data_from_contents_data(contents_data: ContentsData) -> OutputsData:
 
     formatted = assertion.is_list(format_contents_data(contents_data))
 
-    return OutputsData(formatted + get_breakline_list())
+    return OutputsData.trusted(formatted + get_breakline_list())
 
 
 # Private Functions
@@ -84,7 +84,7 @@ def _content_record_of(record: StoryRecord, index: int) -> ContentRecord:
     elm = assertion.is_instance(record.type, ElmType)
 
     if not str(TITLE_ELMS[elm]) in record.data:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"content record in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"content record in {PROC}")
         return None
 
     title = record.data[str(TITLE_ELMS[elm])]
@@ -111,30 +111,31 @@ def _contents_data_from(story_data: StoryData) -> ContentsData:
                 tmp.append(ret)
                 idx[record.type] += 1
         else:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
 
-    return ContentsData(tmp)
+    return ContentsData.trusted(tmp)
 
 
 def _translate_contents_data(contents_data: ContentsData, tags: dict) -> ContentsData:
     assert isinstance(contents_data, ContentsData)
     assert isinstance(tags, dict)
 
+    translator = TagTranslator(tags)
     tmp = []
 
     for record in contents_data.get_data():
         assert isinstance(record, ContentRecord)
-        tmp.append(_translate_record(record, tags))
+        tmp.append(_translate_record(record, translator))
 
-    return ContentsData(tmp)
+    return ContentsData.trusted(tmp)
 
 
-def _translate_record(record: ContentRecord, tags: dict) -> ContentRecord:
+def _translate_record(record: ContentRecord, translator: TagTranslator) -> ContentRecord:
     assert isinstance(record, ContentRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(translator, TagTranslator)
 
     return ContentRecord(
             record.type,
-            translate_tags_str(record.title, tags),
+            translate_tags_str(record.title, translator),
             record.index,
             )
@@ -1,18 +1,19 @@
 """Instruction module."""
 
 # Official Libraries
+from typing import Iterable, Iterator
 
 
 # My Modules
 from stobu.syss import messages as msg
-from stobu.tools.translater import translate_tags_str
-from stobu.types.action import ActDataType, ActionRecord, ActionsData, ActType
+from stobu.tools.translater import TagTranslator, translate_tags_str
+from stobu.types.action import ActDataType, ActionRecord, ActType
 from stobu.types.action import NORMAL_ACTIONS
 from stobu.utils.log import logger
 
 
 __all__ = (
-        'actions_data_apply_instructions',
+        'iter_records_applied_instructions',
         )
 
 
@@ -34,65 +35,67 @@ INST_PAYOFF = ('PO', 'DISFLAG', 'payoff')
 
 
 # Main
-def actions_data_apply_instructions(actions_data: ActionsData, tags: dict) -> ActionsData:
-    assert isinstance(actions_data, ActionsData)
+def iter_records_applied_instructions(records: Iterable, tags: dict) -> Iterator:
+    """Stream the action records, applying the instructions and the aliases of each scene."""
     assert isinstance(tags, dict)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
-
-    tmp = []
+    names = TagTranslator(tags)
     alias = {}
+    translator = None
 
     # TODO: パラグラフはパラグラフのActDataTypeで制御し、インデントやBRはここでは命令分以外は入れない
-    for record in actions_data.get_data():
+    for record in records:
         assert isinstance(record, ActionRecord)
         if ActDataType.INSTRUCTION is record.subtype:
             if record.subject in INST_PARAGRAPH_START:
-                tmp.append(_get_record_as_paragraph_start())
+                yield _get_record_as_paragraph_start()
             elif record.subject in INST_PARAGRAPH_END:
-                tmp.append(_get_record_as_paragraph_end())
+                yield _get_record_as_paragraph_end()
             elif record.subject in INST_BREAK:
-                tmp.append(_get_record_as_br())
+                yield _get_record_as_br()
             elif record.subject in INST_ALIAS:
                 short, origin = record.outline.split('=')
                 alias[short] = origin
+                # NOTE: 別名が増えた時だけ変換器を作り直し、次の場面開始まで使い回す
+                translator = TagTranslator(dict(alias))
             elif record.subject in INST_FORESHADOW:
-                tmp.append(_record_as_foreshadow_from(record, tags))
+                yield _record_as_foreshadow_from(record, names)
             elif record.subject in INST_PAYOFF:
-                tmp.append(_record_as_payoff_from(record, tags))
+                yield _record_as_payoff_from(record, names)
             else:
-                logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"instruction type in {PROC}"))
+                logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"instruction type in {PROC}")
                 continue
         elif ActDataType.SCENE_START is record.subtype:
             alias = {}
-            tmp.append(record)
-        elif record.type in NORMAL_ACTIONS:
-            tmp.append(_conv_shorter_by_alias(record, alias))
+            translator = None
+            yield record
+        elif translator and record.type in NORMAL_ACTIONS:
+            yield _conv_shorter_by_alias(record, translator)
         else:
-            tmp.append(record)
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-    return ActionsData(tmp)
+            yield record
 
 
 # Private Functions
-def _conv_shorter_by_alias(record: ActionRecord, alias: dict) -> ActionRecord:
+def _conv_shorter_by_alias(record: ActionRecord, translator: TagTranslator) -> ActionRecord:
     assert isinstance(record, ActionRecord)
-    assert isinstance(alias, dict)
+    assert isinstance(translator, TagTranslator)
 
-    subject = record.subject
+    subject = translator.tags.get(record.subject, record.subject)
+    outline = translator.translated(record.outline)
+    desc = translator.translated(record.desc)
+    note = translator.translated(record.note)
 
-    if record.subject in alias.keys():
-        subject = alias[record.subject]
+    if (subject, outline, desc, note) == (record.subject, record.outline, record.desc, record.note):
+        return record
 
     return ActionRecord(
             record.type,
             record.subtype,
             subject,
-            translate_tags_str(record.outline, alias),
-            translate_tags_str(record.desc, alias),
+            outline,
+            desc,
             record.flags,
-            translate_tags_str(record.note, alias),
+            note,
             )
 
 
@@ -108,16 +111,16 @@ def _get_record_as_paragraph_start() -> ActionRecord:
     return ActionRecord(ActType.DATA, ActDataType.PARAGRAPH_START, '')
 
 
-def _record_as_foreshadow_from(record: ActionRecord, tags: dict) -> ActionRecord:
+def _record_as_foreshadow_from(record: ActionRecord, names: TagTranslator) -> ActionRecord:
     assert isinstance(record, ActionRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(names, TagTranslator)
 
     subject, flag = '', record.outline
 
     if ':' in record.outline:
         subject, flag = record.outline.split(':')
         if subject:
-            subject = translate_tags_str(subject, tags, True, None)
+            subject = translate_tags_str(subject, names, True, None)
 
     return ActionRecord(
             ActType.DATA,
@@ -126,16 +129,16 @@ def _record_as_foreshadow_from(record: ActionRecord, tags: dict) -> ActionRecord
             flag)
 
 
-def _record_as_payoff_from(record: ActionRecord, tags: dict) -> ActionRecord:
+def _record_as_payoff_from(record: ActionRecord, names: TagTranslator) -> ActionRecord:
     assert isinstance(record, ActionRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(names, TagTranslator)
 
     subject, flag = '', record.outline
 
     if ':' in record.outline:
         subject, flag = record.outline.split(':')
         if subject:
-            subject = translate_tags_str(subject, tags, True, None)
+            subject = translate_tags_str(subject, names, True, None)
 
     return ActionRecord(
             ActType.DATA,
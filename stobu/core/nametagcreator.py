@@ -13,14 +13,14 @@ from stobu.elms.stages import StageItem
 from stobu.elms.times import TimeItem
 from stobu.elms.words import WordItem
 from stobu.syss import messages as msg
-from stobu.tools.datareader import get_person_data, get_mob_data, get_time_data, get_book_data
+from stobu.tools.datareader import get_mob_data, get_time_data, get_book_data
 from stobu.tools.datareader import get_fixture_data, get_term_data
-from stobu.tools.filedatareader import read_markdown_data_as_yaml
-from stobu.tools.pathgetter import filepaths_by_elm
+from stobu.tools.projectdatacache import filepaths_by_elm_with_cache, read_elm_data_with_cache
+from stobu.tools.projectdatacache import value_with_cache
+from stobu.tools.translater import TagTranslator
 from stobu.types.element import ElmType
 from stobu.utils import assertion
 from stobu.utils.dicts import combine_dicts, dict_sorted
-from stobu.utils.fileio import read_file
 from stobu.utils.filepath import basename_of
 from stobu.utils.log import logger
 from stobu.utils.strings import hankaku_to_zenkaku
@@ -28,6 +28,7 @@ from stobu.utils.strings import hankaku_to_zenkaku
 
 __all__ = (
         'get_calling_tags',
+        'get_calling_translators',
         'get_nametags',
         )
 
@@ -65,45 +66,17 @@ TAG_PREFIX_ELMS = {
 
 # Main
 def get_calling_tags() -> dict:
-    tmp = {}
-
-    persons = filepaths_by_elm(ElmType.PERSON)
+    # NOTE: 各所から何度も呼ばれるのでビルド中は一度だけ作る
+    return value_with_cache('calling tags', _calling_tags_from_persons)
 
-    for fname in persons:
-        data = get_person_data(fname)
-        name = data[str(PersonItem.NAME)]
-        calling = data[str(PersonItem.CALLING)]
-        calling['S'] = name
-        calling['M'] = calling['me'] if 'me' in calling else '私'
-        tmp[basename_of(fname)] = calling
 
-    return tmp
+def get_calling_translators() -> dict:
+    # NOTE: 人物ごとの呼び方の変換器も一度だけ作り、各出力で使い回す
+    return value_with_cache('calling translators', _calling_translators_from_tags)
 
 
 def get_nametags() -> dict:
-    logger.debug(msg.PROC_START.format(proc=PROC))
-
-    tmp = _add_mob_tags()
-
-    tmp = combine_dicts(tmp, _add_time_tags())
-
-    tmp = combine_dicts(tmp, _add_fixture_tags())
-
-    tmp = combine_dicts(tmp, _add_term_tags())
-
-    for elm in NAME_ELMS:
-        paths = filepaths_by_elm(elm)
-        for path in paths:
-            if not _append_tag(tmp, elm, path):
-                logger.warning(msg.ERR_FAIL_INVALID_DATA.format(
-                    data='appen key or value: {PROC}'))
-            if ElmType.PERSON is elm:
-                if not _append_person_fullname(tmp, path):
-                    logger.warning(msg.ERR_FAIL_INVALID_DATA.format(
-                        data='append full name: {PROC}'))
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-    return dict_sorted(tmp, True)
+    return value_with_cache('name tags', _nametags_from_elms)
 
 
 # Private Functions
@@ -157,12 +130,12 @@ def _append_key_and_value(data: dict, key: str, value: str) -> bool:
     return True
 
 
-def _append_tag(data: dict, elm: ElmType, path: str) -> bool:
+def _append_tag(data: dict, elm: ElmType, path: str, elm_data: dict) -> bool:
     assert isinstance(data, dict)
     assert isinstance(elm, ElmType)
     assert isinstance(path, str)
+    assert isinstance(elm_data, dict)
 
-    elm_data = read_markdown_data_as_yaml(read_file(path))
     val = elm_data[str(TAG_VALUE_ELMS[elm])]
     with_prefix = f"{TAG_PREFIX_ELMS[elm]}_{basename_of(path)}"
 
@@ -170,11 +143,11 @@ def _append_tag(data: dict, elm: ElmType, path: str) -> bool:
             or _append_key_and_value(data, with_prefix, val)
 
 
-def _append_person_fullname(data: dict, path: str) -> bool:
+def _append_person_fullname(data: dict, path: str, elm_data: dict) -> bool:
     assert isinstance(data, dict)
     assert isinstance(path, str)
+    assert isinstance(elm_data, dict)
 
-    elm_data = read_markdown_data_as_yaml(read_file(path))
     basetag = basename_of(path)
     name = elm_data[str(PersonItem.NAME)]
     fullname = elm_data[str(PersonItem.FULLNAE)]
@@ -184,3 +157,49 @@ def _append_person_fullname(data: dict, path: str) -> bool:
             and _append_key_and_value(data, f"ln_{basetag}", last) \
             and _append_key_and_value(data, f"full_{basetag}", f"{last}{first}") \
             and _append_key_and_value(data, f"efull_{basetag}", f"{first}・{last}")
+
+
+def _calling_tags_from_persons() -> dict:
+    tmp = {}
+
+    persons = filepaths_by_elm_with_cache(ElmType.PERSON)
+
+    for path in persons:
+        data = read_elm_data_with_cache(path)
+        name = data[str(PersonItem.NAME)]
+        # NOTE: 読み込んだデータはキャッシュと共有しているので複製してから追加する
+        calling = dict(data[str(PersonItem.CALLING)])
+        calling['S'] = name
+        calling['M'] = calling['me'] if 'me' in calling else '私'
+        tmp[basename_of(path)] = calling
+
+    return tmp
+
+
+def _calling_translators_from_tags() -> dict:
+    return {key: TagTranslator(calling) for key, calling in get_calling_tags().items()}
+
+
+def _nametags_from_elms() -> dict:
+    logger.debug(msg.PROC_START, proc=PROC)
+
+    tmp = _add_mob_tags()
+
+    tmp = combine_dicts(tmp, _add_time_tags())
+
+    tmp = combine_dicts(tmp, _add_fixture_tags())
+
+    tmp = combine_dicts(tmp, _add_term_tags())
+
+    for elm in NAME_ELMS:
+        paths = filepaths_by_elm_with_cache(elm)
+        for path in paths:
+            elm_data = read_elm_data_with_cache(path)
+            if not _append_tag(tmp, elm, path, elm_data):
+                logger.warning(msg.ERR_FAIL_INVALID_DATA, data='appen key or value: {PROC}')
+            if ElmType.PERSON is elm:
+                if not _append_person_fullname(tmp, path, elm_data):
+                    logger.warning(msg.ERR_FAIL_INVALID_DATA, data='append full name: {PROC}')
+
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
+    return dict_sorted(tmp, True)
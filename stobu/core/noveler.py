@@ -1,23 +1,25 @@
 """Build Novel module."""
 
 # Official Libraries
+from typing import Iterator
 
 
 # My Modules
-from stobu.core.nametagcreator import get_calling_tags
-from stobu.formats.novel import format_novels_data
+from stobu.core.nametagcreator import get_calling_translators
+from stobu.formats.common import iter_translated_formatted, outputs_data_from_formatted
+from stobu.formats.novel import format_novels_data, iter_novels_formatted
 from stobu.syss import messages as msg
-from stobu.tools.translater import translate_tags_text_list, translate_tags_str
+from stobu.tools.translater import TagTranslator, translate_tags_str
 from stobu.types.action import ActDataType, ActionRecord, ActionsData, ActType
 from stobu.types.action import NORMAL_ACTIONS
 from stobu.types.action import TITLE_ACTIONS
 from stobu.types.novel import NovelRecord, NovelsData, NovelType
 from stobu.types.output import OutputsData
-from stobu.utils.dicts import dict_sorted
 from stobu.utils.log import logger
 
 
 __all__ = (
+        'iter_outputs_from_novels_data',
         'novels_data_from',
         'outputs_data_from_novels_data',
         )
@@ -45,11 +47,21 @@ ACTIONS = [
 
 
 # Main
+def iter_outputs_from_novels_data(novels_data: NovelsData, tags: dict,
+        is_comment: bool = False) -> Iterator:
+    """Yield the translated output lines and the marks, to stream them into a sink."""
+    assert isinstance(novels_data, NovelsData)
+    assert isinstance(tags, dict)
+    assert isinstance(is_comment, bool)
+
+    return iter_translated_formatted(iter_novels_formatted(novels_data, is_comment), tags)
+
+
 def novels_data_from(actions_data: ActionsData, tags: dict) -> NovelsData:
     assert isinstance(actions_data, ActionsData)
     assert isinstance(tags, dict)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     base_data = _base_novels_data_from(actions_data)
 
@@ -57,8 +69,8 @@ def novels_data_from(actions_data: ActionsData, tags: dict) -> NovelsData:
 
     eliminated = _eliminate_empty_records(updated)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-    return NovelsData(eliminated)
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
+    return NovelsData.trusted(eliminated)
 
 
 def outputs_data_from_novels_data(novels_data: NovelsData, tags: dict,
@@ -68,14 +80,14 @@ def outputs_data_from_novels_data(novels_data: NovelsData, tags: dict,
     assert isinstance(is_comment, bool)
 
     _PROC = f"{PROC}: convert outputs data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     formatted = format_novels_data(novels_data, is_comment)
 
-    translated = translate_tags_text_list(formatted, tags)
+    translated = outputs_data_from_formatted(formatted, tags)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
-    return OutputsData(translated)
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
+    return translated
 
 
 def update_data_tags(origin_data: list, tags: dict) -> list:
@@ -83,12 +95,13 @@ def update_data_tags(origin_data: list, tags: dict) -> list:
     assert isinstance(tags, dict)
 
     tmp = []
-    callings = get_calling_tags()
+    translator = TagTranslator(tags)
+    callings = get_calling_translators()
 
     for record in origin_data:
         assert isinstance(record, NovelRecord)
         if record.type in ACTIONS:
-            tmp.append(_update_tags_desc_record(record, tags, callings))
+            tmp.append(_update_tags_desc_record(record, translator, callings))
         else:
             tmp.append(record)
 
@@ -126,7 +139,8 @@ def _base_novels_data_from(actions_data: ActionsData) -> list:
             elif record.subtype in [ActDataType.FORESHADOW, ActDataType.PAYOFF]:
                 continue
             else:
-                logger.warning(msg.ERR_FAIL_INVALID_DATA_WITH_DATA.format(data=f"act data type in {PROC}"), record.subtype)
+                logger.warning(msg.ERR_FAIL_INVALID_DATA_WITH_DATA, record.subtype,
+                        data=f"act data type in {PROC}")
                 continue
         elif record.type in NORMAL_ACTIONS:
             if ActType.TALK is record.type:
@@ -136,7 +150,7 @@ def _base_novels_data_from(actions_data: ActionsData) -> list:
         elif record.type in [ActType.NONE, ActType.SAME]:
             continue
         else:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"act type in {PROC}"))
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"act type in {PROC}")
             continue
 
     return tmp
@@ -221,26 +235,26 @@ def _title_type_of(record: ActionRecord) -> NovelType:
     elif ActDataType.SCENE_HEAD:
         return NovelType.TITLE_TEXT
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"title type in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"title type in {PROC}")
         return NovelType.NONE
 
 
-def _update_tags_desc_record(record: NovelRecord, tags: dict, callings: dict) -> NovelRecord:
+def _update_tags_desc_record(record: NovelRecord, translator: TagTranslator, callings: dict) -> NovelRecord:
     assert isinstance(record, NovelRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(translator, TagTranslator)
     assert isinstance(callings, dict)
 
     if record.subject in callings:
-        calling = dict_sorted(callings[record.subject], True)
+        calling = callings[record.subject]
         return NovelRecord(
                 record.type,
-                translate_tags_str(record.subject, tags, True, None),
+                translate_tags_str(record.subject, translator, True, None),
                 translate_tags_str(record.desc, calling),
                 translate_tags_str(record.note, calling),
                 )
     else:
         return NovelRecord(
                 record.type,
-                translate_tags_str(record.subject, tags, True, None),
+                translate_tags_str(record.subject, translator, True, None),
                 record.desc,
                 record.note)
@@ -32,10 +32,10 @@ def serialized_filenames_from_order(order_data: dict,
     assert isinstance(sc_start, int)
     assert isinstance(sc_end, int)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     if not _is_valid_order_data(order_data):
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(proc=f"order data: {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, proc=f"order data: {PROC}")
         return []
 
     tmp = []
@@ -66,7 +66,7 @@ def serialized_filenames_from_order(order_data: dict,
                     ep_idx += 1
         ch_idx += 1
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return tmp
 
 
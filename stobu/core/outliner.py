@@ -4,11 +4,12 @@
 
 
 # My Modules
+from stobu.formats.common import outputs_data_from_formatted
 from stobu.formats.outline import format_outlines_data
 from stobu.syss import messages as msg
 from stobu.tools.elmchecker import is_enable_the_elm
 from stobu.tools.storydatareader import elm_outline_of, elm_title_of
-from stobu.tools.translater import translate_tags_str, translate_tags_text_list
+from stobu.tools.translater import TagTranslator, translate_tags_str
 from stobu.types.element import ElmType
 from stobu.types.outline import OutlineRecord, OutlinesData
 from stobu.types.output import OutputsData
@@ -40,7 +41,7 @@ def outlines_data_from(story_data: StoryData, tags: dict) -> OutlinesData:
     assert isinstance(story_data, StoryData)
     assert isinstance(tags, dict)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     tmp = []
 
@@ -51,20 +52,20 @@ def outlines_data_from(story_data: StoryData, tags: dict) -> OutlinesData:
             tmp.append(ret)
 
     if not tmp:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"outline data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"outline data in {PROC}")
         return None
 
-    reordered = _reorder_outlines_data(OutlinesData(tmp))
+    reordered = _reorder_outlines_data(OutlinesData.trusted(tmp))
     if not reordered or not reordered.has_data():
-        logger.error(msg.ERR_FAILED_PROC.format(proc=f"reorder data in {PROC}"))
+        logger.error(msg.ERR_FAILED_PROC, proc=f"reorder data in {PROC}")
         return None
 
     translated = _translate_outlines_data(reordered, tags)
     if not translated or not translated.has_data():
-        logger.error(msg.ERR_FAILED_PROC.format(proc=f"translate data in {PROC}"))
+        logger.error(msg.ERR_FAILED_PROC, proc=f"translate data in {PROC}")
         return None
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return translated
 
 
@@ -73,17 +74,17 @@ def outputs_data_from_outlines_data(outlines_data: OutlinesData, tags: dict) ->
     assert isinstance(tags, dict)
 
     _PROC = f"{PROC}: convert outputs data"
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
 
     formatted = format_outlines_data(outlines_data)
     if not formatted:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"outputs data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"outputs data in {PROC}")
         return None
 
-    translated = translate_tags_text_list(formatted, tags)
+    translated = outputs_data_from_formatted(formatted, tags)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
-    return OutputsData(translated)
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
+    return translated
 
 
 # Private Functions
@@ -92,7 +93,7 @@ def _conv_outline_record(record: StoryRecord) -> OutlineRecord:
 
     elm = assertion.is_instance(record.type, ElmType)
     if not is_enable_the_elm(elm, ENABLE_ELMS):
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
         return None
 
     title = assertion.is_str(elm_title_of(record))
@@ -112,28 +113,29 @@ def _reorder_outlines_data(outlines_data: OutlinesData) -> OutlinesData:
             if elm is record.type:
                 tmp.append(record)
 
-    return OutlinesData(tmp)
+    return OutlinesData.trusted(tmp)
 
 
 def _translate_outlines_data(outlines_data: OutlinesData, tags: dict) -> OutlinesData:
     assert isinstance(outlines_data, OutlinesData)
     assert isinstance(tags, dict)
 
+    translator = TagTranslator(tags)
     tmp = []
 
     for record in outlines_data.get_data():
         assert isinstance(record, OutlineRecord)
-        tmp.append(_translate_record(record, tags))
+        tmp.append(_translate_record(record, translator))
 
-    return OutlinesData(tmp)
+    return OutlinesData.trusted(tmp)
 
 
-def _translate_record(record: OutlineRecord, tags: dict) -> OutlineRecord:
+def _translate_record(record: OutlineRecord, translator: TagTranslator) -> OutlineRecord:
     assert isinstance(record, OutlineRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(translator, TagTranslator)
 
     return OutlineRecord(
             record.type,
-            translate_tags_str(record.title, tags),
-            translate_tags_str(record.outline, tags),
+            translate_tags_str(record.title, translator),
+            translate_tags_str(record.outline, translator),
             )
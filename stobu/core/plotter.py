@@ -5,11 +5,11 @@
 
 # My Modules
 from stobu.elms.plots import PlotItem
+from stobu.formats.common import outputs_data_from_formatted
 from stobu.formats.plot import format_plots_data
 from stobu.syss import messages as msg
 from stobu.tools.elmchecker import is_enable_the_elm
 from stobu.tools.storydatareader import elm_title_of, elm_plot_of
-from stobu.tools.translater import translate_tags_text_list
 from stobu.types.element import ElmType
 from stobu.types.output import OutputsData
 from stobu.types.plot import PlotsData, PlotRecord
@@ -49,12 +49,12 @@ def plots_data_from(story_data: StoryData) -> PlotsData:
             tmp.append(ret)
 
     if not tmp:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"plots data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"plots data in {PROC}")
         return None
 
-    reordered = _reorder_plots_data(PlotsData(tmp))
+    reordered = _reorder_plots_data(PlotsData.trusted(tmp))
     if not reordered or not reordered.has_data():
-        logger.error(msg.ERR_FAILED_PROC.format(proc=f"reorder data in {PROC}"))
+        logger.error(msg.ERR_FAILED_PROC, proc=f"reorder data in {PROC}")
         return None
 
     return reordered
@@ -65,17 +65,17 @@ def outputs_data_from_plots_data(plots_data: PlotsData, tags: dict) -> OutputsDa
     assert isinstance(tags, dict)
 
     _PROC = f"{PROC}: convert outputs data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     formatted = format_plots_data(plots_data)
     if not formatted:
-        logger.error(msg.ERR_FAIL_INVALID_DATA.format(data=f"outputs data in {PROC}"))
+        logger.error(msg.ERR_FAIL_INVALID_DATA, data=f"outputs data in {PROC}")
         return None
 
-    translated = translate_tags_text_list(formatted, tags)
+    translated = outputs_data_from_formatted(formatted, tags)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
-    return OutputsData(translated)
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
+    return translated
 
 
 # Private Functions
@@ -84,7 +84,7 @@ def _conv_plot_record(record: StoryRecord) -> PlotRecord:
 
     elm = assertion.is_instance(record.type, ElmType)
     if not is_enable_the_elm(elm, ENABLE_ELMS):
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
         return None
 
     title = assertion.is_str(elm_title_of(record))
@@ -141,12 +141,12 @@ def _get_plot_item_of(record: StoryRecord, item: PlotItem) -> str:
     data = assertion.is_dict(elm_plot_of(record))
 
     if not data:
-        logger.warning(msg.ERR_FAIL_MISSING_DATA.format(data=f"plot data in {PROC}"))
+        logger.warning(msg.ERR_FAIL_MISSING_DATA, data=f"plot data in {PROC}")
         return ""
 
     key = str(item)
     if key not in data:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"{key} of record in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"{key} of record in {PROC}")
         return ""
 
     return data[key]
@@ -163,4 +163,4 @@ def _reorder_plots_data(plots_data: PlotsData) -> PlotsData:
             if elm is record.type:
                 tmp.append(record)
 
-    return PlotsData(tmp)
+    return PlotsData.trusted(tmp)
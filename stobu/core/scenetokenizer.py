@@ -0,0 +1,138 @@
+"""Scene tokenize module."""
+
+# Official Libraries
+import re
+
+
+# My Modules
+from stobu.types.action import ActionRecord, ActType, ActDataType, EMPTY_FLAGS
+from stobu.types.basedata import record_class
+
+
+__all__ = (
+        'SceneLineError',
+        'act_type_of',
+        'tokenize_scene_lines',
+        )
+
+
+# Define Constants
+PROC = 'SCENE TOKENIZER'
+
+
+ACT_TYPE_TABLE = {
+        ActType.BE: ('be',),
+        ActType.COME: ('come',),
+        ActType.DISCARD: ('discard',),
+        ActType.DO: ('do',),
+        ActType.DRAW: ('d', 'draw',),
+        ActType.EXPLAIN: ('ex', 'explain',),
+        ActType.FACE: ('face',),
+        ActType.FEEL: ('feel',),
+        ActType.GO: ('go',),
+        ActType.HAVE: ('have',),
+        ActType.KNOW: ('know',),
+        ActType.KNOWN: ('known',),
+        ActType.OCCUR: ('occur',),
+        ActType.PUT: ('put',),
+        ActType.REMEMBER: ('rem', 'remember',),
+        ActType.RID: ('rid',),
+        ActType.TALK: ('t', 'talk',),
+        ActType.THINK: ('think',),
+        ActType.VOICE: ('voice',),
+        ActType.SAME: ('-', 'same'),
+        ActType.WEAR: ('wear',),
+        }
+
+
+ACT_ALIAS_TABLE = {alias: act for act, aliases in ACT_TYPE_TABLE.items() for alias in aliases}
+"""dict: action type of each alias, the reverse lookup of ACT_TYPE_TABLE."""
+
+
+LINE_PATTERN = re.compile(r"(?P<instruction>#! )|(?P<head>## )|(?P<comment># )|(?P<action>\[)|(?P<text>)")
+"""re.Pattern: classify a scene line by its head."""
+
+
+ERR_INVALID_ACTION = 'action line'
+
+ERR_INVALID_INSTRUCTION = 'instruction line'
+
+
+# Main
+@record_class
+class SceneLineError(object):
+    """Malformed line of a scene body."""
+    lineno: int
+    line: str
+    reason: str
+
+
+def act_type_of(action: str) -> ActType:
+    assert isinstance(action, str)
+
+    return ACT_ALIAS_TABLE.get(action, ActType.NONE)
+
+
+def tokenize_scene_lines(lines: list) -> tuple:
+    """Convert the lines of a scene body to the action records in one pass.
+
+    Returns:
+        tuple: (records, errors), the errors are SceneLineError of the malformed lines
+            with the line number in the body.
+    """
+    assert isinstance(lines, list)
+
+    records = []
+    errors = []
+    match = LINE_PATTERN.match
+
+    for lineno, line in enumerate(lines, 1):
+        assert isinstance(line, str)
+        line = line.rstrip('\r\n')
+        if not line:
+            continue
+
+        kind = match(line).lastgroup
+        if kind == 'action':
+            record = _record_as_action_from(line)
+            if record:
+                records.append(record)
+            else:
+                errors.append(SceneLineError(lineno, line, ERR_INVALID_ACTION))
+        elif kind == 'text':
+            text = line.lstrip()
+            records.append(ActionRecord(ActType.DO, ActDataType.TEXT, '', text, text))
+        elif kind == 'comment':
+            records.append(ActionRecord(ActType.DATA, ActDataType.COMMENT, line.replace('# ', '')))
+        elif kind == 'head':
+            records.append(ActionRecord(ActType.DATA, ActDataType.SCENE_HEAD, line.replace('## ', '')))
+        else:
+            parts = line.replace('#! ', '').split(' ')
+            if len(parts) > 2:
+                errors.append(SceneLineError(lineno, line, ERR_INVALID_INSTRUCTION))
+                continue
+            records.append(ActionRecord(
+                ActType.DATA, ActDataType.INSTRUCTION, parts[0], parts[1] if len(parts) > 1 else ''))
+
+    return records, errors
+
+
+# Private Functions
+def _record_as_action_from(line: str) -> ActionRecord:
+    """Split `[subject:act:outline] desc# note`, or None if the line is malformed."""
+    body, _, note = line.partition('# ')
+    cmd, closed, desc = body[1:].partition(']')
+    fields = cmd.split(':')
+
+    if not closed or ']' in desc or '# ' in note or len(fields) != 3:
+        return None
+
+    subject, act, outline = fields
+    return ActionRecord(
+            act_type_of(act),
+            ActDataType.NONE,
+            subject,
+            outline,
+            desc.lstrip(),
+            EMPTY_FLAGS,
+            note)
@@ -1,23 +1,25 @@
 """Build Script module."""
 
 # Official Libraries
+from typing import Iterator
 
 
 # My Modules
-from stobu.core.nametagcreator import get_calling_tags
-from stobu.formats.script import format_scripts_data
+from stobu.core.nametagcreator import get_calling_translators
+from stobu.formats.common import iter_translated_formatted, outputs_data_from_formatted
+from stobu.formats.script import format_scripts_data, iter_scripts_formatted
 from stobu.syss import messages as msg
-from stobu.tools.translater import translate_tags_text_list, translate_tags_str
+from stobu.tools.translater import TagTranslator, translate_tags_str
 from stobu.types.action import ActDataType, ActionRecord, ActionsData, ActType
 from stobu.types.action import NORMAL_ACTIONS
 from stobu.types.action import TITLE_ACTIONS
 from stobu.types.output import OutputsData
 from stobu.types.script import ScriptRecord, ScriptsData, ScriptType
-from stobu.utils.dicts import dict_sorted
 from stobu.utils.log import logger
 
 
 __all__ = (
+        'iter_outputs_from_scripts_data',
         'outputs_data_from_scripts_data',
         'scripts_data_from',
         )
@@ -47,7 +49,7 @@ def scripts_data_from(actions_data: ActionsData, tags: dict) -> ScriptsData:
     assert isinstance(actions_data, ActionsData)
     assert isinstance(tags, dict)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     base_data = _base_scripts_data_from(actions_data)
 
@@ -55,8 +57,18 @@ def scripts_data_from(actions_data: ActionsData, tags: dict) -> ScriptsData:
 
     eliminated = _eliminate_empty_records(updated)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-    return ScriptsData(eliminated)
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
+    return ScriptsData.trusted(eliminated)
+
+
+def iter_outputs_from_scripts_data(scripts_data: ScriptsData, tags: dict,
+        is_comment: bool = False) -> Iterator:
+    """Yield the translated output lines and the marks, to stream them into a sink."""
+    assert isinstance(scripts_data, ScriptsData)
+    assert isinstance(tags, dict)
+    assert isinstance(is_comment, bool)
+
+    return iter_translated_formatted(iter_scripts_formatted(scripts_data, is_comment), tags)
 
 
 def outputs_data_from_scripts_data(scripts_data: ScriptsData, tags: dict,
@@ -65,14 +77,14 @@ def outputs_data_from_scripts_data(scripts_data: ScriptsData, tags: dict,
     assert isinstance(tags, dict)
 
     _PROC = f"{PROC}: convert outputs data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     formatted = format_scripts_data(scripts_data, is_comment)
 
-    translated = translate_tags_text_list(formatted, tags)
+    translated = outputs_data_from_formatted(formatted, tags)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
-    return OutputsData(translated)
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
+    return translated
 
 
 def update_data_tags(origin_data: list, tags: dict) -> list:
@@ -80,14 +92,15 @@ def update_data_tags(origin_data: list, tags: dict) -> list:
     assert isinstance(tags, dict)
 
     tmp = []
-    callings = get_calling_tags()
+    translator = TagTranslator(tags)
+    callings = get_calling_translators()
 
     for record in origin_data:
         assert isinstance(record, ScriptRecord)
         if record.type in ACTIONS:
-            tmp.append(_update_tags_desc_record(record, tags, callings))
+            tmp.append(_update_tags_desc_record(record, translator, callings))
         elif ScriptType.SPIN is record.type:
-            tmp.append(_update_tags_spin_record(record, tags))
+            tmp.append(_update_tags_spin_record(record, translator))
         else:
             tmp.append(record)
 
@@ -148,7 +161,8 @@ def _base_scripts_data_from(actions_data: ActionsData) -> list:
             elif record.subtype in [ActDataType.FORESHADOW, ActDataType.PAYOFF]:
                 continue
             else:
-                logger.warning(msg.ERR_FAIL_INVALID_DATA_WITH_DATA.format(data=f"act data sub type in {PROC}"), record.subtype)
+                logger.warning(msg.ERR_FAIL_INVALID_DATA_WITH_DATA, record.subtype,
+                        data=f"act data sub type in {PROC}")
                 continue
         elif record.type in NORMAL_ACTIONS:
             if record.type in ACT_TALKS:
@@ -162,7 +176,7 @@ def _base_scripts_data_from(actions_data: ActionsData) -> list:
             # NOTE: SE?
             continue
         else:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"act type in {PROC}"))
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"act type in {PROC}")
             continue
 
     return tmp
@@ -294,39 +308,39 @@ def _title_type_of(record: ActionRecord) -> ScriptType:
     elif ActDataType.SCENE_HEAD:
         return ScriptType.TITLE_TEXT
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"title type in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"title type in {PROC}")
         return ScriptType.NONE
 
 
-def _update_tags_desc_record(record: ScriptRecord, tags: dict,
+def _update_tags_desc_record(record: ScriptRecord, translator: TagTranslator,
         callings: dict) -> ScriptRecord:
     assert isinstance(record, ScriptRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(translator, TagTranslator)
     assert isinstance(callings, dict)
 
     if record.subject in callings:
-        calling = dict_sorted(callings[record.subject], True)
+        calling = callings[record.subject]
         return ScriptRecord(
             record.type,
-            translate_tags_str(record.subject, tags, True, None),
+            translate_tags_str(record.subject, translator, True, None),
             translate_tags_str(record.desc, calling),
             translate_tags_str(record.note, calling),
             )
     else:
         return ScriptRecord(
                 record.type,
-                translate_tags_str(record.subject, tags, True, None),
+                translate_tags_str(record.subject, translator, True, None),
                 record.desc,
                 record.note)
 
 
-def _update_tags_spin_record(record: ScriptRecord, tags: dict) -> ScriptRecord:
+def _update_tags_spin_record(record: ScriptRecord, translator: TagTranslator) -> ScriptRecord:
     assert isinstance(record, ScriptRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(translator, TagTranslator)
 
     return ScriptRecord(
             record.type,
-            translate_tags_str(record.subject, tags, True, None),
-            translate_tags_str(record.desc, tags, True, None),
-            translate_tags_str(record.note, tags, True, None),
+            translate_tags_str(record.subject, translator, True, None),
+            translate_tags_str(record.desc, translator, True, None),
+            translate_tags_str(record.note, translator, True, None),
             )
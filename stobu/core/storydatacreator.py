@@ -3,6 +3,7 @@
 # Official Libraries
 from argparse import Namespace
 from dataclasses import dataclass
+from typing import Callable
 
 
 # My Modules
@@ -10,6 +11,7 @@ from stobu.core.orderdataserializer import serialized_filenames_from_order
 from stobu.elms.orders import OrderItem
 from stobu.elms.scenes import SceneItem
 from stobu.syss import messages as msg
+from stobu.tools.buildcache import BuildCache, read_data_list_with_cache, read_data_with_cache
 from stobu.tools.filedatareader import read_yaml_data, read_markdown_data_as_yaml
 from stobu.tools.orderdatareader import elm_from_ordername, rid_prefix, orderitem_of
 from stobu.tools.pathgetter import filepath_of
@@ -18,7 +20,6 @@ from stobu.types.element import ElmType
 from stobu.types.story import StoryData, StoryRecord
 from stobu.utils import assertion
 from stobu.utils.datetimes import next_day_str_from, next_month_str_from, after_day_str_from
-from stobu.utils.fileio import read_file
 from stobu.utils.log import logger
 
 
@@ -57,15 +58,15 @@ class ElmPart(object):
 
 
 # Main
-def story_data_from(args: Namespace) -> StoryData:
+def story_data_from(args: Namespace, cache: BuildCache = None) -> StoryData:
     assert isinstance(args, Namespace)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
-    order_data = read_yaml_data(read_file(filepath_of(ElmType.ORDER, '')))
+    order_data = read_data_with_cache(filepath_of(ElmType.ORDER, ''), read_yaml_data, cache)
 
     if not order_data:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"order data in {PROC}"))
+        logger.error(msg.ERR_FAIL_MISSING_DATA, data=f"order data in {PROC}")
         return None
 
     elmpart = assertion.is_instance(_get_elm_part(args.part if args.part else ""),
@@ -78,17 +79,17 @@ def story_data_from(args: Namespace) -> StoryData:
             ))
 
     if not serialized:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"serialized data in {PROC}"))
+        logger.error(msg.ERR_FAIL_MISSING_DATA, data=f"serialized data in {PROC}")
         return None
 
-    story_data_base = _conv_story_data_from(serialized)
+    story_data_base = _conv_story_data_from(serialized, cache, args.jobs)
     if not story_data_base:
-        logger.error(msg.ERR_FAIL_MISSING_DATA.format(data=f"story data base in {PROC}"))
+        logger.error(msg.ERR_FAIL_MISSING_DATA, data=f"story data base in {PROC}")
         return None
 
-    updated = update_story_data_if_same_or_next_tag(StoryData(story_data_base))
+    updated = update_story_data_if_same_or_next_tag(StoryData.trusted(story_data_base))
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return updated
 
 
@@ -107,31 +108,53 @@ def update_story_data_if_same_or_next_tag(story_data: StoryData) -> StoryData:
             tmp.append(ret)
             cache = ret
         else:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
             continue
 
-    return StoryData(tmp)
+    return StoryData.trusted(tmp)
 
 
 # Private Functions
-def _conv_story_data_from(serialized: list) -> list:
+def _conv_story_data_from(serialized: list, cache: BuildCache = None, jobs: int = 1) -> list:
     assert isinstance(serialized, list)
+    assert isinstance(jobs, int)
+
+    if jobs != 1:
+        return _conv_story_data_in_parallel_from(serialized, cache, jobs)
 
     tmp = []
-    tmp.append(_conv_story_record_from(str(OrderItem.BOOK)))
+    tmp.append(_conv_story_record_from(str(OrderItem.BOOK), cache))
 
     for ordername in serialized:
-        tmp.append(_conv_story_record_from(ordername))
+        tmp.append(_conv_story_record_from(ordername, cache))
 
     return tmp
 
 
-def _conv_story_record_from(ordername: str) -> StoryRecord:
+def _conv_story_data_in_parallel_from(serialized: list, cache: BuildCache, jobs: int) -> list:
+    assert isinstance(serialized, list)
+    assert isinstance(jobs, int)
+
+    elms = []
+    targets = []
+
+    for ordername in [str(OrderItem.BOOK)] + serialized:
+        elm = elm_from_ordername(ordername)
+        fname = rid_prefix(orderitem_of(elm), ordername)
+        elms.append((elm, fname))
+        targets.append((filepath_of(elm, fname), _parser_of(elm)))
+
+    datas = read_data_list_with_cache(targets, cache, jobs)
+
+    return [StoryRecord(elm, fname, data) for (elm, fname), data in zip(elms, datas)]
+
+
+def _conv_story_record_from(ordername: str, cache: BuildCache = None) -> StoryRecord:
     assert isinstance(ordername, str)
 
     elm = elm_from_ordername(ordername)
     fname = rid_prefix(orderitem_of(elm), ordername)
-    data = _get_data_from(elm, fname)
+    data = _get_data_from(elm, fname, cache)
 
     return StoryRecord(elm, fname, data)
 
@@ -181,16 +204,11 @@ def _copy_and_change_scene_data_if_same_or_next(record: StoryRecord, cache: Stor
             record, camera, stage, year, date, time)
 
 
-def _get_data_from(elm: ElmType, fname: str) -> dict:
+def _get_data_from(elm: ElmType, fname: str, cache: BuildCache = None) -> dict:
     assert isinstance(elm, ElmType)
     assert isinstance(fname, str)
 
-    raw_data = read_file(filepath_of(elm, fname))
-
-    if ElmType.BOOK is elm:
-        return read_yaml_data(raw_data)
-    else:
-        return read_markdown_data_as_yaml(raw_data)
+    return read_data_with_cache(filepath_of(elm, fname), _parser_of(elm), cache)
 
 
 def _get_day_and_month_from(record: StoryRecord) -> tuple:
@@ -238,3 +256,9 @@ def _is_same_tag(text: str) -> bool:
     assert isinstance(text, str)
 
     return text in SAME_TAGS
+
+
+def _parser_of(elm: ElmType) -> Callable:
+    assert isinstance(elm, ElmType)
+
+    return read_yaml_data if ElmType.BOOK is elm else read_markdown_data_as_yaml
@@ -4,11 +4,12 @@
 
 
 # My Modules
-from stobu.core.nametagcreator import get_calling_tags
+from stobu.core.nametagcreator import get_calling_translators
 from stobu.formats.common import get_breakline
+from stobu.formats.common import outputs_data_from_formatted
 from stobu.formats.struct import format_structs_data
 from stobu.syss import messages as msg
-from stobu.tools.translater import translate_tags_text_list, translate_tags_str
+from stobu.tools.translater import TagTranslator, translate_tags_str
 from stobu.types.action import ActionsData, ActionRecord, ActDataType, ActType
 from stobu.types.action import NORMAL_ACTIONS, TITLE_ACTIONS
 from stobu.types.element import ElmType
@@ -18,7 +19,6 @@ from stobu.types.struct import StructRecord, StructsData, StructType
 from stobu.types.struct import STRUCT_TITLES
 from stobu.types.struct import SceneDataInfo, DataInfoType
 from stobu.utils import assertion
-from stobu.utils.dicts import dict_sorted
 from stobu.utils.log import logger
 from stobu.utils.strings import just_string_of
 
@@ -38,7 +38,7 @@ def structs_data_from(actions_data: ActionsData, tags: dict) -> StructsData:
     assert isinstance(actions_data, ActionsData)
     assert isinstance(tags, dict)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     base_data = _base_structs_data_from(actions_data)
 
@@ -48,8 +48,8 @@ def structs_data_from(actions_data: ActionsData, tags: dict) -> StructsData:
 
     eliminated = _eliminate_empty_records(data_updated)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-    return StructsData(eliminated)
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
+    return StructsData.trusted(eliminated)
 
 
 def outputs_data_from_structs_data(structs_data: StructsData, tags: dict,
@@ -59,14 +59,14 @@ def outputs_data_from_structs_data(structs_data: StructsData, tags: dict,
     assert isinstance(is_comment, bool)
 
     _PROC = f"{PROC}: convert outputs data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     formatted = format_structs_data(structs_data, is_comment)
 
-    translated = translate_tags_text_list(formatted, tags)
+    translated = outputs_data_from_formatted(formatted, tags)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
-    return OutputsData(translated)
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
+    return translated
 
 
 def update_data_tags(origin_data: list, tags: dict) -> list:
@@ -74,14 +74,15 @@ def update_data_tags(origin_data: list, tags: dict) -> list:
     assert isinstance(tags, dict)
 
     tmp = []
-    callings = get_calling_tags()
+    translator = TagTranslator(tags)
+    callings = get_calling_translators()
 
     for record in origin_data:
         assert isinstance(record, StructRecord)
         if record.type is StructType.ACTION:
-            tmp.append(_update_tags_action_record(record, tags, callings))
+            tmp.append(_update_tags_action_record(record, translator, callings))
         elif StructType.SCENE_DATA is record.type:
-            tmp.append(_update_tags_scene_data_record(record, tags))
+            tmp.append(_update_tags_scene_data_record(record, translator))
         else:
             tmp.append(record)
 
@@ -92,7 +93,7 @@ def update_scene_info(base_data: list) -> list:
     assert isinstance(base_data, list)
 
     _PROC = f"{PROC}: update scene info"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
     actions = []
@@ -153,7 +154,7 @@ def update_scene_info(base_data: list) -> list:
         else:
             tmp.append(record)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return tmp
 
 
@@ -193,7 +194,7 @@ def _base_structs_data_from(actions_data: ActionsData) -> list:
                     ActDataType.PARAGRAPH_START, ActDataType.PARAGRAPH_END,]:
                 continue
             else:
-                logger.warning(msg.ERR_FAIL_UNKNOWN_DATA.format(data=f"act data sub type in {PROC}"))
+                logger.warning(msg.ERR_FAIL_UNKNOWN_DATA, data=f"act data sub type in {PROC}")
                 continue
         elif record.type in NORMAL_ACTIONS:
             tmp.append(_record_as_action_from(record))
@@ -201,7 +202,7 @@ def _base_structs_data_from(actions_data: ActionsData) -> list:
             # NOTE: SE?
             continue
         else:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"act type in {PROC}"))
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"act type in {PROC}")
             continue
 
     return tmp
@@ -302,22 +303,22 @@ def _title_type_of(record: ActionRecord) -> StructType:
     elif ActDataType.SCENE_HEAD is record.subtype:
         return StructType.TITLE_TEXT
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"title type in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"title type in {PROC}")
         return StructType.NONE
 
 
-def _update_tags_action_record(record: StructRecord, tags: dict,
+def _update_tags_action_record(record: StructRecord, translator: TagTranslator,
         callings: dict) -> StructRecord:
     assert isinstance(record, StructRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(translator, TagTranslator)
     assert isinstance(callings, dict)
 
     if record.subject in callings:
-        calling = dict_sorted(callings[record.subject], True)
+        calling = callings[record.subject]
         return StructRecord(
             record.type,
             record.act,
-            translate_tags_str(record.subject, tags, True, None),
+            translate_tags_str(record.subject, translator, True, None),
             translate_tags_str(record.outline, calling),
             translate_tags_str(record.note, calling),
             )
@@ -325,28 +326,28 @@ def _update_tags_action_record(record: StructRecord, tags: dict,
         return StructRecord(
                 record.type,
                 record.act,
-                translate_tags_str(record.subject, tags, True, None),
+                translate_tags_str(record.subject, translator, True, None),
                 record.outline,
                 record.note,
                 )
 
 
-def _update_tags_scene_data_record(record: StructRecord, tags: dict) -> StructRecord:
+def _update_tags_scene_data_record(record: StructRecord, translator: TagTranslator) -> StructRecord:
     assert isinstance(record, StructRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(translator, TagTranslator)
 
     info = assertion.is_instance(record.note, SceneInfo)
     updated = SceneInfo()
 
-    updated.camera = translate_tags_str(info.camera, tags, True, None)
-    updated.stage = translate_tags_str(info.stage, tags, True, None)
-    updated.year = translate_tags_str(str(info.year), tags, True, None)
-    updated.date = translate_tags_str(str(info.date), tags, True, None)
-    updated.time = translate_tags_str(str(info.time), tags, True, None)
+    updated.camera = translate_tags_str(info.camera, translator, True, None)
+    updated.stage = translate_tags_str(info.stage, translator, True, None)
+    updated.year = translate_tags_str(str(info.year), translator, True, None)
+    updated.date = translate_tags_str(str(info.date), translator, True, None)
+    updated.time = translate_tags_str(str(info.time), translator, True, None)
 
     return StructRecord(
             record.type,
             record.act,
-            translate_tags_str(record.subject, tags, True, None),
-            translate_tags_str(record.outline, tags, True, None),
+            translate_tags_str(record.subject, translator, True, None),
+            translate_tags_str(record.outline, translator, True, None),
             updated)
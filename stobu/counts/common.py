@@ -1,6 +1,9 @@
 """Common count module."""
 
 # Official Libraries
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable
 
 
 # My Modules
@@ -8,15 +11,17 @@ from stobu.syss import messages as msg
 from stobu.types.build import BuildType
 from stobu.types.count import CountRecord, CountsData
 from stobu.types.element import ElmType
-from stobu.types.output import OutputsData
+from stobu.types.output import OutputMark, OutputsData
 from stobu.utils.log import logger
-from stobu.utils.strings import rid_rn
 
 
 __all__ = (
         'counts_data_from',
+        'counts_data_from_records',
         'count_line_by_columns',
         'count_white_space',
+        'StreamCounter',
+        'TextCounter',
         )
 
 
@@ -24,29 +29,14 @@ __all__ = (
 PROC = 'COMMON COUNTS'
 
 
-NOVEL_BUILDS = [
-        BuildType.NOVEL,
-        BuildType.SCRIPT,
-        BuildType.STRUCT,
+COUNT_ELMS = [
+        ElmType.BOOK,
+        ElmType.CHAPTER,
+        ElmType.EPISODE,
+        ElmType.SCENE,
         ]
 
 
-NOVEL_HEADS = {
-        ElmType.BOOK: '# ',
-        ElmType.CHAPTER: '## ',
-        ElmType.EPISODE: '### ',
-        ElmType.SCENE: '** ',
-        }
-
-
-OUTLINE_HEADS = {
-        ElmType.BOOK: '### BOOK: ',
-        ElmType.CHAPTER: '### CHAPTER: ',
-        ElmType.EPISODE: '### EPISODE: ',
-        ElmType.SCENE: '**',
-        }
-
-
 # Main
 def counts_data_from(build_type: BuildType, outputs_data: OutputsData,
         columns: int, rows: int) -> CountsData:
@@ -56,66 +46,45 @@ def counts_data_from(build_type: BuildType, outputs_data: OutputsData,
     assert isinstance(rows, int)
 
     _PROC = f"{PROC}: counts data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
+    texts = []
+    starts = {elm: [] for elm in COUNT_ELMS}
+    is_plot = BuildType.PLOT is build_type
+    lines = outputs_data.get_data()
+    head = 0
 
-    indexes = {
-            ElmType.BOOK: 0,
-            ElmType.CHAPTER: 0,
-            ElmType.EPISODE: 0,
-            ElmType.SCENE: 0,
-            }
-    titles = {
-            ElmType.BOOK: [""],
-            ElmType.CHAPTER: [""],
-            ElmType.EPISODE: [""],
-            ElmType.SCENE: [""],
-            }
-    descs = {
-            ElmType.BOOK: [""],
-            ElmType.CHAPTER: [""],
-            ElmType.EPISODE: [""],
-            ElmType.SCENE: [""],
-            }
-
-    heads = NOVEL_HEADS if build_type in NOVEL_BUILDS else OUTLINE_HEADS
-
-    for record in outputs_data.get_data():
-        assert isinstance(record, str)
-        if record.startswith(heads[ElmType.BOOK]):
-            indexes[ElmType.BOOK] += 1
-            titles[ElmType.BOOK].append(_get_title_from(heads, ElmType.BOOK, record))
-            descs[ElmType.BOOK].append('')
-        elif record.startswith(heads[ElmType.CHAPTER]):
-            indexes[ElmType.CHAPTER] += 1
-            titles[ElmType.CHAPTER].append(_get_title_from(heads, ElmType.CHAPTER, record))
-            descs[ElmType.CHAPTER].append('')
-        elif record.startswith(heads[ElmType.EPISODE]):
-            indexes[ElmType.EPISODE] += 1
-            titles[ElmType.EPISODE].append(_get_title_from(heads, ElmType.EPISODE, record))
-            descs[ElmType.EPISODE].append('')
-        elif record.startswith(heads[ElmType.SCENE]):
-            indexes[ElmType.SCENE] += 1
-            titles[ElmType.SCENE].append(_get_title_from(heads, ElmType.SCENE, record))
-            descs[ElmType.SCENE].append('')
-        elif '<!--' in record:
-            # NOTE: コメント
-            continue
-        else:
-            # Text (Contains Spin)
-            descs[ElmType.BOOK][indexes[ElmType.BOOK]] += record
-            descs[ElmType.CHAPTER][indexes[ElmType.CHAPTER]] += record
-            descs[ElmType.EPISODE][indexes[ElmType.EPISODE]] += record
-            descs[ElmType.SCENE][indexes[ElmType.SCENE]] += record
+    # NOTE: 各要素の見出しはフォーマット時の印から取り、その間の行だけを数える
+    for mark in outputs_data.get_marks() + (OutputMark(ElmType.NONE, '', len(lines)),):
+        assert isinstance(mark, OutputMark)
+        texts.extend(_texts_of(lines[head:mark.index], is_plot))
+        if mark.type in starts:
+            starts[mark.type].append((mark.title, len(texts)))
+        head = mark.index + 1
 
-    is_plot = BuildType.PLOT is build_type
+    counter = TextCounter(texts, columns)
 
-    for elm in [ElmType.BOOK, ElmType.CHAPTER, ElmType.EPISODE, ElmType.SCENE]:
-        tmp.extend(_counts_data_from_by_elm(elm, titles[elm], descs[elm], columns, rows, is_plot))
+    for elm in COUNT_ELMS:
+        ends = [start for _, start in starts[elm][1:]] + [len(texts)]
+        for (title, start), end in zip(starts[elm], ends):
+            tmp.append(_record_count_from(elm, title, counter, start, end, rows))
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
-    return CountsData(tmp)
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
+    return CountsData.trusted(tmp)
+
+
+def counts_data_from_records(records: Iterable, columns: int, rows: int) -> CountsData:
+    """Count the streamed output lines and marks, the same as counts_data_from."""
+    assert isinstance(columns, int)
+    assert isinstance(rows, int)
+
+    counter = StreamCounter(columns)
+
+    for record in records:
+        counter.count(record)
+
+    return counter.counts_data(rows)
 
 
 def count_line_by_columns(text: str, columns: int) -> float:
@@ -135,57 +104,138 @@ def count_line_by_columns(text: str, columns: int) -> float:
 def count_white_space(text: str) -> int:
     assert isinstance(text, str)
 
-    space = 0
-    for c in text:
-        if c.isspace():
-            space += 1
-    return space
+    # NOTE: split() は isspace() と同じ空白で区切るので、その差が空白の数になる
+    return len(text) - len(''.join(text.split()))
 
 
-# Private Functions
-def _counts_data_from_by_elm(elm: ElmType, titles: list, descs: list,
-        columns: int, rows: int, is_rid_plotmark: bool) -> list:
-    assert isinstance(elm, ElmType)
-    assert isinstance(titles, list)
-    assert isinstance(descs, list)
-    assert isinstance(rows, int)
-    assert isinstance(is_rid_plotmark, bool)
+class StreamCounter(object):
+    """Counts of each marked element, taken from the output lines as they pass.
 
-    tmp = []
+    No line is kept: each element open at a line adds its characters, its spaces and
+    the lines it ends, so the counts equal to counts_data_from of the whole outputs.
+    """
 
-    for title, text in zip(titles[1:], descs[1:]):
-        _text = _rid_plot_mark(text) if is_rid_plotmark else text
-        tmp.append(_record_count_from(elm, title, _text, columns, rows))
+    def __init__(self, columns: int):
+        assert isinstance(columns, int)
 
-    return tmp
+        self.columns = columns
+        self.counts = {elm: [] for elm in COUNT_ELMS}
+        self.is_head = False
 
+    def count(self, record: (str, OutputMark)) -> None:
+        if isinstance(record, OutputMark):
+            if record.type in self.counts:
+                self.counts[record.type].append([record.title, 0, 0, 0.0, 0])
+            # NOTE: 印の次の行は見出しなので数えない
+            self.is_head = True
+            return
 
-def _get_title_from(heads: dict, elm: ElmType, line: str) -> str:
-    assert isinstance(heads, dict)
-    assert isinstance(elm, ElmType)
-    assert isinstance(line, str)
+        assert isinstance(record, str)
+        if self.is_head:
+            self.is_head = False
+            return
+        if '<!--' in record:
+            # NOTE: コメント
+            return
+
+        total = len(record)
+        space = count_white_space(record)
+        lengths = [len(line) for line in record.split('\n')]
+
+        for counts in self.counts.values():
+            if not counts:
+                continue
+            current = counts[-1]
+            current[1] += total
+            current[2] += space
+            if len(lengths) > 1:
+                current[3] = self._lines_added(current[3], current[4] + lengths[0])
+                for length in lengths[1:-1]:
+                    current[3] = self._lines_added(current[3], length)
+                current[4] = lengths[-1]
+            else:
+                current[4] += lengths[0]
+
+    def counts_data(self, rows: int) -> CountsData:
+        assert isinstance(rows, int)
+
+        tmp = []
+
+        for elm in COUNT_ELMS:
+            for title, total, space, lines, length in self.counts[elm]:
+                lines = self._lines_added(lines, length)
+                tmp.append(CountRecord(elm, title, total, space, lines, lines / rows))
+
+        return CountsData.trusted(tmp)
+
+    def _lines_added(self, lines: float, length: int) -> float:
+        # NOTE: 行数は浮動小数の足し算の順で丸めが変わるので、元と同じく行の順に足す
+        return lines + (length / self.columns if length > self.columns else 1)
+
+
+class TextCounter(object):
+    """Lengths of the text records and of their lines, measured once.
+
+    The characters and the spaces of any run of the records come from the prefix sums,
+    and the lines from the line lengths in the run, the same as count_line_by_columns
+    and count_white_space of the joined run.
+    """
+
+    def __init__(self, texts: list, columns: int):
+        assert isinstance(texts, list)
+        assert isinstance(columns, int)
+
+        self.columns = columns
+        self.offsets = _prefix_sums_of(len(text) for text in texts)
+        self.spaces = _prefix_sums_of(count_white_space(text) for text in texts)
+        self.line_lengths = [len(line) for line in ''.join(texts).split('\n')]
+        self.line_starts = _prefix_sums_of(length + 1 for length in self.line_lengths[:-1])
+
+    def counts_of(self, start: int, end: int) -> tuple:
+        """Return (total, space, lines) of the records from start to end (exclusive)."""
+        head, tail = self.offsets[start], self.offsets[end]
+        first = bisect_right(self.line_starts, head) - 1
+        last = bisect_right(self.line_starts, tail) - 1
+
+        if first == last:
+            pieces = [tail - head]
+        else:
+            pieces = [self.line_starts[first] + self.line_lengths[first] - head]
+            pieces.extend(self.line_lengths[first + 1:last])
+            pieces.append(tail - self.line_starts[last])
+
+        # NOTE: 行数は浮動小数の足し算の順で丸めが変わるので、元と同じく行の順に足す
+        lines = 0.0
+        columns = self.columns
+        for length in pieces:
+            if length > columns:
+                lines += length / columns
+            else:
+                lines += 1
 
-    if ElmType.SCENE is elm:
-        return rid_rn(line.replace(heads[elm], '').replace(' **', ''))
-    else:
-        return rid_rn(line.replace(heads[elm], ''))
+        return tail - head, self.spaces[end] - self.spaces[start], lines
 
 
-def _record_count_from(elm: ElmType, title: str, text: str,
-        columns: int, rows: int) -> CountRecord:
+# Private Functions
+def _prefix_sums_of(values: Iterable) -> list:
+    # NOTE: accumulate の initial は 3.8 からなので、先頭の 0 は自分で足す
+    return [0] + list(accumulate(values))
+
+
+def _record_count_from(elm: ElmType, title: str, counter: TextCounter,
+        start: int, end: int, rows: int) -> CountRecord:
     assert isinstance(elm, ElmType)
     assert isinstance(title, str)
-    assert isinstance(text, str)
-    assert isinstance(columns, int)
+    assert isinstance(counter, TextCounter)
     assert isinstance(rows, int)
 
-    lines = count_line_by_columns(text, columns)
+    total, space, lines = counter.counts_of(start, end)
 
     return CountRecord(
             elm,
             title,
-            len(text),
-            count_white_space(text),
+            total,
+            space,
             lines,
             lines / rows,
             )
@@ -195,3 +245,20 @@ def _rid_plot_mark(text: str) -> str:
     assert isinstance(text, str)
 
     return text.replace('→', '').replace('↓', '').replace('＜', '').replace('＞', '')
+
+
+def _texts_of(lines: list, is_plot: bool) -> list:
+    assert isinstance(lines, list)
+    assert isinstance(is_plot, bool)
+
+    tmp = []
+
+    for line in lines:
+        assert isinstance(line, str)
+        if '<!--' in line:
+            # NOTE: コメント
+            continue
+        # Text (Contains Spin)
+        tmp.append(_rid_plot_mark(line) if is_plot else line)
+
+    return tmp
@@ -1,12 +1,15 @@
 """Common format module."""
 
 # Official Libraries
+from typing import Iterable, Iterator
 
 
 # My Modules
 from stobu.syss import messages as msg
+from stobu.tools.translater import TagTranslator, translate_tags_str
 from stobu.types.count import CountRecord
 from stobu.types.element import ElmType
+from stobu.types.output import OutputMark, OutputsData
 from stobu.utils import assertion
 from stobu.utils.log import logger
 from stobu.utils.strings import just_string_of
@@ -22,8 +25,11 @@ __all__ = (
         'get_format_record_as_description',
         'get_format_record_as_dialogue',
         'get_format_record_as_indent',
+        'get_format_record_as_mark',
         'get_format_record_as_monologue',
         'head_string_from_elm',
+        'iter_translated_formatted',
+        'outputs_data_from_formatted',
         )
 
 
@@ -110,6 +116,14 @@ def get_format_record_as_indent(num: int = 1) -> str:
     return '　' * num
 
 
+def get_format_record_as_mark(elm: ElmType, title: str) -> OutputMark:
+    """Mark the head of the element, put before its head line."""
+    assert isinstance(elm, ElmType)
+    assert isinstance(title, str)
+
+    return OutputMark(elm, title)
+
+
 def get_format_record_as_monologue(desc: str, subject: str = None) -> str:
     assert isinstance(desc, str)
 
@@ -125,3 +139,36 @@ def head_string_from_elm(elm: ElmType, title: str) -> str:
     head = TITLES[elm]
 
     return f"### {head}: {title}\n\n"
+
+
+def iter_translated_formatted(formatted: Iterable, tags: dict) -> Iterator:
+    """Translate the tags of the formatted lines one by one, numbering the marks by the lines."""
+    assert isinstance(tags, dict)
+
+    translator = TagTranslator(tags)
+    index = 0
+
+    for record in formatted:
+        if isinstance(record, OutputMark):
+            yield OutputMark(record.type, translate_tags_str(record.title, translator), index)
+        else:
+            assert isinstance(record, str)
+            yield translator.translated(record)
+            index += 1
+
+
+def outputs_data_from_formatted(formatted: list, tags: dict) -> OutputsData:
+    """Translate the tags of the formatted lines, taking the marks out to the outputs data."""
+    assert isinstance(formatted, list)
+    assert isinstance(tags, dict)
+
+    lines = []
+    marks = []
+
+    for record in iter_translated_formatted(formatted, tags):
+        if isinstance(record, OutputMark):
+            marks.append(record)
+        else:
+            lines.append(record)
+
+    return OutputsData.marked(lines, marks)
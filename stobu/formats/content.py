@@ -23,7 +23,7 @@ PROC = 'FORMAT CONTENTS'
 def format_contents_data(contents_data: ContentsData) -> list:
     assert isinstance(contents_data, ContentsData)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     contents = contents_data.get_data()
 
@@ -41,7 +41,7 @@ def format_contents_data(contents_data: ContentsData) -> list:
             space = _get_format_space(record.type)
             tmp.append(f"{space}{record.index}. {record.title}\n")
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return tmp
 
 
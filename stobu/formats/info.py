@@ -35,7 +35,7 @@ def format_infos_data(infos_data: InfosData, is_comment: bool) -> list:
     assert isinstance(infos_data, InfosData)
     assert isinstance(is_comment, bool)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     tmp = []
 
@@ -99,12 +99,12 @@ def format_infos_data(infos_data: InfosData, is_comment: bool) -> list:
         elif record.type in [InfoType.NONE, InfoType.SCENE_END]:
             pass
         else:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"info type in {PROC}"))
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"info type in {PROC}")
             continue
 
     eliminated = eliminated_empty_format_records_from(tmp)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return eliminated
 
 
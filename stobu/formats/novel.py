@@ -1,13 +1,14 @@
 """Format module for novel data."""
 
 # Official Libraries
+from typing import Iterator
 
 
 # My Modules
 from stobu.formats.common import conv_charcounts_from
 from stobu.formats.common import get_breakline
 from stobu.formats.common import get_format_record_as_br, get_format_record_as_comment
-from stobu.formats.common import get_format_record_as_indent
+from stobu.formats.common import get_format_record_as_indent, get_format_record_as_mark
 from stobu.formats.common import get_format_record_as_description, get_format_record_as_dialogue
 from stobu.formats.common import head_string_from_elm
 from stobu.syss import messages as msg
@@ -20,6 +21,7 @@ from stobu.utils.log import logger
 __all__ = (
         'format_novels_charcounts_data',
         'format_novels_data',
+        'iter_novels_formatted',
         )
 
 
@@ -36,6 +38,15 @@ TITLES = [
         ]
 
 
+TITLE_ELMS = {
+        NovelType.TITLE_BOOK: ElmType.BOOK,
+        NovelType.TITLE_CHAPTER: ElmType.CHAPTER,
+        NovelType.TITLE_EPISODE: ElmType.EPISODE,
+        NovelType.TITLE_SCENE: ElmType.SCENE,
+        }
+"""dict: element of each title, marked for the counts."""
+
+
 NORAL_DESCS = [
         NovelType.COMMENT,
         NovelType.DESCRIPTION,
@@ -49,7 +60,7 @@ def format_novels_charcounts_data(counts_data: CountsData) -> list:
     assert isinstance(counts_data, CountsData)
 
     _PROC = f"{PROC}: format data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
     current = ElmType.NONE
@@ -66,7 +77,7 @@ def format_novels_charcounts_data(counts_data: CountsData) -> list:
         tmp.append(conv_charcounts_from(record))
         tmp.append(get_format_record_as_br())
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return tmp
 
 
@@ -74,9 +85,28 @@ def format_novels_data(novels_data: NovelsData, is_comment: bool) -> list:
     assert isinstance(novels_data, NovelsData)
     assert isinstance(is_comment, bool)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    return list(iter_novels_formatted(novels_data, is_comment))
+
+
+def iter_novels_formatted(novels_data: NovelsData, is_comment: bool) -> Iterator:
+    """Yield the formatted lines and the marks one by one, without empty lines."""
+    assert isinstance(novels_data, NovelsData)
+    assert isinstance(is_comment, bool)
+
+    logger.debug(msg.PROC_START, proc=PROC)
+
+    for record in _iter_formatted_records(novels_data, is_comment):
+        if record:
+            yield record
+
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
+
+
+# Private Functions
+def _iter_formatted_records(novels_data: NovelsData, is_comment: bool) -> Iterator:
+    assert isinstance(novels_data, NovelsData)
+    assert isinstance(is_comment, bool)
 
-    tmp = []
     is_br_mode = True
     has_first_indent = False
 
@@ -87,15 +117,17 @@ def format_novels_data(novels_data: NovelsData, is_comment: bool) -> list:
     for record in novels_data.get_data():
         assert isinstance(record, NovelRecord)
         if record.type in TITLES:
-            tmp.append(_record_as_title_from(record))
-            tmp.append(get_format_record_as_br(2))
+            if record.type in TITLE_ELMS:
+                yield get_format_record_as_mark(TITLE_ELMS[record.type], record.subject)
+            yield _record_as_title_from(record)
+            yield get_format_record_as_br(2)
         elif NovelType.PARAGRAPH_START is record.type:
             is_br_mode = False
         elif NovelType.PARAGRAPH_END is record.type:
-            tmp.append(get_format_record_as_br())
+            yield get_format_record_as_br()
             reset_br()
         elif NovelType.BR is record.type:
-            tmp.append(get_format_record_as_br())
+            yield get_format_record_as_br()
             reset_br()
         elif record.type in NORAL_DESCS:
             # br and indent
@@ -103,50 +135,32 @@ def format_novels_data(novels_data: NovelsData, is_comment: bool) -> list:
                 if NovelType.DIALOGUE is record.type:
                     has_first_indent = True
                 else:
-                    tmp.append(get_format_record_as_indent())
+                    yield get_format_record_as_indent()
             elif not has_first_indent:
-                tmp.append(get_format_record_as_indent())
+                yield get_format_record_as_indent()
                 has_first_indent = True
             # descriptions
             if NovelType.COMMENT is record.type:
                 if is_comment:
-                    tmp.append(get_format_record_as_comment(record.subject))
+                    yield get_format_record_as_comment(record.subject)
                 else:
                     continue
             elif NovelType.DESCRIPTION is record.type:
-                tmp.append(get_format_record_as_description(record.desc))
+                yield get_format_record_as_description(record.desc)
             elif NovelType.DIALOGUE is record.type:
-                tmp.append(get_format_record_as_dialogue(record.desc))
+                yield get_format_record_as_dialogue(record.desc)
             elif NovelType.PLAIN is record.type:
-                tmp.append(record.desc)
+                yield record.desc
             else:
                 pass
             if is_br_mode:
-                tmp.append(get_format_record_as_br())
+                yield get_format_record_as_br()
         elif NovelType.NONE is record.type:
             continue
         else:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"novel type in {PROC}"))
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"novel type in {PROC}")
             continue
 
-    eliminated = _eliminated_empty_record(tmp)
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-    return eliminated
-
-
-# Private Functions
-def _eliminated_empty_record(base_data: list) -> list:
-    assert isinstance(base_data, list)
-
-    tmp = []
-
-    for record in base_data:
-        if record:
-            tmp.append(record)
-
-    return tmp
-
 
 def _record_as_title_from(record: NovelRecord) -> str:
     assert isinstance(record, NovelRecord)
@@ -162,5 +176,5 @@ def _record_as_title_from(record: NovelRecord) -> str:
     elif NovelType.TITLE_TEXT is record.type:
         return f"[{record.subject}]"
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"novel type title in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"novel type title in {PROC}")
         return ""
@@ -7,6 +7,7 @@
 from stobu.formats.common import head_string_from_elm, get_format_record_as_br
 from stobu.formats.common import conv_charcounts_from
 from stobu.formats.common import get_breakline
+from stobu.formats.common import get_format_record_as_mark
 from stobu.syss import messages as msg
 from stobu.types.count import CountRecord, CountsData
 from stobu.types.element import ElmType
@@ -33,12 +34,20 @@ ENABLE_ELMS = [
         ]
 
 
+HEAD_ELMS = [
+        ElmType.BOOK,
+        ElmType.CHAPTER,
+        ElmType.EPISODE,
+        ]
+"""list: elements marked at their head string, each record title is marked as a scene."""
+
+
 # Main
 def format_outlines_charcounts_data(counts_data: CountsData) -> list:
     assert isinstance(counts_data, CountsData)
 
     _PROC = f"{PROC}: format data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
     current = ElmType.NONE
@@ -55,14 +64,14 @@ def format_outlines_charcounts_data(counts_data: CountsData) -> list:
         tmp.append(conv_charcounts_from(record))
         tmp.append(get_format_record_as_br())
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return tmp
 
 
 def format_outlines_data(outlines_data: OutlinesData) -> list:
     assert isinstance(outlines_data, OutlinesData)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     tmp = []
     current = ElmType.NONE
@@ -70,11 +79,14 @@ def format_outlines_data(outlines_data: OutlinesData) -> list:
     for record in outlines_data.get_data():
         assert isinstance(record, OutlineRecord)
         if current is not record.type:
+            if record.type in HEAD_ELMS:
+                tmp.append(get_format_record_as_mark(record.type, 'outlines'))
             tmp.append(head_string_from_elm(record.type, 'outlines'))
             current = record.type
+        tmp.append(get_format_record_as_mark(ElmType.SCENE, record.title))
         tmp.extend(_conv_output_record(record))
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return tmp
 
 
@@ -6,6 +6,7 @@
 # My Modules
 from stobu.formats.common import head_string_from_elm
 from stobu.formats.common import get_breakline
+from stobu.formats.common import get_format_record_as_mark
 from stobu.formats.common import get_format_record_as_br, head_string_from_elm
 from stobu.formats.common import conv_charcounts_from
 from stobu.syss import messages as msg
@@ -34,12 +35,20 @@ ENABLE_ELMS = [
         ]
 
 
+HEAD_ELMS = [
+        ElmType.BOOK,
+        ElmType.CHAPTER,
+        ElmType.EPISODE,
+        ]
+"""list: elements marked at their head string, each record title is marked as a scene."""
+
+
 # Main
 def format_plots_charcounts_data(counts_data: CountsData) -> list:
     assert isinstance(counts_data, CountsData)
 
     _PROC = f"{PROC}: format data"
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     tmp = []
     current = ElmType.NONE
@@ -56,7 +65,7 @@ def format_plots_charcounts_data(counts_data: CountsData) -> list:
         tmp.append(conv_charcounts_from(record))
         tmp.append(get_format_record_as_br())
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return tmp
 
 
@@ -69,8 +78,11 @@ def format_plots_data(plots_data: PlotsData) -> list:
     for record in plots_data.get_data():
         assert isinstance(record, PlotRecord)
         if current is not record.type:
+            if record.type in HEAD_ELMS:
+                tmp.append(get_format_record_as_mark(record.type, 'plots'))
             tmp.append(head_string_from_elm(record.type, 'plots'))
             current = record.type
+        tmp.append(get_format_record_as_mark(ElmType.SCENE, record.title))
         tmp.extend(_conv_output_record(record))
 
     return tmp
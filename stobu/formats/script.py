@@ -1,12 +1,13 @@
 """Format module for script data."""
 
 # Official Libraries
+from typing import Iterator
 
 
 # My Modules
 from stobu.formats.common import conv_charcounts_from
 from stobu.formats.common import get_breakline
-from stobu.formats.common import get_format_record_as_br
+from stobu.formats.common import get_format_record_as_br, get_format_record_as_mark
 from stobu.formats.common import head_string_from_elm
 from stobu.syss import messages as msg
 from stobu.types.count import CountRecord, CountsData
@@ -18,6 +19,7 @@ from stobu.utils.log import logger
 __all__ = (
         'format_scripts_charcounts_data',
         'format_scripts_data',
+        'iter_scripts_formatted',
         )
 
 
@@ -34,6 +36,14 @@ TITLES = [
         ]
 
 
+TITLE_ELMS = {
+        ScriptType.TITLE_BOOK: ElmType.BOOK,
+        ScriptType.TITLE_CHAPTER: ElmType.CHAPTER,
+        ScriptType.TITLE_EPISODE: ElmType.EPISODE,
+        ScriptType.TITLE_SCENE: ElmType.SCENE,
+        }
+"""dict: element of each title, marked for the counts."""
+
 
 NORMAL_SCRIPTS = [
         ScriptType.COMMENT,
@@ -55,7 +65,7 @@ def format_scripts_charcounts_data(counts_data: CountsData) -> list:
     assert isinstance(counts_data, CountsData)
 
     _PROC = f"{PROC}: format data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
     current = ElmType.NONE
@@ -72,7 +82,7 @@ def format_scripts_charcounts_data(counts_data: CountsData) -> list:
         tmp.append(conv_charcounts_from(record))
         tmp.append(get_format_record_as_br())
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return tmp
 
 
@@ -80,9 +90,39 @@ def format_scripts_data(scripts_data: ScriptsData, is_comment: bool) -> list:
     assert isinstance(scripts_data, ScriptsData)
     assert isinstance(is_comment, bool)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    return list(iter_scripts_formatted(scripts_data, is_comment))
+
+
+def iter_scripts_formatted(scripts_data: ScriptsData, is_comment: bool) -> Iterator:
+    """Yield the formatted lines and the marks one by one, without empty lines."""
+    assert isinstance(scripts_data, ScriptsData)
+    assert isinstance(is_comment, bool)
+
+    logger.debug(msg.PROC_START, proc=PROC)
+
+    for record in _iter_formatted_records(scripts_data, is_comment):
+        if record:
+            yield record
+
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
+
+
+# Private Functions
+def _get_record_as_br(num: int = 1) -> str:
+    assert isinstance(num, int)
+
+    return "\n" * num
+
+
+def _get_record_as_indent() -> str:
+    # NOTE: indent量は設定から決める。とりあえず空白３で
+    return "　　　"
+
+
+def _iter_formatted_records(scripts_data: ScriptsData, is_comment: bool) -> Iterator:
+    assert isinstance(scripts_data, ScriptsData)
+    assert isinstance(is_comment, bool)
 
-    tmp = []
     is_br_mode = True
     has_first_indent = False
 
@@ -93,20 +133,22 @@ def format_scripts_data(scripts_data: ScriptsData, is_comment: bool) -> list:
     for record in scripts_data.get_data():
         assert isinstance(record, ScriptRecord)
         if record.type in TITLES:
-            tmp.append(_record_as_title_from(record))
-            tmp.append(_get_record_as_br(2))
+            if record.type in TITLE_ELMS:
+                yield get_format_record_as_mark(TITLE_ELMS[record.type], record.subject)
+            yield _record_as_title_from(record)
+            yield _get_record_as_br(2)
             reset_br()
         elif ScriptType.PARAGRAPH_START is record.type:
             is_br_mode = False
         elif ScriptType.BR is record.type:
-            tmp.append(_get_record_as_br())
+            yield _get_record_as_br()
             reset_br()
         elif ScriptType.PARAGRAPH_END is record.type:
-            tmp.append(_get_record_as_br())
+            yield _get_record_as_br()
             reset_br()
         elif ScriptType.SPIN is record.type:
-            tmp.append(_record_as_spin_from(record))
-            tmp.append(_get_record_as_br())
+            yield _record_as_spin_from(record)
+            yield _get_record_as_br()
             reset_br()
         elif record.type in NORMAL_SCRIPTS:
             # br and indent
@@ -114,63 +156,34 @@ def format_scripts_data(scripts_data: ScriptsData, is_comment: bool) -> list:
                 if record.type in TALK_SCRIPTS:
                     has_first_indent = True
                 else:
-                    tmp.append(_get_record_as_indent())
+                    yield _get_record_as_indent()
             elif not has_first_indent:
-                tmp.append(_get_record_as_indent())
+                yield _get_record_as_indent()
                 has_first_indent = True
             # descriptions
             if ScriptType.COMMENT is record.type:
                 if is_comment:
-                    tmp.append(_record_as_comment_from(record))
+                    yield _record_as_comment_from(record)
                 else:
                     continue
             elif ScriptType.DESCRIPTION is record.type:
-                tmp.append(_record_as_description_from(record))
+                yield _record_as_description_from(record)
             elif ScriptType.DIALOGUE is record.type:
-                tmp.append(_record_as_dialogue_from(record))
+                yield _record_as_dialogue_from(record)
             elif ScriptType.MONOLOGUE is record.type:
-                tmp.append(_record_as_monologue_from(record))
+                yield _record_as_monologue_from(record)
             elif ScriptType.SE is record.type:
-                tmp.append(_record_as_se_from(record))
+                yield _record_as_se_from(record)
             else:
                 pass
             if is_br_mode:
-                tmp.append(_get_record_as_br())
+                yield _get_record_as_br()
         elif ScriptType.NONE is record.type:
             continue
         else:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"script type in {PROC}"))
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"script type in {PROC}")
             continue
 
-    eliminated = _eliminated_empty_record(tmp)
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-    return eliminated
-
-
-# Private Functions
-def _eliminated_empty_record(base_data: list) -> list:
-    assert isinstance(base_data, list)
-
-    tmp = []
-
-    for record in base_data:
-        if record:
-            tmp.append(record)
-
-    return tmp
-
-
-def _get_record_as_br(num: int = 1) -> str:
-    assert isinstance(num, int)
-
-    return "\n" * num
-
-
-def _get_record_as_indent() -> str:
-    # NOTE: indent量は設定から決める。とりあえず空白３で
-    return "　　　"
-
 
 def _record_as_comment_from(record: ScriptRecord) -> str:
     return f"<!--{record.subject}-->"
@@ -224,5 +237,5 @@ def _record_as_title_from(record: ScriptRecord) -> str:
     elif ScriptType.TITLE_TEXT is record.type:
         return f"[{record.subject}]"
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"script type title in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"script type title in {PROC}")
         return ""
@@ -30,7 +30,7 @@ def format_status_info_data(infos_data: InfosData, is_comment: bool) -> list:
     assert isinstance(infos_data, InfosData)
     assert isinstance(is_comment, bool)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     tmp = []
 
@@ -63,7 +63,7 @@ def format_status_info_data(infos_data: InfosData, is_comment: bool) -> list:
 
     eliminated = eliminated_empty_format_records_from(tmp)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
 
     return eliminated
 
@@ -9,7 +9,7 @@ from stobu.formats.common import conv_charcounts_from
 from stobu.formats.common import get_breakline
 from stobu.formats.common import get_format_record_as_br
 from stobu.formats.common import get_format_record_as_comment
-from stobu.formats.common import get_format_record_as_indent
+from stobu.formats.common import get_format_record_as_indent, get_format_record_as_mark
 from stobu.formats.common import head_string_from_elm
 from stobu.syss import messages as msg
 from stobu.types.action import ActType
@@ -54,7 +54,7 @@ def format_structs_charcounts_data(counts_data: CountsData) -> list:
     assert isinstance(counts_data, CountsData)
 
     _PROC = f"{PROC}: format data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
     current = ElmType.NONE
@@ -71,7 +71,7 @@ def format_structs_charcounts_data(counts_data: CountsData) -> list:
         tmp.append(conv_charcounts_from(record))
         tmp.append(get_format_record_as_br())
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return tmp
 
 
@@ -79,7 +79,7 @@ def format_structs_data(structs_data: StructsData, is_comment: bool) -> list:
     assert isinstance(structs_data, StructsData)
     assert isinstance(is_comment, bool)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     tmp = []
 
@@ -94,6 +94,7 @@ def format_structs_data(structs_data: StructsData, is_comment: bool) -> list:
                 if ret:
                     tmp.append(get_format_record_as_br())
                     tmp.append(get_breakline())
+                    tmp.append(get_format_record_as_mark(ElmType.BOOK, record.subject))
                     tmp.append(ret)
                     tmp.append(get_format_record_as_br(2))
             elif StructType.TITLE_CHAPTER is record.type:
@@ -101,6 +102,7 @@ def format_structs_data(structs_data: StructsData, is_comment: bool) -> list:
                 ret = _record_as_title_from(record, index)
                 if ret:
                     tmp.append(get_format_record_as_br())
+                    tmp.append(get_format_record_as_mark(ElmType.CHAPTER, record.subject))
                     tmp.append(ret)
                     tmp.append(get_format_record_as_br(2))
             elif StructType.TITLE_EPISODE is record.type:
@@ -108,6 +110,7 @@ def format_structs_data(structs_data: StructsData, is_comment: bool) -> list:
                 ret = _record_as_title_from(record, index)
                 if ret:
                     tmp.append(get_format_record_as_br())
+                    tmp.append(get_format_record_as_mark(ElmType.EPISODE, record.subject))
                     tmp.append(ret)
                     tmp.append(get_format_record_as_br(2))
             elif StructType.TITLE_SCENE is record.type:
@@ -145,12 +148,12 @@ def format_structs_data(structs_data: StructsData, is_comment: bool) -> list:
         elif StructType.SCENE_END is record.type:
             continue
         else:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA_WITH_DATA.format(data=f"struct type in {PROC}"), record.type)
+            logger.warning(msg.ERR_FAIL_INVALID_DATA_WITH_DATA, record.type, data=f"struct type in {PROC}")
             continue
 
     eliminated = _eliminated_empty_record(tmp)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
     return eliminated
 
 
@@ -299,5 +302,5 @@ def _record_as_title_from(record: StructRecord, index: HeadIndex) -> str:
     elif StructType.TITLE_TEXT is record.type:
         return f"[{record.subject}]"
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"struct type title in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"struct type title in {PROC}")
         return ""
@@ -1,18 +1,21 @@
 """Common module for info."""
 
 # Official Libraries
+from abc import ABC, abstractmethod
 
 
 # My Modules
 from stobu.syss import messages as msg
 from stobu.types.action import ActType
-from stobu.types.info import InfoType, InfoRecord
+from stobu.types.info import InfoType, InfoRecord, InfosData
 from stobu.utils.log import logger
 
 
 __all__ = (
+        'collect_infos_data',
         'get_record_as_data_title',
         'get_record_as_splitter',
+        'InfoCollector',
         )
 
 
@@ -21,6 +24,32 @@ PROC = 'INFO COMMON'
 
 
 # Main
+def collect_infos_data(infos_data: InfosData, collectors: list) -> list:
+    """Visit each record once with every collector of its type, and return their data."""
+    assert isinstance(infos_data, InfosData)
+    assert isinstance(collectors, list)
+
+    logger.debug(msg.PROC_START, proc=PROC)
+
+    visitors = {}
+
+    for collector in collectors:
+        assert isinstance(collector, InfoCollector)
+        for key in collector.TYPES + collector.ACTS:
+            visitors.setdefault(key, []).append(collector.visit)
+
+    for record in infos_data.get_data():
+        assert isinstance(record, InfoRecord)
+        # NOTE: アクションはその種類で振り分ける
+        key = record.act if InfoType.ACTION is record.type else record.type
+        for visit in visitors.get(key, ()):
+            visit(record)
+
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
+
+    return [collector.infos_data() for collector in collectors]
+
+
 def get_record_as_data_title(title: str) -> InfoRecord:
     assert isinstance(title, str)
 
@@ -30,3 +59,28 @@ def get_record_as_data_title(title: str) -> InfoRecord:
 
 def get_record_as_splitter() -> InfoRecord:
     return InfoRecord(InfoType.SPLITTER, ActType.DATA, '', '', '')
+
+
+class InfoCollector(ABC):
+    """Collector of the records of one info section, as the visitor of collect_infos_data.
+
+    TYPES are the info types of the records it visits, ACTS the act types of the
+    action records it visits, and visit appends the records of its section after
+    the title.
+    """
+
+    TYPES = ()
+
+    ACTS = ()
+
+    def __init__(self, title: str):
+        assert isinstance(title, str)
+
+        self.data = [get_record_as_splitter(), get_record_as_data_title(title)]
+
+    def infos_data(self) -> InfosData:
+        return InfosData.trusted(self.data)
+
+    @abstractmethod
+    def visit(self, record: InfoRecord) -> None:
+        """Take a record of the visited types into the data of the section."""
@@ -4,7 +4,7 @@
 
 
 # My Modules
-from stobu.infos.common import get_record_as_splitter, get_record_as_data_title
+from stobu.infos.common import collect_infos_data, InfoCollector
 from stobu.syss import messages as msg
 from stobu.types.action import ActType
 from stobu.types.info import InfoRecord, InfosData, InfoType
@@ -14,6 +14,7 @@ from stobu.utils.log import logger
 
 __all__ = (
         'flag_infos_from',
+        'FlagInfoCollector',
         )
 
 
@@ -25,32 +26,35 @@ PROC = 'INFO FLAGS'
 def flag_infos_from(infos_data: InfosData) -> InfosData:
     assert isinstance(infos_data, InfosData)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
-    tmp = []
-    index = 0
+    flags, = collect_infos_data(infos_data, [FlagInfoCollector()])
 
-    tmp.append(get_record_as_splitter())
-    tmp.append(get_record_as_data_title('SCENE FLAG INFOS'))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
 
-    for record in infos_data.get_data():
+    return flags
+
+
+class FlagInfoCollector(InfoCollector):
+
+    TYPES = (InfoType.FLAG_FORESHADOW, InfoType.FLAG_PAYOFF, InfoType.TITLE_EPISODE,
+            InfoType.TITLE_SCENE)
+
+    def __init__(self):
+        super().__init__('SCENE FLAG INFOS')
+        self.index = 0
+
+    def visit(self, record: InfoRecord) -> None:
         assert isinstance(record, InfoRecord)
-        if InfoType.ACTION is record.type:
-            continue
-        elif InfoType.FLAG_FORESHADOW is record.type:
-            tmp.append(_record_as_flag_info_from(record, index, FlagType.FLAG))
+
+        if InfoType.FLAG_FORESHADOW is record.type:
+            self.data.append(_record_as_flag_info_from(record, self.index, FlagType.FLAG))
         elif InfoType.FLAG_PAYOFF is record.type:
-            tmp.append(_record_as_flag_info_from(record, index, FlagType.DEFLAG))
+            self.data.append(_record_as_flag_info_from(record, self.index, FlagType.DEFLAG))
         elif InfoType.TITLE_EPISODE is record.type:
-            tmp.append(_get_record_as_flag_info_split())
+            self.data.append(_get_record_as_flag_info_split())
         elif InfoType.TITLE_SCENE is record.type:
-            index += 1
-        else:
-            continue
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-
-    return InfosData(tmp)
+            self.index += 1
 
 
 # Private Functions
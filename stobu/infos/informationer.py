@@ -4,35 +4,38 @@
 
 
 # My Modules
-from stobu.core.nametagcreator import get_calling_tags
+from stobu.core.nametagcreator import get_calling_translators
 from stobu.formats.info import format_infos_data
 from stobu.formats.statusinfo import format_status_info_data
-from stobu.infos.fashioninfos import fashion_infos_from
-from stobu.infos.flaginfos import flag_infos_from
-from stobu.infos.iteminfos import item_infos_from
-from stobu.infos.knowledgeinfos import knowledge_infos_from
-from stobu.infos.personinfos import person_infos_from
-from stobu.infos.stageinfos import stage_infos_from
+from stobu.infos.common import collect_infos_data
+from stobu.infos.fashioninfos import FashionInfoCollector
+from stobu.infos.flaginfos import FlagInfoCollector
+from stobu.infos.iteminfos import ItemInfoCollector
+from stobu.infos.knowledgeinfos import KnowledgeInfoCollector
+from stobu.infos.personinfos import PersonInfoCollector
+from stobu.infos.stageinfos import StageInfoCollector
 from stobu.infos.statusinfomations import person_status_info_from
 from stobu.infos.statusinfomations import stage_status_info_from
-from stobu.infos.transitions import scene_transition_data_from
+from stobu.infos.transitions import SceneTransitionCollector
 from stobu.syss import messages as msg
-from stobu.tools.translater import translate_tags_text_list, translate_tags_str
+from stobu.tools.translater import TagTranslator, translate_tags_text_list, translate_tags_str
 from stobu.types.action import ActDataType, ActionRecord, ActionsData, ActType
 from stobu.types.action import TITLE_ACTIONS, NORMAL_ACTIONS
 from stobu.types.info import InfoRecord, InfosData, InfoType
 from stobu.types.info import SceneInfo
 from stobu.types.output import OutputsData
 from stobu.utils import assertion
-from stobu.utils.dicts import dict_sorted
 from stobu.utils.log import logger
 
 
 __all__ = (
         'infos_data_from',
+        'infos_data_from_base',
         'outputs_data_from_infos_data',
         'status_infos_data_from',
+        'status_infos_data_from_base',
         'outputs_data_from_status_infos_data',
+        'tagged_base_infos_data_from',
         )
 
 
@@ -40,25 +43,40 @@ __all__ = (
 PROC = 'INFORAMATIONER'
 
 
+INFO_COLLECTORS = (
+        ('transition', SceneTransitionCollector),
+        ('flag', FlagInfoCollector),
+        ('person', PersonInfoCollector),
+        ('fashion', FashionInfoCollector),
+        ('knowledge', KnowledgeInfoCollector),
+        ('stage', StageInfoCollector),
+        ('item', ItemInfoCollector),
+        )
+"""tuple: name and collector of each info section, in order of the sections."""
+
+
 # Main
 def infos_data_from(actions_data: ActionsData, tags: dict) -> InfosData:
     assert isinstance(actions_data, ActionsData)
     assert isinstance(tags, dict)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    return infos_data_from_base(tagged_base_infos_data_from(actions_data, tags))
 
-    base_data = _base_data_from(actions_data)
 
-    updated = update_data_tags(base_data, tags)
+def infos_data_from_base(base_data: InfosData) -> InfosData:
+    """Scene infos from the tagged base infos, that may be shared with the status infos."""
+    assert isinstance(base_data, InfosData)
 
-    data_set = _get_info_data_set(updated)
+    logger.debug(msg.PROC_START, proc=PROC)
+
+    data_set = _get_info_data_set(base_data)
     if not data_set or not data_set.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"data set in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"data set in {PROC}")
         return None
 
     eliminated = _eliminate_empty_records(data_set)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
 
     return eliminated
 
@@ -70,14 +88,14 @@ def outputs_data_from_infos_data(infos_data: InfosData, tags: dict,
     assert isinstance(is_comment, bool)
 
     _PROC = f"{PROC}: convert outputs data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     formatted = format_infos_data(infos_data, is_comment)
 
     translated = translate_tags_text_list(formatted, tags)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
-    return OutputsData(translated)
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
+    return OutputsData.trusted(translated)
 
 
 def outputs_data_from_status_infos_data(infos_data: InfosData, tags: dict,
@@ -87,61 +105,75 @@ def outputs_data_from_status_infos_data(infos_data: InfosData, tags: dict,
     assert isinstance(is_comment, bool)
 
     _PROC = f"INFO STATUS: convert outputs data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     formatted = format_status_info_data(infos_data, is_comment)
 
     translated = translate_tags_text_list(formatted, tags)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
-    return OutputsData(translated)
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
+    return OutputsData.trusted(translated)
 
 
 def status_infos_data_from(actions_data: ActionsData, tags: dict) -> InfosData:
     assert isinstance(actions_data, ActionsData)
     assert isinstance(tags, dict)
 
-    _PROC = f"{PROC}: status info"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    return status_infos_data_from_base(tagged_base_infos_data_from(actions_data, tags))
 
-    base_data = _base_data_from(actions_data)
 
-    updated = update_data_tags(base_data, tags)
+def status_infos_data_from_base(base_data: InfosData) -> InfosData:
+    """Status infos from the tagged base infos, that may be shared with the scene infos."""
+    assert isinstance(base_data, InfosData)
 
-    data_set = _get_status_info_data_set(updated)
+    _PROC = f"{PROC}: status info"
+    logger.debug(msg.PROC_START, proc=_PROC)
+
+    data_set = _get_status_info_data_set(base_data)
     if not data_set or not data_set.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"data set in {_PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"data set in {_PROC}")
         return None
 
     eliminated = _eliminate_empty_records(data_set)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
 
     return eliminated
 
 
+def tagged_base_infos_data_from(actions_data: ActionsData, tags: dict) -> InfosData:
+    """Base infos of the actions with the tags translated, the source of all the infos."""
+    assert isinstance(actions_data, ActionsData)
+    assert isinstance(tags, dict)
+
+    base_data = _base_data_from(actions_data)
+
+    return update_data_tags(base_data, tags)
+
+
 def update_data_tags(origin_data: list, tags: dict) -> InfosData:
     assert isinstance(origin_data, list)
     assert isinstance(tags, dict)
 
     _PROC = f"{PROC}: update tags"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
-    callings = get_calling_tags()
+    translator = TagTranslator(tags)
+    callings = get_calling_translators()
 
     for record in origin_data:
         assert isinstance(record, InfoRecord)
         if record.type is InfoType.ACTION:
-            tmp.append(_update_tags_action_record(record, tags, callings))
+            tmp.append(_update_tags_action_record(record, translator, callings))
         elif InfoType.SCENE_HEAD is record.type:
-            tmp.append(_update_tags_scene_head_record(record, tags))
+            tmp.append(_update_tags_scene_head_record(record, translator))
         else:
             tmp.append(record)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
 
-    return InfosData(tmp)
+    return InfosData.trusted(tmp)
 
 
 # Sub processes
@@ -149,47 +181,22 @@ def _get_info_data_set(base_data: InfosData) -> InfosData:
     assert isinstance(base_data, InfosData)
 
     _PROC = f"{PROC}: info data set"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
-
-    transitions = scene_transition_data_from(base_data)
-    if not transitions or not transitions.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"transition data in {_PROC}"))
-        return None
-
-    flags = flag_infos_from(base_data)
-    if not flags or not flags.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"flag data in {_PROC}"))
-        return None
+    logger.debug(msg.PROC_START, proc=_PROC)
 
-    persons = person_infos_from(base_data)
-    if not persons or not persons.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"person data in {_PROC}"))
-        return None
-
-    fashions = fashion_infos_from(base_data)
-    if not fashions or not fashions.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"fashion data in {_PROC}"))
-        return None
+    collected = collect_infos_data(base_data,
+            [collector() for _, collector in INFO_COLLECTORS])
 
-    knowledges = knowledge_infos_from(base_data)
-    if not knowledges or not knowledges.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"knowledge data in {_PROC}"))
-        return None
-
-    stages = stage_infos_from(base_data)
-    if not stages or not stages.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"stage data in {_PROC}"))
-        return None
+    tmp = []
 
-    items = item_infos_from(base_data)
-    if not items or not items.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"item data in {_PROC}"))
-        return None
+    for (name, _), data in zip(INFO_COLLECTORS, collected):
+        if not data or not data.has_data():
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"{name} data in {_PROC}")
+            return None
+        tmp.extend(data.get_data())
 
-    data_set = transitions + flags + persons + fashions + knowledges + stages + items
-    assert isinstance(data_set, InfosData)
+    data_set = InfosData.trusted(tmp)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return data_set
 
 
@@ -197,21 +204,21 @@ def _get_status_info_data_set(infos_data: InfosData) -> InfosData:
     assert isinstance(infos_data, InfosData)
 
     _PROC = f"{PROC}: status info set"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     persons = person_status_info_from(infos_data)
     if not persons or not persons.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"persons status data in {_PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"persons status data in {_PROC}")
         return None
 
     stages = stage_status_info_from(infos_data)
     if not stages or not stages.has_data():
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"stages status data in {_PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"stages status data in {_PROC}")
         return None
 
     data_set = persons + stages
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
 
     return data_set
 
@@ -221,7 +228,7 @@ def _base_data_from(actions_data: ActionsData) -> list:
     assert isinstance(actions_data, ActionsData)
 
     _PROC = f"{PROC}: base data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
     cache = SceneInfo()
@@ -260,19 +267,19 @@ def _base_data_from(actions_data: ActionsData) -> list:
             elif ActDataType.TEXT is record.subtype:
                 continue
             else:
-                logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"act data type in {PROC}"))
+                logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"act data type in {PROC}")
                 continue
         elif record.type in NORMAL_ACTIONS:
             tmp.append(_record_as_action_from(record))
         elif ActType.NONE is record.type:
             continue
         elif ActType.SAME is record.type:
-            logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"same act type in {PROC}"))
+            logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"same act type in {PROC}")
             continue
         else:
             continue
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
     return tmp
 
 
@@ -293,7 +300,7 @@ def _eliminate_empty_records(base_data: InfosData) -> InfosData:
         else:
             tmp.append(record)
 
-    return InfosData(tmp)
+    return InfosData.trusted(tmp)
 
 
 def _get_record_as_scene_end() -> InfoRecord:
@@ -373,22 +380,22 @@ def _title_from(record: ActionRecord) -> InfoType:
     elif ActDataType.SCENE_HEAD is record.subtype:
         return InfoType.TITLE_TEXT
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"title data type in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"title data type in {PROC}")
         return InfoType.NONE
 
 
-def _update_tags_action_record(record: InfoRecord, tags: dict,
+def _update_tags_action_record(record: InfoRecord, translator: TagTranslator,
         callings: dict) -> InfoRecord:
     assert isinstance(record, InfoRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(translator, TagTranslator)
     assert isinstance(callings, dict)
 
     if record.subject in callings:
-        calling = dict_sorted(callings[record.subject], True)
+        calling = callings[record.subject]
         return InfoRecord(
             record.type,
             record.act,
-            translate_tags_str(record.subject, tags, True, None),
+            translate_tags_str(record.subject, translator, True, None),
             translate_tags_str(record.outline, calling),
             translate_tags_str(record.note, calling),
             )
@@ -396,23 +403,23 @@ def _update_tags_action_record(record: InfoRecord, tags: dict,
         return InfoRecord(
                 record.type,
                 record.act,
-                translate_tags_str(record.subject, tags, True, None),
+                translate_tags_str(record.subject, translator, True, None),
                 record.outline,
                 record.note,
                 )
 
 
-def _update_tags_scene_head_record(record: InfoRecord, tags: dict) -> InfoRecord:
+def _update_tags_scene_head_record(record: InfoRecord, translator: TagTranslator) -> InfoRecord:
     assert isinstance(record, InfoRecord)
-    assert isinstance(tags, dict)
+    assert isinstance(translator, TagTranslator)
 
     info = assertion.is_instance(record.note, SceneInfo)
     _info = SceneInfo()
-    _info.camera = translate_tags_str(info.camera, tags, True, None)
-    _info.stage = translate_tags_str(info.stage, tags, True, None)
-    _info.year = translate_tags_str(str(info.year), tags, True, None)
-    _info.date = translate_tags_str(str(info.date), tags, True, None)
-    _info.time = translate_tags_str(str(info.time), tags, True, None)
+    _info.camera = translate_tags_str(info.camera, translator, True, None)
+    _info.stage = translate_tags_str(info.stage, translator, True, None)
+    _info.year = translate_tags_str(str(info.year), translator, True, None)
+    _info.date = translate_tags_str(str(info.date), translator, True, None)
+    _info.time = translate_tags_str(str(info.time), translator, True, None)
 
     return InfoRecord(
             record.type,
@@ -4,7 +4,7 @@
 
 
 # My Modules
-from stobu.infos.common import get_record_as_data_title, get_record_as_splitter
+from stobu.infos.common import collect_infos_data, InfoCollector
 from stobu.syss import messages as msg
 from stobu.types.action import ActType
 from stobu.types.info import InfoRecord, InfosData, InfoType
@@ -14,6 +14,7 @@ from stobu.utils.log import logger
 
 __all__ = (
         'item_infos_from',
+        'ItemInfoCollector',
         )
 
 
@@ -25,30 +26,36 @@ PROC = 'INFO ITEM'
 def item_infos_from(infos_data: InfosData) -> InfosData:
     assert isinstance(infos_data, InfosData)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
-    tmp = []
-    index = 0
+    items, = collect_infos_data(infos_data, [ItemInfoCollector()])
 
-    tmp.append(get_record_as_splitter())
-    tmp.append(get_record_as_data_title('ITEM INFOS'))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
 
-    for record in infos_data.get_data():
+    return items
+
+
+class ItemInfoCollector(InfoCollector):
+
+    TYPES = (InfoType.TITLE_EPISODE, InfoType.TITLE_SCENE)
+
+    ACTS = (ActType.HAVE, ActType.DISCARD)
+
+    def __init__(self):
+        super().__init__('ITEM INFOS')
+        self.index = 0
+
+    def visit(self, record: InfoRecord) -> None:
         assert isinstance(record, InfoRecord)
+
         if InfoType.ACTION is record.type:
-            ret = _record_as_item_info_from(index, record)
+            ret = _record_as_item_info_from(self.index, record)
             if ret:
-                tmp.append(ret)
+                self.data.append(ret)
         elif InfoType.TITLE_EPISODE is record.type:
-            tmp.append(_get_record_as_splitter())
+            self.data.append(_get_record_as_splitter())
         elif InfoType.TITLE_SCENE is record.type:
-            index += 1
-        else:
-            continue
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-
-    return InfosData(tmp)
+            self.index += 1
 
 
 # Private Functions
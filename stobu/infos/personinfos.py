@@ -4,7 +4,7 @@
 
 
 # My Modules
-from stobu.infos.common import get_record_as_splitter, get_record_as_data_title
+from stobu.infos.common import collect_infos_data, InfoCollector
 from stobu.syss import messages as msg
 from stobu.types.action import ActType
 from stobu.types.info import InfoRecord, InfosData, InfoType
@@ -14,6 +14,7 @@ from stobu.utils.log import logger
 
 __all__ = (
         'person_infos_from',
+        'PersonInfoCollector',
         )
 
 
@@ -25,30 +26,36 @@ PROC = 'INFO PERSONS'
 def person_infos_from(infos_data: InfosData) -> InfosData:
     assert isinstance(infos_data, InfosData)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
-    tmp = []
-    index = 0
+    persons, = collect_infos_data(infos_data, [PersonInfoCollector()])
 
-    tmp.append(get_record_as_splitter())
-    tmp.append(get_record_as_data_title('PERSON INFOS'))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
 
-    for record in infos_data.get_data():
+    return persons
+
+
+class PersonInfoCollector(InfoCollector):
+
+    TYPES = (InfoType.TITLE_EPISODE, InfoType.TITLE_SCENE)
+
+    ACTS = (ActType.BE, ActType.COME, ActType.GO)
+
+    def __init__(self):
+        super().__init__('PERSON INFOS')
+        self.index = 0
+
+    def visit(self, record: InfoRecord) -> None:
         assert isinstance(record, InfoRecord)
+
         if InfoType.ACTION is record.type:
-            ret = _record_as_person_info_from(index, record)
+            ret = _record_as_person_info_from(self.index, record)
             if ret:
-                tmp.append(ret)
+                self.data.append(ret)
         elif InfoType.TITLE_EPISODE is record.type:
-            tmp.append(_get_record_as_data_splitter())
+            self.data.append(_get_record_as_data_splitter())
         elif InfoType.TITLE_SCENE is record.type:
-            index += 1
-        else:
-            continue
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-
-    return InfosData(tmp)
+            self.index += 1
 
 
 # Private Functions
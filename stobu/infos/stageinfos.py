@@ -4,7 +4,7 @@
 
 
 # My Modules
-from stobu.infos.common import get_record_as_data_title, get_record_as_splitter
+from stobu.infos.common import collect_infos_data, InfoCollector
 from stobu.syss import messages as msg
 from stobu.types.action import ActType
 from stobu.types.info import InfoRecord, InfosData, InfoType
@@ -16,6 +16,7 @@ from stobu.utils.log import logger
 
 __all__ = (
         'stage_infos_from',
+        'StageInfoCollector',
         )
 
 
@@ -27,34 +28,40 @@ PROC = 'INFO STAGE'
 def stage_infos_from(infos_data: InfosData) -> InfosData:
     assert isinstance(infos_data, InfosData)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
-    tmp = []
-    index = 0
-    current = None
+    stages, = collect_infos_data(infos_data, [StageInfoCollector()])
 
-    tmp.append(get_record_as_splitter())
-    tmp.append(get_record_as_data_title('STAGE INFOS'))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
 
-    for record in infos_data.get_data():
+    return stages
+
+
+class StageInfoCollector(InfoCollector):
+
+    TYPES = (InfoType.TITLE_EPISODE, InfoType.TITLE_SCENE, InfoType.SCENE_HEAD)
+
+    ACTS = (ActType.DRAW, ActType.PUT, ActType.RID)
+
+    def __init__(self):
+        super().__init__('STAGE INFOS')
+        self.index = 0
+        self.current = None
+
+    def visit(self, record: InfoRecord) -> None:
         assert isinstance(record, InfoRecord)
+
         if InfoType.ACTION is record.type:
-            ret = _record_as_stage_info_from(index, current, record)
+            ret = _record_as_stage_info_from(self.index, self.current, record)
             if ret:
-                tmp.append(ret)
+                self.data.append(ret)
         elif InfoType.TITLE_EPISODE is record.type:
-            tmp.append(_get_record_as_splitter())
+            self.data.append(_get_record_as_splitter())
         elif InfoType.TITLE_SCENE is record.type:
-            index += 1
+            self.index += 1
         elif InfoType.SCENE_HEAD is record.type:
             info = assertion.is_instance(record.note, SceneInfo)
-            current = info.stage
-        else:
-            continue
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-
-    return InfosData(tmp)
+            self.current = info.stage
 
 
 # Private Functions
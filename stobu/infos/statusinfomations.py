@@ -1,6 +1,7 @@
 """Status info creator module."""
 
 # Official Libraries
+from collections import defaultdict
 
 
 # My Modules
@@ -10,6 +11,7 @@ from stobu.infos.common import get_record_as_data_title, get_record_as_splitter
 from stobu.syss import messages as msg
 from stobu.tools.datareader import stage_item_of
 from stobu.tools.pathgetter import filepaths_by_elm
+from stobu.tools.projectdatacache import value_with_cache
 from stobu.types.action import ActType
 from stobu.types.element import ElmType
 from stobu.types.info import InfosData, InfoRecord, InfoType
@@ -36,30 +38,30 @@ def person_status_info_from(infos_data: InfosData) -> InfosData:
     assert isinstance(infos_data, InfosData)
 
     _PROC = f"{PROC}: person status"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     base_data = _base_person_status_data_from(infos_data)
 
     reordered = _reorder_each_persons(base_data)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
 
-    return InfosData(reordered)
+    return InfosData.trusted(reordered)
 
 
 def stage_status_info_from(infos_data: InfosData) -> InfosData:
     assert isinstance(infos_data, InfosData)
 
     _PROC = f"{PROC}: stage status"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     base_data = _base_stage_status_data_from(infos_data)
 
     reordered = _reorder_each_stages(base_data)
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
 
-    return InfosData(reordered)
+    return InfosData.trusted(reordered)
 
 
 # Sub processes
@@ -67,7 +69,7 @@ def _base_person_status_data_from(infos_data: InfosData) -> list:
     assert isinstance(infos_data, InfosData)
 
     _PROC = f"{PROC}: base person data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
     index = 0
@@ -83,7 +85,7 @@ def _base_person_status_data_from(infos_data: InfosData) -> list:
         else:
             continue
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
 
     return tmp
 
@@ -92,7 +94,7 @@ def _base_stage_status_data_from(infos_data: InfosData) -> list:
     assert isinstance(infos_data, InfosData)
 
     _PROC = f"{PROC}: base stage data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
     index = 0
@@ -112,7 +114,7 @@ def _base_stage_status_data_from(infos_data: InfosData) -> list:
         else:
             continue
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
 
     return tmp
 
@@ -121,7 +123,7 @@ def _reorder_each_persons(base_data: list) -> list:
     assert isinstance(base_data, list)
 
     _PROC = f"{PROC}: reorder person data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
 
@@ -130,15 +132,17 @@ def _reorder_each_persons(base_data: list) -> list:
     tmp.append(get_record_as_splitter())
     tmp.append(get_record_as_data_title("PERSON STATUS TRANSITIONS"))
 
+    groups = defaultdict(list)
+    for record in base_data:
+        assert isinstance(record, InfoRecord)
+        info = assertion.is_instance(record.note, PersonStateInfo)
+        groups[info.subject].append(record)
+
     for person in persons:
         tmp.append(_get_record_as_data_splitter(ElmType.PERSON))
-        for record in base_data:
-            assert isinstance(record, InfoRecord)
-            info = assertion.is_instance(record.note, PersonStateInfo)
-            if info.subject == person:
-                tmp.append(record)
+        tmp.extend(groups.get(person, []))
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
 
     return tmp
 
@@ -147,7 +151,7 @@ def _reorder_each_stages(base_data: list) -> list:
     assert isinstance(base_data, list)
 
     _PROC = f"{PROC}: reorder stage data"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     tmp = []
 
@@ -156,21 +160,27 @@ def _reorder_each_stages(base_data: list) -> list:
     tmp.append(get_record_as_splitter())
     tmp.append(get_record_as_data_title("STAGE STATUS TRANSITIONS"))
 
+    groups = defaultdict(list)
+    for record in base_data:
+        assert isinstance(record, InfoRecord)
+        info = assertion.is_instance(record.note, StageStateInfo)
+        groups[info.stage].append(record)
+
     for stage in stages:
         tmp.append(_get_record_as_data_splitter(ElmType.STAGE))
-        for record in base_data:
-            assert isinstance(record, InfoRecord)
-            info = assertion.is_instance(record.note, StageStateInfo)
-            if info.stage == stage:
-                tmp.append(record)
+        tmp.extend(groups.get(stage, []))
 
-    logger.debug(msg.PROC_SUCCESS.format(proc=_PROC))
+    logger.debug(msg.PROC_SUCCESS, proc=_PROC)
 
     return tmp
 
 
 # Private Functions
 def _get_persons_list() -> list:
+    return value_with_cache('persons list', _persons_list_from_callings)
+
+
+def _persons_list_from_callings() -> list:
     callings = get_calling_tags()
 
     tmp = []
@@ -193,6 +203,10 @@ def _get_record_as_data_splitter(elm: ElmType) -> InfoRecord:
 
 
 def _get_stages_list() -> list:
+    return value_with_cache('stages list', _stages_list_from_files)
+
+
+def _stages_list_from_files() -> list:
     tmp = []
 
     paths = filepaths_by_elm(ElmType.STAGE)
@@ -4,7 +4,7 @@
 
 
 # My Modules
-from stobu.infos.common import get_record_as_splitter
+from stobu.infos.common import collect_infos_data, InfoCollector
 from stobu.syss import messages as msg
 from stobu.types.action import ActType
 from stobu.types.info import InfoRecord, InfosData, InfoType
@@ -15,6 +15,7 @@ from stobu.utils.log import logger
 
 __all__ = (
         'scene_transition_data_from',
+        'SceneTransitionCollector',
         )
 
 
@@ -26,33 +27,34 @@ PROC = 'INFO SCENE TRANSITION'
 def scene_transition_data_from(infos_data: InfosData) -> InfosData:
     assert isinstance(infos_data, InfosData)
 
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
-    tmp = []
-    cache = SceneInfo()
+    transitions, = collect_infos_data(infos_data, [SceneTransitionCollector()])
 
-    tmp.append(get_record_as_splitter())
-    tmp.append(InfoRecord(
-        InfoType.DATA_TITLE, ActType.DATA, '## SCENE TRANSITIONS', '', ''))
+    logger.debug(msg.PROC_SUCCESS, proc=PROC)
 
-    for record in infos_data.get_data():
+    return transitions
+
+
+class SceneTransitionCollector(InfoCollector):
+
+    TYPES = (InfoType.SCENE_HEAD, InfoType.TITLE_EPISODE)
+
+    def __init__(self):
+        super().__init__('SCENE TRANSITIONS')
+        self.cache = SceneInfo()
+
+    def visit(self, record: InfoRecord) -> None:
         assert isinstance(record, InfoRecord)
+
         if InfoType.SCENE_HEAD is record.type:
-            tmp.append(_record_of_scene_transition_from(record, cache))
-            tmp.append(
+            self.data.append(_record_of_scene_transition_from(record, self.cache))
+            self.data.append(
                     InfoRecord(InfoType.SCENE_TRANSITION, record.act,
                         record.subject, record.outline, record.note))
-            cache = record.note
+            self.cache = record.note
         elif InfoType.TITLE_EPISODE is record.type:
-            tmp.append(_get_record_as_transition_split())
-        elif InfoType.TITLE_SCENE is record.type:
-            continue
-        else:
-            continue
-
-    logger.debug(msg.PROC_SUCCESS.format(proc=PROC))
-
-    return InfosData(tmp)
+            self.data.append(_get_record_as_transition_split())
 
 
 # Private Functions
@@ -15,6 +15,8 @@ PROC_DONE = '... {proc} ...DONE.'
 
 PROC_DONE_WITH_DATA = '... {proc} ...DONE: %s'
 
+PROC_DONE_IN = '... {proc} ...DONE in {elapsed:.1f}ms.'
+
 PROC_INITIALIZED = '... {proc} Initialized.'
 
 PROC_MESSAGE = '... {proc}.'
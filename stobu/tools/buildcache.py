@@ -0,0 +1,220 @@
+"""Build cache module."""
+
+# Official Libraries
+import hashlib
+import os
+import pickle
+from typing import Any, Callable
+
+
+# My Modules
+from stobu import __version__
+from stobu.syss import messages as msg
+from stobu.tools.pathgetter import filepath_of
+from stobu.types.element import ElmType
+from stobu.utils.fileio import read_file
+from stobu.utils.log import logger
+from stobu.utils.parallel import map_in_parallel
+
+
+__all__ = (
+        'BuildCache',
+        'load_build_cache',
+        'read_data_list_with_cache',
+        'read_data_with_cache',
+        'save_build_cache',
+        )
+
+
+# Define Constants
+PROC = 'TOOL BUILD CACHE'
+
+
+CACHE_FILENAME = 'buildcache'
+"""str: file name of the build cache in the build directory."""
+
+CACHE_EXT = 'pickle'
+"""str: extention of the build cache file."""
+
+CACHE_FORMAT = 4
+"""int: format of the pickled records, raised when the record types change."""
+
+CACHE_VERSION = f"{__version__}.{CACHE_FORMAT}"
+"""str: version of the build cache, an older cache is discarded."""
+
+
+# Main
+class BuildCache(object):
+    """Parsed source data and scene action records, keyed by content hash."""
+
+    def __init__(self):
+        self.version = CACHE_VERSION
+        self.sources = {}
+        self.scenes = {}
+        self.hashes = {}
+        self.hits = 0
+        self.misses = 0
+
+    def read_data(self, path: str, parser: Callable) -> Any:
+        assert isinstance(path, str)
+        assert callable(parser)
+
+        raw = read_file(path)
+        is_cached, data = self.cached_data_of(path, raw)
+        if is_cached:
+            return data
+
+        data = parser(raw)
+        self.set_data(path, data)
+        return data
+
+    def cached_data_of(self, path: str, raw: str) -> tuple:
+        assert isinstance(path, str)
+        assert isinstance(raw, str)
+
+        digest = _hash_of(raw)
+        self.hashes[path] = digest
+
+        cached = self.sources.get(path)
+        if cached and cached[0] == digest:
+            self.hits += 1
+            return True, cached[1]
+
+        self.misses += 1
+        return False, None
+
+    def set_data(self, path: str, data: Any) -> None:
+        assert path in self.hashes
+
+        self.sources[path] = (self.hashes[path], data)
+
+    def action_records_of(self, path: str, headers: tuple, conv: Callable) -> tuple:
+        """Get the action records and the line errors of a scene, as (records, errors).
+
+        The errors are kept with the records, so a cached scene reports them again.
+        """
+        assert isinstance(path, str)
+        assert isinstance(headers, tuple)
+        assert callable(conv)
+
+        key = (self.hashes.get(path), headers)
+
+        cached = self.scenes.get(path)
+        if key[0] and cached and cached[0] == key:
+            self.hits += 1
+            return list(cached[1]), list(cached[2])
+
+        self.misses += 1
+        records, errors = conv()
+        self.scenes[path] = (key, list(records), tuple(errors))
+        return records, errors
+
+    def prune(self) -> None:
+        self.sources = {k: v for k, v in self.sources.items() if os.path.exists(k)}
+        self.scenes = {k: v for k, v in self.scenes.items() if os.path.exists(k)}
+        self.hashes = {}
+        self.hits = 0
+        self.misses = 0
+
+
+def load_build_cache() -> BuildCache:
+    path = _get_cache_path()
+
+    if not os.path.exists(path):
+        return BuildCache()
+
+    try:
+        with open(path, 'rb') as file:
+            # NOTE: 古い形式のレコードを読み込まないよう、先に版だけを確かめる
+            version = pickle.load(file)
+            if version != CACHE_VERSION:
+                logger.debug(msg.PROC_MESSAGE, proc=f"discard old build cache in {PROC}")
+                return BuildCache()
+            cache = pickle.load(file)
+    except Exception as err:
+        logger.warning(msg.ERR_FAIL_INVALID_DATA_WITH_DATA, err, data=f"build cache in {PROC}")
+        return BuildCache()
+
+    if not isinstance(cache, BuildCache) or cache.version != CACHE_VERSION:
+        logger.debug(msg.PROC_MESSAGE, proc=f"discard old build cache in {PROC}")
+        return BuildCache()
+
+    return cache
+
+
+def read_data_list_with_cache(targets: list, cache: BuildCache = None, jobs: int = 1) -> list:
+    """Read the list of (path, parser), parsing the uncached data on a process pool."""
+    assert isinstance(targets, list)
+    assert isinstance(jobs, int)
+
+    tmp = []
+    uncached = []
+
+    for path, parser in targets:
+        assert isinstance(path, str)
+        raw = read_file(path)
+        if cache:
+            assert isinstance(cache, BuildCache)
+            is_cached, data = cache.cached_data_of(path, raw)
+            if is_cached:
+                tmp.append(data)
+                continue
+        tmp.append(None)
+        uncached.append((len(tmp) - 1, path, parser, raw))
+
+    parsed = map_in_parallel(_parse_raw_data, [(parser, raw) for _, _, parser, raw in uncached], jobs)
+
+    for (idx, path, _, _), data in zip(uncached, parsed):
+        tmp[idx] = data
+        if cache:
+            cache.set_data(path, data)
+
+    return tmp
+
+
+def read_data_with_cache(path: str, parser: Callable, cache: BuildCache = None) -> Any:
+    assert isinstance(path, str)
+    assert callable(parser)
+
+    if cache:
+        assert isinstance(cache, BuildCache)
+        return cache.read_data(path, parser)
+    else:
+        return parser(read_file(path))
+
+
+def save_build_cache(cache: BuildCache) -> bool:
+    assert isinstance(cache, BuildCache)
+
+    logger.debug(msg.PROC_MESSAGE,
+        proc=f"build cache hits: {cache.hits}, misses: {cache.misses} in {PROC}")
+
+    cache.prune()
+    path = _get_cache_path()
+
+    try:
+        with open(path, 'wb') as file:
+            pickle.dump(cache.version, file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(cache, file, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as err:
+        logger.warning(msg.ERR_FAIL_CANNOT_WRITE_DATA_WITH_DATA, err, data=f"build cache in {PROC}")
+        return False
+
+    return True
+
+
+# Private Functions
+def _get_cache_path() -> str:
+    return filepath_of(ElmType.BUILD, CACHE_FILENAME, CACHE_EXT)
+
+
+def _hash_of(data: str) -> str:
+    assert isinstance(data, str)
+
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+def _parse_raw_data(target: tuple) -> Any:
+    parser, raw = target
+
+    return parser(raw)
@@ -25,6 +25,7 @@ COMMAND_TABLE = {
         CmdType.REJECT: ('r', 'reject'),
         CmdType.RENAME: ('n', 'rename'),
         CmdType.SET: ('set',),
+        CmdType.WATCH: ('w', 'watch'),
         CmdType.NONE: ('none',),
         }
 
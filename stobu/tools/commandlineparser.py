@@ -28,7 +28,7 @@ DESCRIPTION = 'story building utility tool on cui.'
 
 # Main
 def get_commandline_arguments() -> Namespace:
-    logger.debug(msg.PROC_START.format(proc=PROC))
+    logger.debug(msg.PROC_START, proc=PROC)
 
     parser = assertion.is_instance(_init_commandline_parser(),
             ArgumentParser)
@@ -37,7 +37,7 @@ def get_commandline_arguments() -> Namespace:
         return None
 
     if not _set_parser_options(parser):
-        logger.warning(msg.ERR_FAIL_SET_DATA.format(data='arg parser options'))
+        logger.warning(msg.ERR_FAIL_SET_DATA, data='arg parser options')
         return None
 
     args = parser.parse_args()
@@ -45,7 +45,7 @@ def get_commandline_arguments() -> Namespace:
     if not args:
         return None
 
-    logger.debug(msg.PROC_DONE.format(proc=PROC))
+    logger.debug(msg.PROC_DONE, proc=PROC)
     return args
 
 
@@ -53,21 +53,21 @@ def get_commandline_arguments() -> Namespace:
 # Private Functions
 def _init_commandline_parser() -> ArgumentParser:
     _PROC = "init commandline parser"
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     parser = ArgumentParser(
             prog=PROGRAM_NAME,
             description=DESCRIPTION,
             )
 
-    logger.debug(msg.PROC_DONE.format(proc=_PROC))
+    logger.debug(msg.PROC_DONE, proc=_PROC)
     return parser
 
 
 def _set_parser_options(parser: ArgumentParser) -> bool:
     assert isinstance(parser, ArgumentParser)
     _PROC = 'set parser options'
-    logger.debug(msg.PROC_START.format(proc=_PROC))
+    logger.debug(msg.PROC_START, proc=_PROC)
 
     parser.add_argument('cmd', metavar='command', type=str, help='builder command')
     parser.add_argument('elm', metavar='element', type=str, nargs='?', help='sub command or any element')
@@ -82,9 +82,12 @@ def _set_parser_options(parser: ArgumentParser) -> bool:
     parser.add_argument('-r', '--rubi', help='output with rubi', action='store_true')
     parser.add_argument('-v', '--version', help='output app version', action='store_true')
     parser.add_argument('-e', '--edit', help='add and edit when new file', action='store_true')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of processes to parse and build the story (0: all cpus)')
     parser.add_argument('--part', type=str, help='select ouput part')
+    parser.add_argument('--interval', type=float, default=0.2, help='seconds between the file checks of watch')
     parser.add_argument('--comment', help='show comment', action='store_true')
+    parser.add_argument('--rebuild', help='build without the build cache', action='store_true')
     parser.add_argument('--debug', help='set debug flag', action='store_true')
 
-    logger.debug(msg.PROC_DONE.format(proc=_PROC))
+    logger.debug(msg.PROC_DONE, proc=_PROC)
     return True
@@ -1,7 +1,6 @@
 """Deta read module."""
 
 # Official Libraries
-import yaml
 from typing import Any
 
 
@@ -16,6 +15,7 @@ from stobu.syss import messages as msg
 from stobu.syss.settings import PROJECT
 from stobu.tools.filedatareader import read_markdown_data_as_yaml, read_yaml_data
 from stobu.tools.pathgetter import filepath_of
+from stobu.tools.projectdatacache import read_elm_data_with_cache
 from stobu.types.element import ElmType, BASE_FILES
 from stobu.utils.fileio import read_file
 from stobu.utils.log import logger
@@ -44,15 +44,10 @@ def get_basefile_data(elm: ElmType) -> dict:
     assert isinstance(elm, ElmType)
 
     if not elm in BASE_FILES:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"element type in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"element type in {PROC}")
         return {}
 
-    data = read_file(filepath_of(elm, ''))
-
-    if EXT_TABLE[elm] is MARKDOWN_EXT:
-        return read_markdown_data_as_yaml(data)
-    else:
-        return read_yaml_data(data)
+    return _elm_data_of(elm, '')
 
 
 def get_book_data() -> dict:
@@ -62,7 +57,7 @@ def get_book_data() -> dict:
 def get_fixture_data() -> dict:
     return get_basefile_data(ElmType.FIXTURE)
 def get_mob_data() -> dict:
-    return read_yaml_data(read_file(filepath_of(ElmType.MOB, '')))
+    return _elm_data_of(ElmType.MOB, '')
 
 
 def get_order_data() -> dict:
@@ -73,12 +68,12 @@ def get_order_data() -> dict:
 def get_person_data(fname: str) -> dict:
     assert isinstance(fname, str)
 
-    return read_markdown_data_as_yaml(read_file(filepath_of(ElmType.PERSON, fname)))
+    return _elm_data_of(ElmType.PERSON, fname)
 
 
 def get_project_data() -> dict:
     data = read_file(filepath_of(ElmType.PROJECT, ''))
-    return yaml.safe_load(data)[PROJECT]
+    return read_yaml_data(data)[PROJECT]
 
 
 def get_term_data() -> dict:
@@ -86,19 +81,18 @@ def get_term_data() -> dict:
 
 
 def get_time_data() -> dict:
-    return read_yaml_data(read_file(filepath_of(ElmType.TIME, '')))
+    return _elm_data_of(ElmType.TIME, '')
 
 
 def person_item_of(fname: str, item: PersonItem) -> Any:
     assert isinstance(fname, str)
     assert isinstance(item, PersonItem)
 
-    data = read_markdown_data_as_yaml(
-            read_file(filepath_of(ElmType.PERSON, fname)))
+    data = _elm_data_of(ElmType.PERSON, fname)
     if str(item) in data:
         return data[str(item)]
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"{item} in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"{item} in {PROC}")
         return ""
 
 
@@ -112,10 +106,19 @@ def stage_item_of(fname: str, item: StageItem) -> Any:
     assert isinstance(fname, str)
     assert isinstance(item, StageItem)
 
-    data = read_markdown_data_as_yaml(
-            read_file(filepath_of(ElmType.STAGE, fname)))
+    data = _elm_data_of(ElmType.STAGE, fname)
     if str(item) in data:
         return data[str(item)]
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"{item} in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"{item} in {PROC}")
         return ""
+
+
+# Private Functions
+def _elm_data_of(elm: ElmType, fname: str) -> Any:
+    assert isinstance(elm, ElmType)
+    assert isinstance(fname, str)
+
+    parser = read_markdown_data_as_yaml if EXT_TABLE[elm] is MARKDOWN_EXT else read_yaml_data
+
+    return read_elm_data_with_cache(filepath_of(elm, fname), parser)
@@ -1,13 +1,13 @@
 """Data write module."""
 
 # Official Libraries
-import yaml
 
 
 # My Modules
 from stobu.elms.projects import ProjectItem
 from stobu.syss import messages as msg
 from stobu.syss.settings import PROJECT
+from stobu.tools.filedatareader import dump_yaml_data, read_yaml_data
 from stobu.tools.pathgetter import filepath_of
 from stobu.types.element import ElmType
 from stobu.utils.fileio import read_file, write_file
@@ -33,8 +33,8 @@ def write_project_data(item: ProjectItem, val: str) -> bool:
     if str(item) in data[PROJECT]:
         data[PROJECT][str(item)] = val
 
-    if not write_file(filepath_of(ElmType.PROJECT, ''), yaml.safe_dump(data)):
-        logger.error(msg.ERR_FAIL_CANNOT_WRITE_DATA.format(data=f"project data in {PROC}"))
+    if not write_file(filepath_of(ElmType.PROJECT, ''), dump_yaml_data(data)):
+        logger.error(msg.ERR_FAIL_CANNOT_WRITE_DATA, data=f"project data in {PROC}")
         return False
     return True
 
@@ -42,4 +42,4 @@ def write_project_data(item: ProjectItem, val: str) -> bool:
 # Private Functions
 def _get_project_raw_data() -> dict:
     data = read_file(filepath_of(ElmType.PROJECT, ''))
-    return yaml.safe_load(data)
+    return read_yaml_data(data)
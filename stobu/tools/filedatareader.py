@@ -1,13 +1,21 @@
 """File data read module."""
 
 # Official Libraries
-import copy
 import yaml
 
 
 # My Modules
 
 
+# NOTE: libyaml が使える場合は C 実装の Loader/Dumper を使う
+try:
+    from yaml import CSafeLoader as YAML_LOADER
+    from yaml import CSafeDumper as YAML_DUMPER
+except ImportError:
+    from yaml import SafeLoader as YAML_LOADER
+    from yaml import SafeDumper as YAML_DUMPER
+
+
 __all__ = (
         'dump_yaml_data',
         'read_markdown_data_as_yaml',
@@ -16,10 +24,10 @@ __all__ = (
 
 
 # Main
-def dump_yaml_data(data: dict) -> str:
-    assert isinstance(data, dict)
+def dump_yaml_data(data: (dict, list)) -> str:
+    assert isinstance(data, (dict, list))
 
-    return yaml.safe_dump(data, default_flow_style=False)
+    return yaml.dump(data, Dumper=YAML_DUMPER, default_flow_style=False)
 
 
 def read_markdown_data_as_yaml(data: str) -> dict:
@@ -36,13 +44,13 @@ def read_markdown_data_as_yaml(data: str) -> dict:
             if is_frontmatter:
                 is_frontmatter = False
                 if yamldata:
-                    tmp.update(yaml.safe_load('\n'.join(yamldata)))
+                    tmp.update(read_yaml_data('\n'.join(yamldata)))
                     yamldata = []
                 continue
             else:
                 is_frontmatter = True
                 if mddata:
-                    tmp.update({'markdown': copy.deepcopy(mddata)})
+                    tmp.update({'markdown': mddata})
                     mddata = []
                 continue
         if is_frontmatter:
@@ -52,9 +60,9 @@ def read_markdown_data_as_yaml(data: str) -> dict:
         else:
             continue
     if yamldata:
-        tmp.update(yaml.safe_load('\n'.join(yamldata)))
+        tmp.update(read_yaml_data('\n'.join(yamldata)))
     if mddata:
-        tmp.update({'markdown': copy.deepcopy(mddata)})
+        tmp.update({'markdown': mddata})
     else:
         tmp.update({'markdown': []})
 
@@ -64,7 +72,7 @@ def read_markdown_data_as_yaml(data: str) -> dict:
 def read_yaml_data(data: str) -> dict:
     assert isinstance(data, str)
 
-    return yaml.safe_load(data)
+    return yaml.load(data, Loader=YAML_LOADER)
 
 
 # Private Functions
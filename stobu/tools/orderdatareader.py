@@ -1,14 +1,15 @@
 """Read order data module."""
 
 # Official Libraries
-import yaml
 
 
 # My Modules
 from stobu.elms.orders import OrderItem
 from stobu.syss import messages as msg
+from stobu.tools.filedatareader import read_yaml_data
 from stobu.tools.pathgetter import filepath_of
 from stobu.types.element import ElmType
+from stobu.types.order import OrderIndex
 from stobu.utils import assertion
 from stobu.utils.fileio import read_file
 from stobu.utils.filepath import basename_of
@@ -18,6 +19,7 @@ from stobu.utils.log import logger
 __all__ = (
         'elm_from_ordername',
         'get_order_data',
+        'get_order_index',
         'get_filenames_in_order_by_elm',
         'get_chapters_in_order',
         'get_episodes_in_order',
@@ -63,33 +65,25 @@ def elm_from_ordername(ordername: str) -> ElmType:
     elif str(OrderItem.SCENE) in ordername:
         return ElmType.SCENE
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"in {PROC}")
         return ElmType.NONE
 
 
-def get_filenames_in_order_by_elm(elm: ElmType) -> list:
+def get_filenames_in_order_by_elm(elm: ElmType, index: OrderIndex = None) -> list:
     assert isinstance(elm, ElmType)
 
     if ElmType.CHAPTER is elm:
-        return get_chapters_in_order()
+        return get_chapters_in_order(index)
     elif ElmType.EPISODE is elm:
-        return get_episodes_in_order()
+        return get_episodes_in_order(index)
     elif ElmType.SCENE is elm:
-        return get_scenes_in_order()
+        return get_scenes_in_order(index)
     else:
         return []
 
 
-def get_chapters_in_order() -> list:
-    data = assertion.is_list(get_order_data()[str(OrderItem.BOOK)])
-    tmp = []
-
-    for ch_record in data:
-        assert isinstance(ch_record, dict)
-        for key in ch_record.keys():
-            if str(OrderItem.CHAPTER) in key:
-                tmp.append(rid_prefix(OrderItem.CHAPTER, key))
-    return tmp
+def get_chapters_in_order(index: OrderIndex = None) -> list:
+    return _names_in_order_of(OrderItem.CHAPTER, index)
 
 
 def get_elm_from_order(item: OrderItem) -> ElmType:
@@ -98,26 +92,18 @@ def get_elm_from_order(item: OrderItem) -> ElmType:
     return ELM_ITEM_TABLE[item]
 
 
-def get_episodes_in_order() -> list:
-    data = assertion.is_list(get_order_data()[str(OrderItem.BOOK)])
-    tmp = []
-
-    for ch_record in data:
-        assert isinstance(ch_record, dict)
-        for ep_data in ch_record.values():
-            assert isinstance(ep_data, list)
-            for ep_record in ep_data:
-                assert isinstance(ep_record, dict)
-                for key in ep_record.keys():
-                    if str(OrderItem.EPISODE) in key:
-                        tmp.append(rid_prefix(OrderItem.EPISODE, key))
-    return tmp
+def get_episodes_in_order(index: OrderIndex = None) -> list:
+    return _names_in_order_of(OrderItem.EPISODE, index)
 
 
 def get_order_data() -> dict:
     data = read_file(filepath_of(ElmType.ORDER, ''))
 
-    return yaml.safe_load(data)
+    return read_yaml_data(data)
+
+
+def get_order_index() -> OrderIndex:
+    return OrderIndex(assertion.is_dict(get_order_data()))
 
 
 def get_parent_item_of(item: OrderItem) -> OrderItem:
@@ -135,23 +121,8 @@ def get_parent_item_of(item: OrderItem) -> OrderItem:
         return OrderItem.BOOK
 
 
-def get_scenes_in_order() -> list:
-    data = assertion.is_list(get_order_data()[str(OrderItem.BOOK)])
-    tmp = []
-
-    for ch_record in data:
-        assert isinstance(ch_record, dict)
-        for ep_data in ch_record.values():
-            assert isinstance(ep_data, list)
-            for ep_record in ep_data:
-                assert isinstance(ep_record, dict)
-                for sc_data in ep_record.values():
-                    assert isinstance(sc_data, list)
-                    for sc_record in sc_data:
-                        assert isinstance(sc_record, str)
-                        if str(OrderItem.SCENE) in sc_record:
-                            tmp.append(rid_prefix(OrderItem.SCENE, sc_record))
-    return tmp
+def get_scenes_in_order(index: OrderIndex = None) -> list:
+    return _names_in_order_of(OrderItem.SCENE, index)
 
 
 def ordername_of(item: OrderItem, fname: str) -> str:
@@ -178,3 +149,9 @@ def rid_prefix(item: OrderItem, title: str) -> str:
 
 
 # Private Functions
+def _names_in_order_of(item: OrderItem, index: OrderIndex = None) -> list:
+    assert isinstance(item, OrderItem)
+
+    _index = index if index else get_order_index()
+
+    return [rid_prefix(item, name) for name in _index.names_of(item)]
@@ -0,0 +1,131 @@
+"""Project data cache module."""
+
+# Official Libraries
+from typing import Any, Callable
+
+
+# My Modules
+from stobu.syss import messages as msg
+from stobu.tools.buildcache import BuildCache, read_data_with_cache
+from stobu.tools.filedatareader import read_markdown_data_as_yaml
+from stobu.tools.pathgetter import filepaths_by_elm
+from stobu.types.element import ElmType
+from stobu.utils.log import logger
+
+
+__all__ = (
+        'ProjectDataCache',
+        'end_project_data_cache',
+        'filepaths_by_elm_with_cache',
+        'read_elm_data_with_cache',
+        'start_project_data_cache',
+        'value_with_cache',
+        )
+
+
+# Define Constants
+PROC = 'TOOL PROJECT DATA CACHE'
+
+
+# Main
+class ProjectDataCache(object):
+    """Parsed project files and the values made from them, kept while building."""
+
+    def __init__(self, build_cache: BuildCache = None):
+        self.build_cache = build_cache
+        self.paths = {}
+        self.datas = {}
+        self.values = {}
+        self.hits = 0
+        self.misses = 0
+
+    def data_of(self, path: str, parser: Callable) -> Any:
+        assert isinstance(path, str)
+        assert callable(parser)
+
+        if path in self.datas:
+            self.hits += 1
+            return self.datas[path]
+
+        self.misses += 1
+        data = read_data_with_cache(path, parser, self.build_cache)
+        self.datas[path] = data
+        return data
+
+    def filepaths_of(self, elm: ElmType) -> list:
+        assert isinstance(elm, ElmType)
+
+        if elm in self.paths:
+            self.hits += 1
+        else:
+            self.misses += 1
+            self.paths[elm] = filepaths_by_elm(elm)
+        return list(self.paths[elm])
+
+    def value_of(self, name: str, func: Callable) -> Any:
+        assert isinstance(name, str)
+        assert callable(func)
+
+        if name in self.values:
+            self.hits += 1
+            return self.values[name]
+
+        self.misses += 1
+        value = func()
+        self.values[name] = value
+        return value
+
+
+def end_project_data_cache() -> None:
+    global _CURRENT
+
+    if _CURRENT:
+        logger.debug(msg.PROC_MESSAGE,
+            proc=f"project data cache hits: {_CURRENT.hits}, misses: {_CURRENT.misses} in {PROC}")
+    _CURRENT = None
+
+
+def filepaths_by_elm_with_cache(elm: ElmType) -> list:
+    assert isinstance(elm, ElmType)
+
+    if _CURRENT:
+        return _CURRENT.filepaths_of(elm)
+    else:
+        return filepaths_by_elm(elm)
+
+
+def read_elm_data_with_cache(path: str, parser: Callable = read_markdown_data_as_yaml) -> Any:
+    assert isinstance(path, str)
+    assert callable(parser)
+
+    if _CURRENT:
+        return _CURRENT.data_of(path, parser)
+    else:
+        return read_data_with_cache(path, parser)
+
+
+def start_project_data_cache(build_cache: BuildCache = None,
+        data: ProjectDataCache = None) -> ProjectDataCache:
+    global _CURRENT
+
+    if data:
+        assert isinstance(data, ProjectDataCache)
+        data.hits = data.misses = 0
+        _CURRENT = data
+    else:
+        _CURRENT = ProjectDataCache(build_cache)
+    return _CURRENT
+
+
+def value_with_cache(name: str, func: Callable) -> Any:
+    assert isinstance(name, str)
+    assert callable(func)
+
+    if _CURRENT:
+        return _CURRENT.value_of(name, func)
+    else:
+        return func()
+
+
+# Private Functions
+_CURRENT = None
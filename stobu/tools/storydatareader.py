@@ -2,7 +2,6 @@
 
 # Official Libraries
 from typing import Any
-import copy
 
 
 # My Modules
@@ -95,7 +94,8 @@ def copy_scene_data_of_story_record(record: StoryRecord,
         time: str = None) -> StoryRecord:
     assert isinstance(record, StoryRecord)
 
-    tmp = copy.deepcopy(record.data)
+    # NOTE: 変えるのは見出しの項目だけなので、本文のリスト等は元のデータと共有する
+    tmp = dict(record.data)
 
     if camera:
         tmp[str(SceneItem.CAMERA)] = camera
@@ -134,7 +134,7 @@ def scene_item_of(record: StoryRecord, item: SceneItem) -> str:
     if str(item) in record.data:
         return record.data[str(item)]
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"scene item in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"scene item in {PROC}")
         return ""
 
 
@@ -147,5 +147,5 @@ def _safe_get_elm_item_of(record: StoryRecord, item_table: dict) -> Any:
     if key in record.data:
         return record.data[key]
     else:
-        logger.warning(msg.ERR_FAIL_INVALID_DATA.format(data=f"{key} data in {PROC}"))
+        logger.warning(msg.ERR_FAIL_INVALID_DATA, data=f"{key} data in {PROC}")
         return ""
@@ -10,6 +10,7 @@ from stobu.utils.log import logger
 
 
 __all__ = (
+        'TagTranslator',
         'translate_tags_str',
         'translate_tags_text_list',
         )
@@ -20,56 +21,82 @@ PROC = 'TRANSLATE TAG'
 
 
 # Main
+class TagTranslator(object):
+    """Translate all tags in a text by one scan of a compiled pattern.
+
+    The tag keys are tried longest first, so `$taro1` wins over `$taro`
+    the same as the reverse sorted tag dict did. The tags are copied when it
+    is made, so build it once before a loop and pass it instead of the dict.
+    """
+
+    def __init__(self, tags: dict):
+        assert isinstance(tags, dict)
+
+        self.tags = dict(tags)
+        self.table = {str(key): val for key, val in tags.items()}
+        self.patterns = {}
+
+    def translated(self, text: str, is_fullmatch: bool = False, prefix: str = '$') -> str:
+        assert isinstance(text, str)
+        assert isinstance(is_fullmatch, bool)
+
+        if not self.table:
+            return text
+
+        if prefix:
+            assert isinstance(prefix, str)
+            if prefix not in text:
+                return text
+            if is_fullmatch:
+                return self.table.get(text[len(prefix):], text) if text.startswith(prefix) else text
+        elif is_fullmatch:
+            return self.table.get(text, text)
+
+        return self._pattern_of(prefix).sub(self._replaced, text)
+
+    def translated_list(self, textlist: list, prefix: str = '$') -> list:
+        assert isinstance(textlist, list)
+
+        return [self.translated(text, False, prefix) for text in textlist]
+
+    def _pattern_of(self, prefix: str) -> re.Pattern:
+        if prefix not in self.patterns:
+            keys = sorted(self.table.keys(), key=lambda k: (-len(k), k))
+            self.patterns[prefix] = re.compile(
+                    "{}({})".format(re.escape(prefix) if prefix else '',
+                        '|'.join(re.escape(k) for k in keys)))
+        return self.patterns[prefix]
+
+    def _replaced(self, match: re.Match) -> str:
+        return self.table[match.group(1)]
+
+
 def translate_tags_str(text: str, tags: dict, is_fullmatch: bool = False, prefix: str = '$') -> str:
     assert isinstance(text, str)
-    assert isinstance(tags, dict)
+    assert isinstance(tags, (dict, TagTranslator))
     assert isinstance(is_fullmatch, bool)
 
-    if prefix:
-        assert isinstance(prefix, str)
-        return _conv_text_by_tag_with_prefix(text, tags, is_fullmatch, prefix)
-    else:
-        return _conv_text_by_tag(text, tags, is_fullmatch)
+    return _translator_of(tags).translated(text, is_fullmatch, prefix)
 
 
 def translate_tags_text_list(textlist: list, tags: dict) -> list:
     assert isinstance(textlist, list)
-    assert isinstance(tags, dict)
+    assert isinstance(tags, (dict, TagTranslator))
 
+    translator = _translator_of(tags)
     tmp = []
 
     for text in textlist:
         assert isinstance(text, str)
-        tmp.append(_conv_text_by_tag_with_prefix(text, tags))
+        tmp.append(translator.translated(text))
 
     return tmp
 
 
 # Private Functions
-def _conv_text_by_tag(text: str, tags: dict, is_fullmatch: bool = False) -> str:
-    assert isinstance(text, str)
-    assert isinstance(tags, dict)
-    assert isinstance(is_fullmatch, bool)
-
-    tmp = text
-
-    for key, val in tags.items():
-        if is_fullmatch and key == tmp or not is_fullmatch and key in tmp:
-            tmp = re.sub(r'{}'.format(key), val, tmp)
-    return tmp
+def _translator_of(tags: (dict, TagTranslator)) -> TagTranslator:
+    if isinstance(tags, TagTranslator):
+        return tags
 
-
-def _conv_text_by_tag_with_prefix(text: str, tags: dict, is_fullmatch: bool = False, prefix: str = '$') -> str:
-    assert isinstance(text, str)
-    assert isinstance(tags, dict)
-    assert isinstance(is_fullmatch, bool)
-    assert isinstance(prefix, str)
-
-    tmp = text
-
-    for key, val in tags.items():
-        if prefix in tmp:
-            tag_key = f"{prefix}{key}"
-            if is_fullmatch and tag_key == tmp or not is_fullmatch and tag_key in tmp:
-                tmp = re.sub(r'\{}'.format(tag_key), val, tmp)
-    return tmp
+    # NOTE: 辞書はその場で変わることがあるので使い回さない。繰り返す時は変換器を渡す
+    return TagTranslator(tags)
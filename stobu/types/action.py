@@ -1,12 +1,11 @@
 """Define action data and record."""
 
 # Official Libraries
-from dataclasses import dataclass, field
 from enum import auto, Enum
 
 
 # My Modules
-from stobu.types.basedata import _BaseData
+from stobu.types.basedata import _BaseData, record_class
 
 
 __all__ = (
@@ -102,6 +101,10 @@ class ActDataType(Enum):
     PAYOFF = auto()
 
 
+EMPTY_FLAGS = ()
+"""tuple: flags shared by all the action records without flags."""
+
+
 TITLE_ACTIONS = [
         ActDataType.BOOK_TITLE,
         ActDataType.CHAPTER_TITLE,
@@ -111,14 +114,14 @@ TITLE_ACTIONS = [
         ]
 
 
-@dataclass
+@record_class
 class ActionRecord(object):
     type: ActType
     subtype: ActDataType
     subject: str = ""
     outline: str = ""
     desc: str = ""
-    flags: list = field(default_factory=list)
+    flags: tuple = EMPTY_FLAGS
     note: str = ""
 
 
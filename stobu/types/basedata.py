@@ -5,6 +5,7 @@ from __future__ import annotations
 
 
 # Official Libraries
+from dataclasses import dataclass, fields
 from typing import Any
 
 
@@ -14,6 +15,9 @@ from stobu.utils import assertion
 
 __all__ = (
         '_BaseData',
+        'is_data_validation',
+        'record_class',
+        'set_data_validation',
         )
 
 
@@ -22,7 +26,20 @@ class _BaseData(object):
 
     def __init__(self, data: list, record_cls: Any):
         assert isinstance(data, list)
-        self.data = [assertion.is_instance(r, record_cls) for r in data]
+        if _VALIDATION[0]:
+            self.data = [assertion.is_instance(r, record_cls) for r in data]
+        else:
+            self.data = list(data)
+
+    @classmethod
+    def trusted(cls, data: list) -> _BaseData:
+        """Wrap the new list made in the pipeline, without any check or copy."""
+        if _VALIDATION[0]:
+            return cls(data)
+
+        obj = cls.__new__(cls)
+        obj.data = data
+        return obj
 
     def get_data(self) -> list:
         return self.data
@@ -37,3 +54,34 @@ class _BaseData(object):
         else:
             TypeError("Invalid type!")
             return self
+
+
+def is_data_validation() -> bool:
+    return _VALIDATION[0]
+
+
+def record_class(cls: type) -> type:
+    """Make the dataclass of a record with __slots__, without the __dict__ of each instance.
+
+    It is the slots option of the dataclass in python 3.10, made here for 3.7 and 3.8.
+    """
+    cls = dataclass(cls)
+    names = tuple(field.name for field in fields(cls))
+
+    # NOTE: 既定値は __init__ が持っているので、クラス属性からは外してスロットにする
+    cls_dict = {key: val for key, val in cls.__dict__.items()
+            if key not in names + ('__dict__', '__weakref__')}
+    cls_dict['__slots__'] = names
+
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+def set_data_validation(is_enabled: bool) -> None:
+    """Check the type of every record when a data is made (set by --debug)."""
+    assert isinstance(is_enabled, bool)
+
+    _VALIDATION[0] = is_enabled
+
+
+# Private Functions
+_VALIDATION = [False]
@@ -4,7 +4,14 @@
 from enum import Enum
 
 
+# My Modules
+from stobu.types.count import CountsData
+from stobu.types.info import InfosData
+from stobu.types.output import OutputsData
+
+
 __all__ = (
+        'BuildContext',
         'BuildType',
         )
 
@@ -22,3 +29,56 @@ class BuildType(Enum):
 
     def __str__(self):
         return self.value
+
+
+class BuildContext(object):
+    """Formatted outputs of each build type and the tagged base infos, kept to reuse
+    them in the same build.
+
+    The streamed build types keep only their char counts, taken while writing them.
+    """
+
+    def __init__(self):
+        self.outputs = {}
+        self.counts = {}
+        self.infos = None
+
+    def get_counts(self, build_type: BuildType) -> CountsData:
+        assert isinstance(build_type, BuildType)
+
+        return self.counts.get(build_type, None)
+
+    def get_infos(self) -> InfosData:
+        return self.infos
+
+    def get_outputs(self, build_type: BuildType) -> OutputsData:
+        assert isinstance(build_type, BuildType)
+
+        return self.outputs.get(build_type, None)
+
+    def set_outputs(self, build_type: BuildType, outputs: OutputsData,
+            is_comment: bool = False) -> None:
+        assert isinstance(build_type, BuildType)
+        assert isinstance(outputs, OutputsData)
+        assert isinstance(is_comment, bool)
+
+        # NOTE: コメント付きの出力は文字数が変わるので文字数計算用には残さない
+        if is_comment:
+            return
+        self.outputs[build_type] = outputs
+
+    def set_counts(self, build_type: BuildType, counts: CountsData,
+            is_comment: bool = False) -> None:
+        assert isinstance(build_type, BuildType)
+        assert isinstance(counts, CountsData)
+        assert isinstance(is_comment, bool)
+
+        # NOTE: コメント付きの出力から数えたものは使わない
+        if is_comment:
+            return
+        self.counts[build_type] = counts
+
+    def set_infos(self, infos: InfosData) -> None:
+        assert isinstance(infos, InfosData)
+
+        self.infos = infos
@@ -22,3 +22,4 @@ class CmdType(Enum):
     REJECT = auto()
     RENAME = auto()
     SET = auto()
+    WATCH = auto()
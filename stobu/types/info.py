@@ -7,7 +7,7 @@ from typing import Any
 
 
 # My Modules
-from stobu.types.basedata import _BaseData
+from stobu.types.basedata import _BaseData, record_class
 from stobu.types.action import ActType
 
 
@@ -176,7 +176,7 @@ class ItemInfo(object):
     note: str = None
 
 
-@dataclass
+@record_class
 class InfoRecord(object):
     type: InfoType
     act: ActType
@@ -1,13 +1,12 @@
 """Define novel data and record."""
 
 # Official Libraries
-from dataclasses import dataclass
 from enum import auto, Enum
 from typing import Any
 
 
 # My Modules
-from stobu.types.basedata import _BaseData
+from stobu.types.basedata import _BaseData, record_class
 
 
 __all__ = (
@@ -34,7 +33,7 @@ class NovelType(Enum):
     PARAGRAPH_END = auto()
 
 
-@dataclass
+@record_class
 class NovelRecord(object):
     type: NovelType
     subject: str
@@ -0,0 +1,140 @@
+"""Define data type for order index."""
+
+# Official Libraries
+
+
+# My Modules
+from stobu.elms.orders import OrderItem
+from stobu.utils import assertion
+
+
+__all__ = (
+        'OrderIndex',
+        )
+
+
+# Define Constants
+ITEM_DEPTH_TABLE = {
+        OrderItem.BOOK: 0,
+        OrderItem.CHAPTER: 1,
+        OrderItem.EPISODE: 2,
+        OrderItem.SCENE: 3,
+        }
+"""dict: depth of each order item in the order tree."""
+
+
+class OrderIndex(object):
+    """Order tree of the book, indexed by the order names (e.g. 'chapter/main').
+
+    Each order name maps to its children, its parents and its position in the parent,
+    so that the membership, the parent and the insertion point are found without
+    walking the order data.
+    """
+
+    def __init__(self, data: dict):
+        assert isinstance(data, dict)
+
+        book = str(OrderItem.BOOK)
+        self.children = {book: []}
+        self.parents = {}
+        self.positions = {}
+
+        for ch_record in assertion.is_list(data.get(book) or []):
+            assert isinstance(ch_record, dict)
+            for ch_key, ch_data in ch_record.items():
+                self._append(book, ch_key)
+                for ep_record in ch_data or []:
+                    assert isinstance(ep_record, dict)
+                    for ep_key, ep_data in ep_record.items():
+                        self._append(ch_key, ep_key)
+                        for sc_record in ep_data or []:
+                            assert isinstance(sc_record, str)
+                            self._append(ep_key, sc_record)
+
+    def add(self, parent: str, name: str) -> bool:
+        assert isinstance(parent, str)
+        assert isinstance(name, str)
+
+        if parent not in self.children:
+            return False
+        self._append(parent, name)
+        return True
+
+    def has(self, name: str) -> bool:
+        assert isinstance(name, str)
+
+        return name in self.parents
+
+    def insertion_point_of(self, parent: str) -> int:
+        assert isinstance(parent, str)
+
+        return len(self.children[parent]) if parent in self.children else -1
+
+    def names_of(self, item: OrderItem) -> list:
+        assert isinstance(item, OrderItem)
+
+        depth = ITEM_DEPTH_TABLE[item]
+        tmp = []
+        stack = [(str(OrderItem.BOOK), 0)]
+
+        while stack:
+            name, level = stack.pop()
+            if level == depth:
+                tmp.append(name)
+                continue
+            stack.extend((child, level + 1) for child in reversed(self.children.get(name, [])))
+        return tmp
+
+    def parent_of(self, name: str) -> str:
+        assert isinstance(name, str)
+
+        parents = self.parents.get(name)
+        return parents[0] if parents else ""
+
+    def position_of(self, name: str) -> int:
+        assert isinstance(name, str)
+
+        return self.positions.get(name, -1)
+
+    def remove(self, name: str) -> bool:
+        assert isinstance(name, str)
+
+        if name not in self.parents:
+            return False
+
+        for parent in set(self.parents[name]):
+            self.children[parent] = [child for child in self.children[parent] if child != name]
+            self._reindex(parent)
+        self._drop(name)
+        return True
+
+    def to_data(self) -> dict:
+        book = str(OrderItem.BOOK)
+
+        return {book: [
+            {ch: [{ep: list(self.children[ep])} for ep in self.children[ch]]}
+            for ch in self.children[book]]}
+
+    def _append(self, parent: str, name: str) -> None:
+        siblings = self.children.setdefault(parent, [])
+        siblings.append(name)
+        self.children.setdefault(name, [])
+        self.parents.setdefault(name, []).append(parent)
+        self.positions.setdefault(name, len(siblings) - 1)
+
+    def _drop(self, name: str) -> None:
+        self.parents.pop(name, None)
+        self.positions.pop(name, None)
+
+        for child in self.children.pop(name, []):
+            parents = [p for p in self.parents.get(child, []) if p != name]
+            if parents:
+                self.parents[child] = parents
+            else:
+                self._drop(child)
+
+    def _reindex(self, parent: str) -> None:
+        siblings = self.children[parent]
+        for idx in reversed(range(len(siblings))):
+            if self.parents[siblings[idx]][0] == parent:
+                self.positions[siblings[idx]] = idx
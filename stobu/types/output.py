@@ -2,25 +2,92 @@
 
 # Official Libraries
 from __future__ import annotations
+from dataclasses import dataclass, replace
+from itertools import chain
+from typing import Any, Iterator
 
 
 # My Modules
 from stobu.types.basedata import _BaseData
+from stobu.types.element import ElmType
 
 
 __all__ = (
+        'OutputMark',
         'OutputsData',
         )
 
 
 # Main
+@dataclass
+class OutputMark(object):
+    """Head of an element, put by the formatters before its head line."""
+    type: ElmType
+    title: str
+    index: int = -1
+
+
 class OutputsData(_BaseData):
+    """Output lines kept as the segments of the joined data.
+
+    A data is never changed after it is made: joining two data links their segments
+    into a new data without copying any line, so the contents of each build target
+    share the same list. The marks are the heads of the elements in the lines.
+    """
+
+    marks = ()
 
     def __init__(self, data: list):
         super().__init__(data, str)
 
-    def get_serialized_data(self) -> str:
-        return "".join(self.data)
+    @property
+    def data(self) -> list:
+        if len(self.segments) == 1:
+            return self.segments[0]
+        return list(chain.from_iterable(self.segments))
+
+    @data.setter
+    def data(self, data: list) -> None:
+        self.segments = (data,)
+
+    @classmethod
+    def marked(cls, data: list, marks: list) -> OutputsData:
+        """Wrap the formatted lines with the marks of the element heads in them."""
+        assert isinstance(marks, list)
+
+        obj = cls.trusted(data)
+        obj.marks = tuple(marks)
+        return obj
 
     def cloned(self) -> OutputsData:
-        return OutputsData(self.data)
+        return OutputsData._joined(self.segments, self.marks)
+
+    def get_marks(self) -> tuple:
+        return self.marks
+
+    def get_serialized_data(self) -> str:
+        return "".join(self.iter_data())
+
+    def has_data(self) -> bool:
+        return any(self.segments)
+
+    def iter_data(self) -> Iterator:
+        """Walk the lines of all the segments once, without joining them."""
+        return chain.from_iterable(self.segments)
+
+    def __add__(self, another: Any) -> OutputsData:
+        # NOTE: 自分のリストは変えずに、両方のセグメントをつないだ新しいデータを返す
+        if isinstance(another, OutputsData):
+            offset = sum(len(seg) for seg in self.segments)
+            marks = self.marks + tuple(
+                    replace(mark, index=mark.index + offset) for mark in another.marks)
+            return OutputsData._joined(self.segments + another.segments, marks)
+        return self
+
+    @classmethod
+    def _joined(cls, segments: tuple, marks: tuple) -> OutputsData:
+        obj = cls.__new__(cls)
+        obj.segments = tuple(seg for seg in segments if seg) or ([],)
+        if marks:
+            obj.marks = marks
+        return obj
@@ -1,13 +1,12 @@
 """Define script data and record."""
 
 # Official Libraries
-from dataclasses import dataclass
 from enum import auto, Enum
 from typing import Any
 
 
 # My Modules
-from stobu.types.basedata import _BaseData
+from stobu.types.basedata import _BaseData, record_class
 
 
 __all__ = (
@@ -36,7 +35,7 @@ class ScriptType(Enum):
     PARAGRAPH_END = auto()
 
 
-@dataclass
+@record_class
 class ScriptRecord(object):
     type: ScriptType
     subject: str
@@ -7,7 +7,7 @@ from typing import Any
 
 
 # My Modules
-from stobu.types.basedata import _BaseData
+from stobu.types.basedata import _BaseData, record_class
 from stobu.types.action import ActType
 
 
@@ -70,7 +70,7 @@ class SceneDataInfo(object):
         self.data = []
 
 
-@dataclass
+@record_class
 class StructRecord(object):
     type: StructType
     act: ActType
@@ -2,10 +2,9 @@
 
 
 # Official Libraries
+import calendar
 import datetime
-
-# Thirdparty Libraries
-from dateutil.relativedelta import relativedelta
+from functools import lru_cache
 
 
 # My Modules
@@ -13,11 +12,17 @@ from dateutil.relativedelta import relativedelta
 
 __all__ = (
         'after_day_str_from',
+        'date_after',
         'next_day_str_from',
         'next_month_str_from',
         )
 
 
+# Define Constants
+MAX_DATES = 1024
+"""int: number of the parsed and the formatted dates kept."""
+
+
 # Main Functions
 def after_day_str_from(year: str, mon: str, day: str,
         aftermon: int, afterday: int) -> str:
@@ -27,10 +32,26 @@ def after_day_str_from(year: str, mon: str, day: str,
     assert isinstance(aftermon, int)
     assert isinstance(afterday, int)
 
-    basedate = datetime.date(int(year), int(mon), int(day))
-    elapsed = basedate + relativedelta(months=aftermon, days=afterday)
+    return _date_str_of(date_after(_date_of(year, mon, day), aftermon, afterday))
+
+
+def date_after(basedate: datetime.date, aftermon: int, afterday: int) -> datetime.date:
+    """Add the months, then the days, clamping the day to the end of the month."""
+    assert isinstance(basedate, datetime.date)
+    assert isinstance(aftermon, int)
+    assert isinstance(afterday, int)
+
+    elapsed = basedate
 
-    return str(elapsed.month) + '/' + str(elapsed.day)
+    if aftermon:
+        months = basedate.month - 1 + aftermon
+        year, month = basedate.year + months // 12, months % 12 + 1
+        elapsed = datetime.date(year, month, min(basedate.day, _days_of_month(year, month)))
+
+    if afterday:
+        elapsed += datetime.timedelta(days=afterday)
+
+    return elapsed
 
 
 def next_day_str_from(year: str, mon: str, day: str) -> str:
@@ -39,3 +60,18 @@ def next_day_str_from(year: str, mon: str, day: str) -> str:
 
 def next_month_str_from(year: str, mon: str, day: str) -> str:
     return after_day_str_from(year, mon, day, 1, 0)
+
+
+# Private Functions
+@lru_cache(maxsize=MAX_DATES)
+def _date_of(year: str, mon: str, day: str) -> datetime.date:
+    return datetime.date(int(year), int(mon), int(day))
+
+
+@lru_cache(maxsize=MAX_DATES)
+def _date_str_of(date: datetime.date) -> str:
+    return f"{date.month}/{date.day}"
+
+
+def _days_of_month(year: int, month: int) -> int:
+    return calendar.monthrange(year, month)[1]
@@ -1,6 +1,9 @@
 """Utility module for file IO."""
 
 # Official Libraries
+import os
+import tempfile
+from typing import Iterable
 
 
 # My Modules
@@ -8,12 +11,55 @@ from stobu.syss.settings import BASE_ENCODING
 
 
 __all__ = (
+        'OutputSink',
         'read_file',
         'write_file',
+        'write_lines_to_file',
         )
 
 
 # Main
+class OutputSink(object):
+    """Write the streamed texts to a temporary file, then rename it to the target.
+
+    Use it with the `with` statement. The target file is replaced only when the
+    block ends without an error, so a failed build never leaves a half file.
+    """
+
+    def __init__(self, fname: str, encoding: str=BASE_ENCODING):
+        assert isinstance(fname, str)
+        assert isinstance(encoding, str)
+
+        self.fname = fname
+        self.encoding = encoding
+        self.file = None
+        self.tmpname = ""
+
+    def __enter__(self):
+        fd, self.tmpname = tempfile.mkstemp(
+                prefix=f".{os.path.basename(self.fname)}.",
+                dir=os.path.dirname(self.fname) or None)
+        self.file = os.fdopen(fd, 'w', encoding=self.encoding)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.file.close()
+        if exc_type is None:
+            os.chmod(self.tmpname, _file_mode_of(self.fname))
+            os.replace(self.tmpname, self.fname)
+        else:
+            os.remove(self.tmpname)
+        return False
+
+    def write(self, text: str) -> None:
+        assert isinstance(text, str)
+
+        self.file.write(text)
+
+    def write_lines(self, lines: Iterable) -> None:
+        self.file.writelines(lines)
+
+
 def read_file(fname: str, encoding: str=BASE_ENCODING) -> str:
     assert isinstance(fname, str)
     assert isinstance(encoding, str)
@@ -35,3 +81,26 @@ def write_file(fname: str, contents: str, encoding: str=BASE_ENCODING) -> bool:
         file.write(contents)
 
     return True
+
+
+def write_lines_to_file(fname: str, lines: Iterable, encoding: str=BASE_ENCODING) -> bool:
+    assert isinstance(fname, str)
+    assert isinstance(encoding, str)
+
+    with OutputSink(fname, encoding) as sink:
+        sink.write_lines(lines)
+
+    return True
+
+
+# Private Functions
+def _file_mode_of(fname: str) -> int:
+    assert isinstance(fname, str)
+
+    # NOTE: 一時ファイルは 0600 で作られるので、通常の書き込みと同じ権限に戻す
+    if os.path.exists(fname):
+        return os.stat(fname).st_mode & 0o777
+
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
@@ -2,7 +2,6 @@
 
 # Official Libraries
 import logging
-import logging.handlers
 import os
 import sys
 
@@ -29,30 +28,86 @@ DEBUG_FORMATTER = logging.Formatter("%(levelname)-8s %(asctime)s [%(module)s.%(f
 APP_CACHE_DIR = os.path.join(USER_CACHE_DIR, 'storybuilder')
 """str: path of this application cache directory."""
 
-if not os.path.exists(USER_CACHE_DIR):
-    os.makedirs(USER_CACHE_DIR)
-
-if not os.path.exists(APP_CACHE_DIR):
-    os.makedirs(APP_CACHE_DIR)
-
 
 # Setup Log file
 LOG_FILENAME = os.path.join(APP_CACHE_DIR, "storybuilder.log")
-loghandler = logging.handlers.RotatingFileHandler(LOG_FILENAME, maxBytes=20971520, backupCount=5)
+
+LOG_KEYWORDS = ('exc_info', 'extra', 'stack_info', 'stacklevel')
+"""tuple: keywords which the logging methods take themselves."""
+
+
+# Define Classes
+class LazyMessage(object):
+    """Log message formatted with the keywords only when it is emitted."""
+
+    __slots__ = ('fmt', 'kwargs')
+
+    def __init__(self, fmt: str, kwargs: dict):
+        self.fmt = fmt
+        self.kwargs = kwargs
+
+    def __str__(self) -> str:
+        return self.fmt.format(**self.kwargs)
+
+
+class LazyLogger(logging.LoggerAdapter):
+    """Logger which takes the message keywords, as `logger.debug(msg.PROC_START, proc=PROC)`.
+
+    All the levels are called in this form, and the positional args for `%s` in
+    the message go before the keywords, as `logger.warning(msg.X, arg, data=...)`.
+    The message is not formatted unless the level is enabled.
+    """
+
+    def process(self, msg, kwargs):
+        fmt_kwargs = {key: kwargs.pop(key) for key in list(kwargs.keys()) if key not in LOG_KEYWORDS}
+        if fmt_kwargs:
+            msg = LazyMessage(msg, fmt_kwargs)
+        return msg, kwargs
+
+
+class RotatingFileHandlerOnDemand(logging.Handler):
+    """Rotating file handler which creates the cache directory and the file at the first emit."""
+
+    def __init__(self, filename: str, maxBytes: int, backupCount: int):
+        super().__init__()
+        self.filename = filename
+        self.maxBytes = maxBytes
+        self.backupCount = backupCount
+        self.handler = None
+
+    def emit(self, record):
+        if not self.handler:
+            # NOTE: ログを書く時まで RotatingFileHandler もキャッシュディレクトリも作らない
+            import logging.handlers
+            os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+            self.handler = logging.handlers.RotatingFileHandler(
+                    self.filename, maxBytes=self.maxBytes, backupCount=self.backupCount)
+            self.handler.setFormatter(self.formatter)
+        self.handler.emit(record)
+
+    def close(self):
+        if self.handler:
+            self.handler.close()
+        super().close()
+
+
+loghandler = RotatingFileHandlerOnDemand(LOG_FILENAME, maxBytes=20971520, backupCount=5)
 loghandler.setFormatter(FILE_FORMATTER)
 
 
 # Logger setup
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
-logger.addHandler(loghandler)
+_logger = logging.getLogger(__name__)
+_logger.setLevel(logging.DEBUG)
+_logger.addHandler(loghandler)
 
 
 # Set the logging level to show debug messages.
 console_handler = logging.StreamHandler(stream=sys.stderr)
 console_handler.setFormatter(CONSOLE_FORMATTER)
-logger.addHandler(console_handler)
+_logger.addHandler(console_handler)
 
 
 # Set the debug level for this application.
-logger.setLevel(logging.INFO)
+_logger.setLevel(logging.INFO)
+
+logger = LazyLogger(_logger, {})
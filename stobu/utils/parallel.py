@@ -0,0 +1,70 @@
+"""Utility module for parallel processing."""
+
+# Official Libraries
+import os
+from typing import Callable, Iterator
+
+
+# My Modules
+
+
+__all__ = (
+        'imap_unordered_in_parallel',
+        'map_in_parallel',
+        'workers_of',
+        )
+
+
+# Main
+def imap_unordered_in_parallel(func: Callable, items: list, jobs: int = 1) -> Iterator:
+    """Apply the function to each item on a process pool, yielding each result as it completes."""
+    assert callable(func)
+    assert isinstance(items, list)
+    assert isinstance(jobs, int)
+
+    workers = min(workers_of(jobs), len(items))
+
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    # NOTE: concurrent.futures は重いので、並列で処理する時だけ読み込む
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    futures = []
+    try:
+        futures.extend(executor.submit(func, item) for item in items)
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # NOTE: 途中で止めた場合はまだ始まっていない処理を取り消す
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def map_in_parallel(func: Callable, items: list, jobs: int = 1) -> list:
+    """Apply the function to each item on a process pool, keeping the order."""
+    assert callable(func)
+    assert isinstance(items, list)
+    assert isinstance(jobs, int)
+
+    workers = min(workers_of(jobs), len(items))
+
+    if workers <= 1:
+        return [func(item) for item in items]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(items) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items, chunksize=chunksize))
+
+
+def workers_of(jobs: int) -> int:
+    assert isinstance(jobs, int)
+
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
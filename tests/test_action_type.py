@@ -4,7 +4,7 @@
 import pytest
 
 # My Modules
-from stobu.core.actiondatacreator import ACT_TYPE_TABLE
+from stobu.core.scenetokenizer import ACT_TYPE_TABLE
 from stobu.types.action import ActType, NORMAL_ACTIONS
 
 
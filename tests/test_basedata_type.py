@@ -0,0 +1,49 @@
+"""Test for base data type."""
+
+# Official Libraries
+import pickle
+import pytest
+
+# My Modules
+from stobu.types.action import ActDataType, ActionRecord, ActionsData, ActType
+from stobu.types.basedata import is_data_validation, set_data_validation
+
+
+@pytest.fixture
+def validation():
+    is_enabled = is_data_validation()
+    yield set_data_validation
+    set_data_validation(is_enabled)
+
+
+# Test: trusted without validation
+def test_trusted_without_validation(validation):
+
+    validation(False)
+    data = [ActionRecord(ActType.DO, ActDataType.NONE), 'not a record']
+
+    assert ActionsData.trusted(data).get_data() is data
+
+
+# Test: trusted with validation
+def test_trusted_with_validation(validation):
+
+    validation(True)
+    data = [ActionRecord(ActType.DO, ActDataType.NONE)]
+
+    assert ActionsData.trusted(data).get_data() == data
+    assert ActionsData.trusted(data).get_data() is not data
+    with pytest.raises(AssertionError):
+        ActionsData.trusted([ActionRecord(ActType.DO, ActDataType.NONE), 'not a record'])
+
+
+# Test: slotted record
+def test_record_class():
+
+    record = ActionRecord(ActType.DO, ActDataType.NONE, 'taro')
+
+    assert not hasattr(record, '__dict__')
+    assert record.outline == ""
+    assert pickle.loads(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)) == record
+    with pytest.raises(AttributeError):
+        record.unknown = 1
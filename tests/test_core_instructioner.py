@@ -0,0 +1,34 @@
+"""Test for instruction module."""
+
+# Official Libraries
+
+
+# My Modules
+from stobu.core.instructioner import iter_records_applied_instructions
+from stobu.types.action import ActionRecord, ActDataType, ActType
+
+
+def _alias_of(text: str) -> ActionRecord:
+    return ActionRecord(ActType.DATA, ActDataType.INSTRUCTION, 'A', text)
+
+
+def _talk_of(subject: str, desc: str) -> ActionRecord:
+    return ActionRecord(ActType.TALK, ActDataType.NONE, subject, '', desc)
+
+
+# Test: aliases in each scene
+def test_apply_aliases():
+
+    start = ActionRecord(ActType.DATA, ActDataType.SCENE_START, '')
+    plain = _talk_of('X', "$Xが来た")
+    records = list(iter_records_applied_instructions([
+        start, plain,
+        _alias_of('X=taro'), _talk_of('X', "$Xが来た"),
+        _alias_of('Y=hana'), _talk_of('Y', "$Xと$Y"),
+        start, _talk_of('X', "$Xが来た"),
+        ], {}))
+
+    assert records[1] is plain
+    assert (records[2].subject, records[2].desc) == ('taro', "taroが来た")
+    assert (records[3].subject, records[3].desc) == ('hana', "taroとhana")
+    assert (records[5].subject, records[5].desc) == ('X', "$Xが来た")
@@ -0,0 +1,65 @@
+"""Test for scene tokenizer module."""
+
+# Official Libraries
+import pytest
+
+# My Modules
+from stobu.core.scenetokenizer import act_type_of, tokenize_scene_lines
+from stobu.types.action import ActDataType, ActType
+
+
+# Test: act type
+@pytest.mark.parametrize("alias, expect", [
+    ('t', ActType.TALK),
+    ('remember', ActType.REMEMBER),
+    ('-', ActType.SAME),
+    ('unknown', ActType.NONE),
+    ])
+def test_act_type_of(alias, expect):
+
+    assert act_type_of(alias) is expect
+
+
+# Test: tokenize lines
+def test_tokenize_scene_lines():
+
+    records, errors = tokenize_scene_lines([
+        "## head",
+        "# comment",
+        "#! A X=taro",
+        "[taro:t:greet] Hello, world.# note",
+        "",
+        "  some text",
+        ])
+
+    assert not errors
+    assert [(r.type, r.subtype) for r in records] == [
+            (ActType.DATA, ActDataType.SCENE_HEAD),
+            (ActType.DATA, ActDataType.COMMENT),
+            (ActType.DATA, ActDataType.INSTRUCTION),
+            (ActType.TALK, ActDataType.NONE),
+            (ActType.DO, ActDataType.TEXT),
+            ]
+    assert (records[2].subject, records[2].outline) == ("A", "X=taro")
+    action = records[3]
+    assert (action.subject, action.outline, action.desc, action.note) == (
+            "taro", "greet", "Hello, world.", "note")
+    assert records[4].desc == "some text"
+
+
+# Test: malformed lines
+def test_tokenize_scene_lines_errors():
+
+    records, errors = tokenize_scene_lines([
+        "[taro:t] missing outline",
+        "text",
+        "[a:b:c] x] y",
+        "#! P too many spaces",
+        ])
+
+    assert len(records) == 1
+    assert [(e.lineno, e.reason) for e in errors] == [
+            (1, 'action line'),
+            (3, 'action line'),
+            (4, 'instruction line'),
+            ]
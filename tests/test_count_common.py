@@ -0,0 +1,75 @@
+"""Test for common count module."""
+
+# Official Libraries
+import random
+
+# My Modules
+from stobu.counts.common import TextCounter, count_line_by_columns, count_white_space
+from stobu.counts.common import counts_data_from, counts_data_from_records
+from stobu.formats.common import get_format_record_as_mark, iter_translated_formatted
+from stobu.formats.common import outputs_data_from_formatted
+from stobu.types.build import BuildType
+from stobu.types.element import ElmType
+
+
+# Test: white space
+def test_count_white_space():
+
+    text = "a b\tc\n　d "
+
+    assert count_white_space(text) == sum(1 for c in text if c.isspace())
+
+
+# Test: counts of the runs equal to the joined text
+def test_text_counter_counts_of():
+
+    rnd = random.Random(0)
+    texts = [rnd.choice(["", "\n", "あ" * 30 + "\n", "い い", "う\n\nえ" * 5, "　" * 25])
+            for _ in range(60)]
+    counter = TextCounter(texts, 20)
+
+    for start in range(0, 60, 7):
+        for end in range(start, 61, 5):
+            text = ''.join(texts[start:end])
+            assert counter.counts_of(start, end) == (
+                    len(text), count_white_space(text), count_line_by_columns(text, 20))
+
+
+# Test: counts of the marked elements
+def test_counts_data_from_marks():
+
+    outputs = outputs_data_from_formatted([
+        get_format_record_as_mark(ElmType.BOOK, "$b"), "# $b\n",
+        get_format_record_as_mark(ElmType.SCENE, "s1"), "** s1 **\n",
+        "# 見出しではない\n", "<!--comment-->",
+        get_format_record_as_mark(ElmType.SCENE, "s2"), "** s2 **\n",
+        "あい\n",
+        ], {'b': "本"})
+
+    counts = [(r.type, r.title, r.total) for r in
+            counts_data_from(BuildType.NOVEL, outputs, 20, 20).get_data()]
+
+    assert counts == [
+            (ElmType.BOOK, "本", 13),
+            (ElmType.SCENE, "s1", 10),
+            (ElmType.SCENE, "s2", 3),
+            ]
+
+
+# Test: streamed counts equal to the counts of the whole outputs
+def test_counts_data_from_records():
+
+    rnd = random.Random(1)
+    formatted = []
+    for _ in range(200):
+        if rnd.random() < 0.15:
+            elm = rnd.choice([ElmType.BOOK, ElmType.CHAPTER, ElmType.EPISODE, ElmType.SCENE])
+            formatted.append(get_format_record_as_mark(elm, f"$b{len(formatted)}"))
+        formatted.append(rnd.choice(
+            ["\n", "$bの" * 12 + "\n", "い い", "う\n\nえ" * 5, "　", "<!--c-->", "\n\n"]))
+    tags = {'b': "本"}
+
+    expect = counts_data_from(BuildType.NOVEL, outputs_data_from_formatted(formatted, tags), 20, 20)
+    counts = counts_data_from_records(iter_translated_formatted(formatted, tags), 20, 20)
+
+    assert counts.get_data() == expect.get_data()
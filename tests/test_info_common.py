@@ -0,0 +1,54 @@
+"""Test for info common module."""
+
+# Official Libraries
+import pytest
+
+# My Modules
+from stobu.infos.common import collect_infos_data, InfoCollector
+from stobu.infos.fashioninfos import FashionInfoCollector
+from stobu.infos.personinfos import PersonInfoCollector
+from stobu.types.action import ActType
+from stobu.types.info import InfosData, InfoRecord, InfoType
+
+
+class _Visited(InfoCollector):
+
+    TYPES = (InfoType.TITLE_SCENE,)
+
+    ACTS = (ActType.TALK,)
+
+    def __init__(self):
+        super().__init__('VISITED')
+
+    def visit(self, record: InfoRecord) -> None:
+        self.data.append(record)
+
+
+def _action_of(act: ActType, subject: str) -> InfoRecord:
+    return InfoRecord(InfoType.ACTION, act, subject, '', '')
+
+
+# Test: collect in one pass
+def test_collect_infos_data():
+
+    scene = InfoRecord(InfoType.TITLE_SCENE, ActType.DATA, '', 'sc1', '')
+    talk = _action_of(ActType.TALK, 'taro')
+    infos = InfosData([
+        scene, talk,
+        _action_of(ActType.COME, 'taro'),
+        _action_of(ActType.WEAR, 'hana'),
+        ])
+
+    visited, persons, fashions = collect_infos_data(infos,
+            [_Visited(), PersonInfoCollector(), FashionInfoCollector()])
+
+    assert visited.get_data()[2:] == [scene, talk]
+    assert [(r.act, r.note.index) for r in persons.get_data()[2:]] == [(ActType.COME, 1)]
+    assert [(r.act, r.note.index) for r in fashions.get_data()[2:]] == [(ActType.WEAR, 1)]
+
+
+# Test: visit is abstract
+def test_info_collector_needs_visit():
+
+    with pytest.raises(TypeError):
+        InfoCollector('BASE')
@@ -0,0 +1,48 @@
+"""Test for status info module."""
+
+# Official Libraries
+import pytest
+
+# My Modules
+import stobu.tools.pathgetter as pathgetter
+from stobu.infos.statusinfomations import person_status_info_from
+from stobu.tools.projectdatacache import end_project_data_cache, start_project_data_cache
+from stobu.types.action import ActType
+from stobu.types.info import InfosData, InfoRecord, InfoType
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    persons = tmp_path / "persons"
+    persons.mkdir()
+    for name in ('ume', 'hana', 'taro'):
+        (persons / f"{name}.md").write_text(f"---\nname: {name}\ncalling:\n  me: 私\n---\n")
+    monkeypatch.setattr(pathgetter, 'PROJECT_DIR', str(tmp_path))
+    return tmp_path
+
+
+def _action_of(act: ActType, subject: str, outline: str) -> InfoRecord:
+    return InfoRecord(InfoType.ACTION, act, subject, outline, '')
+
+
+# Test: person status in order of persons
+def test_person_status_info_from(project):
+
+    infos = InfosData([
+        InfoRecord(InfoType.TITLE_SCENE, ActType.DATA, '', 'sc1', ''),
+        _action_of(ActType.FEEL, 'hana', 'h1'),
+        _action_of(ActType.WEAR, 'taro', 't1'),
+        _action_of(ActType.TALK, 'taro', 'talk'),
+        InfoRecord(InfoType.TITLE_SCENE, ActType.DATA, '', 'sc2', ''),
+        _action_of(ActType.KNOW, 'taro', 't2'),
+        _action_of(ActType.FACE, 'jiro', 'j1'),
+        ])
+
+    start_project_data_cache()
+    try:
+        data = person_status_info_from(infos).get_data()
+    finally:
+        end_project_data_cache()
+
+    outlines = [(record.note.index, record.outline) for record in data[2:]]
+    assert outlines == [(0, ''), (1, 'h1'), (0, ''), (1, 't1'), (2, 't2'), (0, '')]
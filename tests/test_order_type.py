@@ -0,0 +1,51 @@
+"""Test for order index type module."""
+
+# Official Libraries
+
+
+# My Modules
+from stobu.elms.orders import OrderItem
+from stobu.types.order import OrderIndex
+
+
+# Define Constants
+ORDER_DATA = {'book': [
+    {'chapter/c0': [
+        {'episode/e0': ['scene/s0', 'scene/s1']},
+        {'episode/e1': ['scene/s2']},
+        ]},
+    {'chapter/c1': None},
+    ]}
+
+
+# Test: lookups
+def test_order_index_lookups():
+
+    index = OrderIndex(ORDER_DATA)
+
+    assert index.has('scene/s1')
+    assert not index.has('scene/s9')
+    assert index.parent_of('scene/s2') == 'episode/e1'
+    assert index.position_of('scene/s1') == 1
+    assert index.insertion_point_of('episode/e0') == 2
+    assert index.names_of(OrderItem.SCENE) == ['scene/s0', 'scene/s1', 'scene/s2']
+    assert index.names_of(OrderItem.CHAPTER) == ['chapter/c0', 'chapter/c1']
+
+
+# Test: add and remove
+def test_order_index_update():
+
+    index = OrderIndex(ORDER_DATA)
+
+    assert index.add('chapter/c1', 'episode/e2')
+    assert index.add('episode/e2', 'scene/s3')
+    assert not index.add('episode/e9', 'scene/s4')
+    assert index.remove('scene/s0')
+    assert index.position_of('scene/s1') == 0
+    assert index.parent_of('scene/s2') == 'episode/e1'
+    assert index.remove('chapter/c0')
+    assert not index.has('scene/s2')
+
+    assert index.to_data() == {'book': [
+        {'chapter/c1': [{'episode/e2': ['scene/s3']}]},
+        ]}
@@ -0,0 +1,48 @@
+"""Test for output data type module."""
+
+# Official Libraries
+
+
+# My Modules
+from stobu.types.element import ElmType
+from stobu.types.output import OutputMark, OutputsData
+
+
+# Test: join without copying
+def test_outputs_data_add():
+
+    contents = OutputsData(["# 目次\n", "\n"])
+    novel = OutputsData(["本文\n"])
+    plot = OutputsData(["筋\n", ""])
+
+    joined = contents + novel
+    another = contents + plot
+
+    assert contents.get_data() == ["# 目次\n", "\n"]
+    assert joined.get_data() == ["# 目次\n", "\n", "本文\n"]
+    assert another.get_serialized_data() == "# 目次\n\n筋\n"
+    assert joined.segments[0] is another.segments[0] is contents.get_data()
+    assert list(joined.iter_data()) == joined.get_data()
+
+
+# Test: empty data
+def test_outputs_data_empty():
+
+    empty = OutputsData([]) + OutputsData([])
+
+    assert not empty.has_data()
+    assert empty.get_data() == []
+    assert (empty + OutputsData(["a"])).get_data() == ["a"]
+
+
+# Test: marks after join
+def test_outputs_data_marks():
+
+    contents = OutputsData(["a\n", "b\n"])
+    novel = OutputsData.marked(["# t\n", "c\n"], [OutputMark(ElmType.BOOK, "t", 0)])
+
+    joined = contents + novel
+
+    assert novel.get_marks() == (OutputMark(ElmType.BOOK, "t", 0),)
+    assert joined.get_marks() == (OutputMark(ElmType.BOOK, "t", 2),)
+    assert contents.get_marks() == ()
@@ -0,0 +1,43 @@
+"""Test for build cache module."""
+
+# Official Libraries
+
+
+# My Modules
+from stobu.tools.buildcache import BuildCache
+
+
+# Test: read data
+def test_build_cache_read_data(tmp_path):
+
+    path = tmp_path / "a.yml"
+    path.write_text("a: 1")
+    cache = BuildCache()
+    calls = []
+
+    def _parser(raw: str) -> dict:
+        calls.append(raw)
+        return {'raw': raw}
+
+    assert cache.read_data(str(path), _parser) == {'raw': "a: 1"}
+    assert cache.read_data(str(path), _parser) == {'raw': "a: 1"}
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    path.write_text("a: 2")
+
+    assert cache.read_data(str(path), _parser) == {'raw': "a: 2"}
+    assert len(calls) == 2
+
+
+# Test: action records
+def test_build_cache_action_records_of(tmp_path):
+
+    path = tmp_path / "s.md"
+    path.write_text("text")
+    cache = BuildCache()
+    cache.read_data(str(path), lambda raw: raw)
+
+    assert cache.action_records_of(str(path), ('a',), lambda: ([1, 2], ['e1'])) == ([1, 2], ['e1'])
+    assert cache.action_records_of(str(path), ('a',), lambda: ([3], [])) == ([1, 2], ['e1'])
+    assert cache.action_records_of(str(path), ('b',), lambda: ([3], [])) == ([3], [])
@@ -0,0 +1,34 @@
+"""Test for project data cache module."""
+
+# Official Libraries
+
+
+# My Modules
+from stobu.tools.projectdatacache import end_project_data_cache, start_project_data_cache
+from stobu.tools.projectdatacache import read_elm_data_with_cache, value_with_cache
+
+
+# Test: read elm data
+def test_read_elm_data_with_cache(tmp_path):
+
+    path = tmp_path / "p.md"
+    path.write_text("a")
+    calls = []
+
+    def _parser(raw: str) -> dict:
+        calls.append(raw)
+        return {'raw': raw}
+
+    cache = start_project_data_cache()
+    try:
+        assert read_elm_data_with_cache(str(path), _parser) == {'raw': "a"}
+        assert read_elm_data_with_cache(str(path), _parser) == {'raw': "a"}
+        assert value_with_cache('x', lambda: [1]) is value_with_cache('x', lambda: [2])
+    finally:
+        end_project_data_cache()
+
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    read_elm_data_with_cache(str(path), _parser)
+    assert len(calls) == 2
@@ -0,0 +1,50 @@
+"""Test for translate tag module."""
+
+# Official Libraries
+import pytest
+
+# My Modules
+from stobu.tools.translater import TagTranslator
+from stobu.tools.translater import translate_tags_str, translate_tags_text_list
+from stobu.utils.dicts import dict_sorted
+
+
+TAGS = dict_sorted({'taro': '太郎', 'taro1': '太郎１', 'hana': '花子'}, True)
+
+
+# Test: translate tags str
+@pytest.mark.parametrize("text, is_fullmatch, prefix, expect",
+        [("$taroと$hana", False, '$', "太郎と花子"),
+         ("$taro1と$taro", False, '$', "太郎１と太郎"),
+         ("$taro10", False, '$', "太郎１0"),
+         ("taro", False, '$', "taro"),
+         ("taro", True, None, "太郎"),
+         ("taro1", True, None, "太郎１"),
+         ("taroと", True, None, "taroと"),
+         ])
+def test_translate_tags_str(text, is_fullmatch, prefix, expect):
+
+    assert translate_tags_str(text, TAGS, is_fullmatch, prefix) == expect
+
+
+# Test: translate tags text list
+def test_translate_tags_text_list():
+
+    translator = TagTranslator(TAGS)
+    data = ["$taro\n", "$hana$taro1\n", "none\n"]
+    expect = ["太郎\n", "花子太郎１\n", "none\n"]
+
+    assert translate_tags_text_list(data, TAGS) == expect
+    assert translate_tags_text_list(data, translator) == expect
+
+
+# Test: tags changed in place
+def test_translate_tags_str_after_update():
+
+    tags = {'taro': '太郎'}
+
+    assert translate_tags_str("$taroと$hana", tags) == "太郎と$hana"
+
+    tags['hana'] = '花子'
+
+    assert translate_tags_str("$taroと$hana", tags) == "太郎と花子"
@@ -0,0 +1,27 @@
+"""Test for date and time utility module."""
+
+# Official Libraries
+import pytest
+
+# My Modules
+from stobu.utils.datetimes import after_day_str_from, next_day_str_from, next_month_str_from
+
+
+# Test: after day
+@pytest.mark.parametrize("year, mon, day, aftermon, afterday, expect", [
+    ('2021', '4', '1', 0, 7, "4/8"),
+    ('2021', '12', '31', 0, 1, "1/1"),
+    ('2021', '1', '31', 1, 0, "2/28"),
+    ('2020', '1', '31', 1, 0, "2/29"),
+    ('2021', '11', '30', 3, 1, "3/1"),
+    ])
+def test_after_day_str_from(year, mon, day, aftermon, afterday, expect):
+
+    assert after_day_str_from(year, mon, day, aftermon, afterday) == expect
+
+
+# Test: next day and month
+def test_next_day_and_month():
+
+    assert next_day_str_from('2000', '2', '28') == "2/29"
+    assert next_month_str_from('1900', '1', '29') == "2/28"
@@ -0,0 +1,33 @@
+"""Test for file IO utility module."""
+
+# Official Libraries
+import os
+import pytest
+
+# My Modules
+from stobu.utils.fileio import OutputSink, read_file, write_lines_to_file
+
+
+# Test: write lines to file
+def test_write_lines_to_file(tmp_path):
+
+    path = str(tmp_path / "out.md")
+
+    assert write_lines_to_file(path, (f"{i}\n" for i in range(3)))
+    assert read_file(path) == "0\n1\n2\n"
+    assert os.listdir(str(tmp_path)) == ["out.md"]
+
+
+# Test: output sink keeps the old file on error
+def test_output_sink_on_error(tmp_path):
+
+    path = str(tmp_path / "out.md")
+    write_lines_to_file(path, ["old\n"])
+
+    with pytest.raises(ValueError):
+        with OutputSink(path) as sink:
+            sink.write("new\n")
+            raise ValueError("stop")
+
+    assert read_file(path) == "old\n"
+    assert os.listdir(str(tmp_path)) == ["out.md"]
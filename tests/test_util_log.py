@@ -0,0 +1,41 @@
+"""Test for logger utility module."""
+
+# Official Libraries
+import logging
+
+# My Modules
+from stobu.utils.log import LazyMessage, logger
+
+
+# Test: lazy message
+def test_lazy_message_not_formatted_when_disabled(monkeypatch):
+
+    called = []
+    monkeypatch.setattr(LazyMessage, '__str__', lambda self: called.append(self) or "")
+
+    level = logger.logger.level
+    logger.setLevel(logging.INFO)
+    try:
+        logger.debug("> Starting {proc} ...", proc="TEST")
+    finally:
+        logger.setLevel(level)
+
+    assert not called
+
+
+# Test: process keywords
+def test_lazy_logger_process():
+
+    message, kwargs = logger.process("{proc}: %s", {'proc': "TEST", 'exc_info': True})
+
+    assert str(message) == "TEST: %s"
+    assert kwargs == {'exc_info': True}
+
+
+# Test: keywords and positional args
+def test_lazy_logger_with_args(caplog):
+
+    with caplog.at_level(logging.WARNING, logger=logger.logger.name):
+        logger.warning("! Invalid {data}: %s", "arg", data="TEST")
+
+    assert caplog.records[-1].getMessage() == "! Invalid TEST: arg"